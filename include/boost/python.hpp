@@ -13,6 +13,8 @@
 # include <boost/python/back_reference.hpp>
 # include <boost/python/bases.hpp>
 # include <boost/python/borrowed.hpp>
+# include <boost/python/buffer_protocol.hpp>
+# include <boost/python/buffer_view.hpp>
 # include <boost/python/call.hpp>
 # include <boost/python/call_method.hpp>
 # include <boost/python/class.hpp>
@@ -52,11 +54,14 @@
 # include <boost/python/overloads.hpp>
 # include <boost/python/pointee.hpp>
 # include <boost/python/pure_virtual.hpp>
+# include <boost/python/python_callback.hpp>
 # include <boost/python/ptr.hpp>
 # include <boost/python/raw_function.hpp>
 # include <boost/python/reference_existing_object.hpp>
 # include <boost/python/register_ptr_to_python.hpp>
+# include <boost/python/release_gil.hpp>
 # include <boost/python/return_arg.hpp>
+# include <boost/python/return_awaitable.hpp>
 # include <boost/python/return_internal_reference.hpp>
 # include <boost/python/return_opaque_pointer.hpp>
 # include <boost/python/return_value_policy.hpp>
@@ -71,6 +76,7 @@
 # include <boost/python/to_python_value.hpp>
 # include <boost/python/tuple.hpp>
 # include <boost/python/type_id.hpp>
+# include <boost/python/vectorize.hpp>
 # include <boost/python/with_custodian_and_ward.hpp>
 
 #endif // PYTHON_DWA2002810_HPP
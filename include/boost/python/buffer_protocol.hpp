@@ -0,0 +1,219 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef BUFFER_PROTOCOL_AGENT20261017_HPP
+# define BUFFER_PROTOCOL_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+# include <boost/python/def_visitor.hpp>
+# include <boost/python/buffer_view.hpp>
+# include <boost/python/extract.hpp>
+# include <boost/python/object_core.hpp>
+# include <boost/python/ssize_t.hpp>
+# include <boost/range/begin.hpp>
+# include <boost/range/const_iterator.hpp>
+# include <boost/range/end.hpp>
+# include <boost/type_traits/is_arithmetic.hpp>
+# include <boost/type_traits/is_const.hpp>
+# include <boost/type_traits/remove_const.hpp>
+# include <boost/mpl/bool.hpp>
+# include <vector>
+
+# if PY_VERSION_HEX >= 0x02060000
+
+namespace boost { namespace python {
+
+namespace objects
+{
+  // Describes the buffer of the C++ object held by an instance of a
+  // wrapped class.
+  struct BOOST_PYTHON_DECL buffer_exporter
+  {
+      virtual ~buffer_exporter();
+
+      // Fills in *view as PyObject_GetBuffer(self, view, flags) should,
+      // returning 0, or raises a Python exception and returns -1.
+      virtual int get_buffer(PyObject* self, Py_buffer* view, int flags) const = 0;
+
+      // Called when a buffer filled in by get_buffer() is released,
+      // before its shape and strides are freed. Must not throw.
+      virtual void release_buffer(PyObject* self, Py_buffer* view) const;
+  };
+
+  // Makes instances of the extension class cls, and of its Python
+  // subclasses, export buffers described by exporter, which the class
+  // takes ownership of.
+  BOOST_PYTHON_DECL void add_buffer_exporter(object const& cls, buffer_exporter* exporter);
+
+  // Fills in *view for a buffer of elements with the given format and
+  // size starting at data, keeping self alive until the buffer is
+  // released. If strides is empty, the elements are in C order.
+  // Returns 0, or raises BufferError and returns -1 if the buffer
+  // can't be exported as the flags require.
+  BOOST_PYTHON_DECL int fill_buffer(
+      PyObject* self, Py_buffer* view, int flags
+    , void* data, bool readonly, char const* format, ssize_t itemsize
+    , std::vector<ssize_t> const& shape, std::vector<ssize_t> const& strides);
+}
+
+namespace detail
+{
+  // Stands for the strides of an array whose elements are in C order
+  struct c_order_strides {};
+
+  // Read a property of x through a pointer to a member function or
+  // data member.
+  template <class X, class C, class R>
+  R get_buffer_property(X& x, R (C::*f)())
+  {
+      return (x.*f)();
+  }
+
+  template <class X, class C, class R>
+  R get_buffer_property(X& x, R (C::*f)() const)
+  {
+      return (x.*f)();
+  }
+
+  template <class X, class C, class R>
+  R const& get_buffer_property(X& x, R C::*m)
+  {
+      return x.*m;
+  }
+
+  // Append a single extent, or a sequence of them, to extents
+  template <class R>
+  void append_extents(std::vector<ssize_t>& extents, R const& r, mpl::true_)
+  {
+      extents.push_back(static_cast<ssize_t>(r));
+  }
+
+  template <class R>
+  void append_extents(std::vector<ssize_t>& extents, R const& r, mpl::false_)
+  {
+      for (typename range_const_iterator<R>::type p = boost::begin(r); p != boost::end(r); ++p)
+          extents.push_back(static_cast<ssize_t>(*p));
+  }
+
+  template <class R>
+  void append_extents(std::vector<ssize_t>& extents, R const& r)
+  {
+      append_extents(extents, r, mpl::bool_<is_arithmetic<R>::value>());
+  }
+
+  template <class X, class Strides>
+  void get_strides(X& x, std::vector<ssize_t>& strides, Strides const& s)
+  {
+      append_extents(strides, get_buffer_property(x, s));
+  }
+
+  template <class X>
+  void get_strides(X&, std::vector<ssize_t>&, c_order_strides)
+  {
+  }
+
+  template <class W, class Element, class Data, class Shape, class Strides>
+  struct buffer_exporter_impl : objects::buffer_exporter
+  {
+      buffer_exporter_impl(Data data, Shape shape, Strides strides)
+          : m_data(data), m_shape(shape), m_strides(strides)
+      {}
+
+      int get_buffer(PyObject* self, Py_buffer* view, int flags) const
+      {
+          W& x = extract<W&>(self);
+
+          std::vector<ssize_t> shape, strides;
+          append_extents(shape, get_buffer_property(x, m_shape));
+          get_strides(x, strides, m_strides);
+
+          typedef typename remove_const<Element>::type element;
+          Element* elements = get_buffer_property(x, m_data);
+
+          return objects::fill_buffer(
+              self, view, flags
+            , const_cast<element*>(elements)
+            , is_const<Element>::value
+            , converter::buffer_element<element>::format()
+            , sizeof(element)
+            , shape, strides);
+      }
+
+   private:
+      Data m_data;
+      Shape m_shape;
+      Strides m_strides;
+  };
+
+  template <class Element, class Data, class Shape, class Strides>
+  class buffer_protocol_visitor
+      : public def_visitor<buffer_protocol_visitor<Element,Data,Shape,Strides> >
+  {
+   public:
+      buffer_protocol_visitor(Data data, Shape shape, Strides strides)
+          : m_data(data), m_shape(shape), m_strides(strides)
+      {}
+
+   private:
+      friend class python::def_visitor_access;
+
+      template <class classT>
+      void visit(classT& c) const
+      {
+          typedef typename classT::wrapped_type wrapped_type;
+          objects::add_buffer_exporter(
+              c
+            , new buffer_exporter_impl<wrapped_type,Element,Data,Shape,Strides>(
+                  m_data, m_shape, m_strides));
+      }
+
+      Data m_data;
+      Shape m_shape;
+      Strides m_strides;
+  };
+}
+
+// Makes instances of a wrapped class export the array of elements
+// returned by data, of the extent(s) returned by shape, through the
+// buffer protocol. The optional strides give the distance in bytes
+// between consecutive elements along each dimension; without them,
+// the elements are in C order. data, shape and strides may be
+// pointers to member functions or data members.
+template <class C, class E, class Shape>
+detail::buffer_protocol_visitor<E, E* (C::*)(), Shape, detail::c_order_strides>
+buffer_protocol(E* (C::*data)(), Shape shape)
+{
+    return detail::buffer_protocol_visitor<E, E* (C::*)(), Shape, detail::c_order_strides>(
+        data, shape, detail::c_order_strides());
+}
+
+template <class C, class E, class Shape>
+detail::buffer_protocol_visitor<E, E* (C::*)() const, Shape, detail::c_order_strides>
+buffer_protocol(E* (C::*data)() const, Shape shape)
+{
+    return detail::buffer_protocol_visitor<E, E* (C::*)() const, Shape, detail::c_order_strides>(
+        data, shape, detail::c_order_strides());
+}
+
+template <class C, class E, class Shape, class Strides>
+detail::buffer_protocol_visitor<E, E* (C::*)(), Shape, Strides>
+buffer_protocol(E* (C::*data)(), Shape shape, Strides strides)
+{
+    return detail::buffer_protocol_visitor<E, E* (C::*)(), Shape, Strides>(
+        data, shape, strides);
+}
+
+template <class C, class E, class Shape, class Strides>
+detail::buffer_protocol_visitor<E, E* (C::*)() const, Shape, Strides>
+buffer_protocol(E* (C::*data)() const, Shape shape, Strides strides)
+{
+    return detail::buffer_protocol_visitor<E, E* (C::*)() const, Shape, Strides>(
+        data, shape, strides);
+}
+
+}} // namespace boost::python
+
+# endif // PY_VERSION_HEX >= 0x02060000
+
+#endif // BUFFER_PROTOCOL_AGENT20261017_HPP
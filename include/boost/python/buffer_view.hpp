@@ -0,0 +1,151 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef BUFFER_VIEW_AGENT20261017_HPP
+# define BUFFER_VIEW_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+# include <boost/python/handle.hpp>
+# include <boost/range/iterator_range.hpp>
+# include <boost/config.hpp>
+# include <boost/mpl/bool.hpp>
+# include <complex>
+# include <cstddef>
+
+namespace boost { namespace python {
+
+namespace converter
+{
+  // The kinds of element which may be viewed in a buffer, as
+  // described by the buffer's struct module format string.
+  enum buffer_element_kind
+  {
+      buffer_signed         // b h i l q n
+    , buffer_unsigned       // B H I L Q N
+    , buffer_floating       // e f d g
+    , buffer_complex        // Zf Zd Zg
+    , buffer_bool           // ?
+    , buffer_character      // c b B
+  };
+
+  // buffer_element<T>::kind is the kind of buffer element which may
+  // be viewed as a T, and format() the struct module format of a T.
+  // It is undefined for types which can't be viewed.
+  template <class T> struct buffer_element;
+
+  template <class T> struct buffer_element<T const> : buffer_element<T> {};
+
+  // has_buffer_element<T>::value is true iff buffer_element<T> is
+  // defined.
+  template <class T> struct has_buffer_element : mpl::false_ {};
+
+  template <class T> struct has_buffer_element<T const> : has_buffer_element<T> {};
+
+# define BOOST_PYTHON_BUFFER_ELEMENT(T, k, f)               \
+  template <> struct buffer_element<T>                      \
+  {                                                         \
+      BOOST_STATIC_CONSTANT(buffer_element_kind, kind = k); \
+      static char const* format() { return f; }             \
+  };                                                        \
+  template <> struct has_buffer_element<T> : mpl::true_ {};
+
+  BOOST_PYTHON_BUFFER_ELEMENT(bool, buffer_bool, "?")
+  BOOST_PYTHON_BUFFER_ELEMENT(char, buffer_character, "c")
+  BOOST_PYTHON_BUFFER_ELEMENT(signed char, buffer_signed, "b")
+  BOOST_PYTHON_BUFFER_ELEMENT(unsigned char, buffer_unsigned, "B")
+  BOOST_PYTHON_BUFFER_ELEMENT(short, buffer_signed, "h")
+  BOOST_PYTHON_BUFFER_ELEMENT(unsigned short, buffer_unsigned, "H")
+  BOOST_PYTHON_BUFFER_ELEMENT(int, buffer_signed, "i")
+  BOOST_PYTHON_BUFFER_ELEMENT(unsigned int, buffer_unsigned, "I")
+  BOOST_PYTHON_BUFFER_ELEMENT(long, buffer_signed, "l")
+  BOOST_PYTHON_BUFFER_ELEMENT(unsigned long, buffer_unsigned, "L")
+# ifdef HAVE_LONG_LONG
+  BOOST_PYTHON_BUFFER_ELEMENT(signed BOOST_PYTHON_LONG_LONG, buffer_signed, "q")
+  BOOST_PYTHON_BUFFER_ELEMENT(unsigned BOOST_PYTHON_LONG_LONG, buffer_unsigned, "Q")
+# endif
+  BOOST_PYTHON_BUFFER_ELEMENT(float, buffer_floating, "f")
+  BOOST_PYTHON_BUFFER_ELEMENT(double, buffer_floating, "d")
+  BOOST_PYTHON_BUFFER_ELEMENT(long double, buffer_floating, "g")
+  BOOST_PYTHON_BUFFER_ELEMENT(std::complex<float>, buffer_complex, "Zf")
+  BOOST_PYTHON_BUFFER_ELEMENT(std::complex<double>, buffer_complex, "Zd")
+  BOOST_PYTHON_BUFFER_ELEMENT(std::complex<long double>, buffer_complex, "Zg")
+
+# undef BOOST_PYTHON_BUFFER_ELEMENT
+
+  // Returns true iff the elements of a buffer with the given format
+  // string and item size may be viewed in place as elements of the
+  // given kind and size.
+  BOOST_PYTHON_DECL bool buffer_format_matches(
+      char const* format, std::size_t itemsize
+      , buffer_element_kind kind, std::size_t element_size);
+
+# if PY_VERSION_HEX >= 0x02070000
+  // Returns true iff obj exports a C-contiguous buffer of elements of
+  // the given kind and size, which is writable if writable is true.
+  BOOST_PYTHON_DECL bool is_contiguous_buffer(
+      PyObject* obj, buffer_element_kind kind, std::size_t element_size, bool writable);
+
+  // If obj exports a buffer accepted by is_contiguous_buffer, returns
+  // a memoryview which holds it, and stores the address of its first
+  // element in *data and its number of elements in *size. Otherwise,
+  // raises a Python exception and returns a null handle.
+  BOOST_PYTHON_DECL handle<> get_contiguous_buffer(
+      PyObject* obj, buffer_element_kind kind, std::size_t element_size, bool writable
+      , void** data, std::size_t* size);
+# endif
+}
+
+// A view of the elements of a contiguous buffer exported by a Python
+// object, such as bytes, array.array or a NumPy array, which is
+// converted from Python without copying the elements. The buffer is
+// held until the last copy of the view is destroyed. A buffer_view<T
+// const> may view read-only buffers; a buffer_view<T> only writable
+// ones.
+template <class T>
+class buffer_view
+{
+ public:
+    typedef T value_type;
+    typedef T* pointer;
+    typedef T& reference;
+    typedef T* iterator;
+    typedef T* const_iterator;
+    typedef std::size_t size_type;
+
+    buffer_view()
+        : m_data(0), m_size(0)
+    {}
+
+    // Views size elements starting at data, in a buffer held by owner
+    buffer_view(handle<> const& owner, T* data, size_type size)
+        : m_owner(owner), m_data(data), m_size(size)
+    {}
+
+    pointer data() const { return m_data; }
+    size_type size() const { return m_size; }
+    bool empty() const { return m_size == 0; }
+
+    iterator begin() const { return m_data; }
+    iterator end() const { return m_data + m_size; }
+
+    reference operator[](size_type i) const { return m_data[i]; }
+
+    iterator_range<T*> range() const
+    {
+        return iterator_range<T*>(begin(), end());
+    }
+
+    // The memoryview which holds the buffer; null for a
+    // default-constructed view.
+    handle<> const& owner() const { return m_owner; }
+
+ private:
+    handle<> m_owner;
+    T* m_data;
+    size_type m_size;
+};
+
+}} // namespace boost::python
+
+#endif // BUFFER_VIEW_AGENT20261017_HPP
@@ -362,6 +362,12 @@ class class_ : public objects::class_base
         this->make_method_static(name);
         return *this;
     }
+
+    self& enable_freelist(std::size_t max_size)
+    {
+        this->set_freelist_size(max_size);
+        return *this;
+    }
  private: // helper functions
 
     // Builds a method for this class around the given [member]
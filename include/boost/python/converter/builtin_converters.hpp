@@ -183,6 +183,10 @@ namespace converter
 
   void initialize_builtin_converters();
 
+  // Registers the from_python converters to buffer_view<T>; called by
+  // initialize_builtin_converters().
+  void initialize_buffer_converters();
+
 }
 
 }} // namespace boost::python::converter
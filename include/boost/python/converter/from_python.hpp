@@ -22,6 +22,15 @@ BOOST_PYTHON_DECL bool implicit_rvalue_convertible_from_python(
 BOOST_PYTHON_DECL rvalue_from_python_stage1_data rvalue_from_python_stage1(
     PyObject* source, registration const&);
 
+// The number of conversions from Python which have failed, in the
+// calling thread, in a way which may depend on the value of the source
+// object: after a converter which is not type_determined refused it,
+// or when it is an extension class instance which might have held an
+// object of the target class. The result of a failed conversion
+// depends only on the type of the source object while this count
+// stays unchanged.
+BOOST_PYTHON_DECL unsigned long value_refusal_count();
+
 BOOST_PYTHON_DECL void* rvalue_from_python_stage2(
     PyObject* source, rvalue_from_python_stage1_data&, registration const&);
 
@@ -29,6 +29,10 @@ struct rvalue_from_python_chain
     constructor_function construct;
     PyTypeObject const* (*expected_pytype)();
     rvalue_from_python_chain* next;
+
+    // True iff whether convertible() accepts an object depends only on
+    // the object's type
+    bool type_determined;
 };
 
 struct BOOST_PYTHON_DECL registration
@@ -70,6 +74,21 @@ struct BOOST_PYTHON_DECL registration
     // from_python handling.
     const bool is_shared_ptr;
 
+    // Remembers, for recently converted Python types, the first entry
+    // of rvalue_chain which might accept an object of that type. The
+    // entries before it are type_determined and refuse it. A null
+    // chain means no entry accepts it.
+    struct rvalue_chain_cache_entry
+    {
+        PyTypeObject* source_type;
+        unsigned int version_tag;
+        rvalue_from_python_chain const* chain;
+    };
+    BOOST_STATIC_CONSTANT(unsigned, rvalue_chain_cache_size = 4);
+    
+    mutable rvalue_chain_cache_entry m_rvalue_chain_cache[rvalue_chain_cache_size];
+    mutable unsigned m_rvalue_chain_cache_next;
+
 # if BOOST_WORKAROUND(__MWERKS__, BOOST_TESTED_AT(0x3003))
  private:
     void operator=(registration); // This is not defined, and just keeps MWCW happy.
@@ -87,7 +106,11 @@ inline registration::registration(type_info target_type, bool is_shared_ptr)
       , m_to_python(0)
       , m_to_python_target_type(0)
       , is_shared_ptr(is_shared_ptr)
-{}
+      , m_rvalue_chain_cache_next(0)
+{
+    for (unsigned i = 0; i < rvalue_chain_cache_size; ++i)
+        m_rvalue_chain_cache[i].source_type = 0;
+}
 
 inline bool operator<(registration const& lhs, registration const& rhs)
 {
@@ -5,6 +5,7 @@
 #ifndef REGISTRY_DWA20011127_HPP
 # define REGISTRY_DWA20011127_HPP
 # include <boost/python/type_id.hpp>
+# include <boost/python/object_fwd.hpp>
 # include <boost/python/converter/to_python_function_type.hpp>
 # include <boost/python/converter/rvalue_from_python_data.hpp>
 # include <boost/python/converter/constructor_function.hpp>
@@ -32,12 +33,16 @@ namespace registry
   // Insert an lvalue from_python converter
   BOOST_PYTHON_DECL void insert(convertible_function, type_info, PyTypeObject const* (*expected_pytype)() = 0);
 
-  // Insert an rvalue from_python converter
+  // Insert an rvalue from_python converter. If type_determined is
+  // true, whether the convertible function accepts an object must
+  // depend only on the object's type, which allows its answer to be
+  // cached.
   BOOST_PYTHON_DECL void insert(
       convertible_function
       , constructor_function
       , type_info
       , PyTypeObject const* (*expected_pytype)()  = 0
+      , bool type_determined = false
       );
   
   // Insert an rvalue from_python converter at the tail of the
@@ -47,7 +52,15 @@ namespace registry
       , constructor_function
       , type_info
       , PyTypeObject const* (*expected_pytype)()  = 0
+      , bool type_determined = false
       );
+
+  // Return a dict describing the registry: the number of entries,
+  // hash buckets and the longest chain of entries sharing a bucket,
+  // plus the number of lookups, misses, and insertions into occupied
+  // buckets if the library was built with
+  // BOOST_PYTHON_REGISTRY_STATISTICS. Suitable for use with def().
+  BOOST_PYTHON_DECL object statistics();
 }
 
 }}} // namespace boost::python::converter
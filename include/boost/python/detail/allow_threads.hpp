@@ -0,0 +1,36 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef ALLOW_THREADS_AGENT20261017_HPP
+# define ALLOW_THREADS_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+# include <boost/noncopyable.hpp>
+
+namespace boost { namespace python { namespace detail { 
+
+// Releases the GIL, which the calling thread must hold, for the
+// lifetime of the object if enabled is true, as Py_BEGIN_ALLOW_THREADS
+// and Py_END_ALLOW_THREADS do, so that it is reacquired even if an
+// exception is thrown. No Python API may be used meanwhile.
+class allow_threads : boost::noncopyable
+{
+ public:
+    explicit allow_threads(bool enabled = true)
+        : m_state(enabled ? PyEval_SaveThread() : 0)
+    {}
+
+    ~allow_threads()
+    {
+        if (m_state)
+            PyEval_RestoreThread(m_state);
+    }
+
+ private:
+    PyThreadState* m_state;
+};
+
+}}} // namespace boost::python::detail
+
+#endif // ALLOW_THREADS_AGENT20261017_HPP
@@ -216,7 +216,7 @@ struct caller_arity<N>
                 return 0;
 
             PyObject* result = detail::invoke(
-                detail::invoke_tag<result_t,F>()
+                typename detail::invoke_tag_for<result_t,F,Policies>::type()
               , create_result_converter(args_, (result_converter*)0, (result_converter*)0)
               , m_data.first()
                 BOOST_PP_ENUM_TRAILING_PARAMS(N, c)
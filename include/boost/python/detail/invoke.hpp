@@ -10,14 +10,18 @@
 #  include <boost/python/detail/prefix.hpp>
 #  include <boost/python/detail/preprocessor.hpp>
 #  include <boost/python/detail/none.hpp>
+#  include <boost/python/detail/allow_threads.hpp>
 
 #  include <boost/type_traits/is_member_function_pointer.hpp>
+#  include <boost/mpl/has_xxx.hpp>
+#  include <boost/mpl/if.hpp>
 
 #  include <boost/preprocessor/iterate.hpp>
 #  include <boost/preprocessor/facilities/intercept.hpp>
 #  include <boost/preprocessor/repetition/enum_trailing_params.hpp>
 #  include <boost/preprocessor/repetition/enum_trailing_binary_params.hpp>
 #  include <boost/preprocessor/repetition/enum_binary_params.hpp>
+#  include <boost/preprocessor/repetition/enum_params.hpp>
 #  include <boost/python/to_python_value.hpp>
 
 // This file declares a series of overloaded invoke(...)  functions,
@@ -26,7 +30,9 @@
 //
 //   - a tag which identifies the invocation syntax (e.g. member
 //   functions must be invoked with a different syntax from regular
-//   functions)
+//   functions). Tags produced by invoke_without_gil_tag also carry
+//   the C++ result type; their overloads convert every argument
+//   before releasing the GIL around the call itself.
 //
 //   - a pointer to a result converter type, used solely as a way of
 //   transmitting the type of the result converter to the function (or
@@ -58,6 +64,35 @@ struct invoke_tag
 {
 };
 
+template <class R, bool void_return, bool member>
+struct invoke_without_gil_tag_ {};
+
+// As invoke_tag, for calls made without the GIL.
+template <class R, class F>
+struct invoke_without_gil_tag
+  : invoke_without_gil_tag_<
+        R
+      , is_same<R,void>::value
+      , is_member_function_pointer<F>::value
+    >
+{
+};
+
+BOOST_MPL_HAS_XXX_TRAIT_DEF(releases_gil)
+
+// Selects the tag for invoking F with the given CallPolicies: calls
+// are made without the GIL if the policies (e.g. release_gil<>)
+// declare a nested releases_gil type.
+template <class R, class F, class Policies>
+struct invoke_tag_for
+  : mpl::if_<
+        has_releases_gil<Policies>
+      , invoke_without_gil_tag<R,F>
+      , invoke_tag<R,F>
+    >
+{
+};
+
 #  define BOOST_PP_ITERATION_PARAMS_1                                            \
         (3, (0, BOOST_PYTHON_MAX_ARITY, <boost/python/detail/invoke.hpp>))
 #  include BOOST_PP_ITERATE()
@@ -95,6 +130,56 @@ inline PyObject* invoke(invoke_tag_<true,true>, RC const&, F& f, TC& tc BOOST_PP
     return none();
 }
 
+// The arguments of call_without_gil and call_member_without_gil are
+// the results of the argument converters, so they are all converted
+// before the GIL is released. The result is constructed before the
+// GIL is reacquired, but converted to Python afterwards.
+template <class R, class F BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, class A)>
+inline R call_without_gil(F& f BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, A, a))
+{
+    allow_threads unlocked;
+    return f( BOOST_PP_ENUM_PARAMS_Z(1, N, a) );
+}
+
+template <class R, class F, class T BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, class A)>
+inline R call_member_without_gil(F& f, T t BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, A, a))
+{
+    allow_threads unlocked;
+    return (t.*f)( BOOST_PP_ENUM_PARAMS_Z(1, N, a) );
+}
+
+template <class R, class RC, class F BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, class AC)>
+inline PyObject* invoke(invoke_without_gil_tag_<R,false,false>, RC const& rc, F& f BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, AC, & ac) )
+{
+    return rc(
+        call_without_gil<R, F BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, typename AC, ::result_type BOOST_PP_INTERCEPT)>(
+            f BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, ac, () BOOST_PP_INTERCEPT)));
+}
+
+template <class R, class RC, class F BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, class AC)>
+inline PyObject* invoke(invoke_without_gil_tag_<R,true,false>, RC const&, F& f BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, AC, & ac) )
+{
+    call_without_gil<R, F BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, typename AC, ::result_type BOOST_PP_INTERCEPT)>(
+        f BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, ac, () BOOST_PP_INTERCEPT));
+    return none();
+}
+
+template <class R, class RC, class F, class TC BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, class AC)>
+inline PyObject* invoke(invoke_without_gil_tag_<R,false,true>, RC const& rc, F& f, TC& tc BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, AC, & ac) )
+{
+    return rc(
+        call_member_without_gil<R, F, typename TC::result_type BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, typename AC, ::result_type BOOST_PP_INTERCEPT)>(
+            f, tc() BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, ac, () BOOST_PP_INTERCEPT)));
+}
+
+template <class R, class RC, class F, class TC BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, class AC)>
+inline PyObject* invoke(invoke_without_gil_tag_<R,true,true>, RC const&, F& f, TC& tc BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, AC, & ac) )
+{
+    call_member_without_gil<R, F, typename TC::result_type BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, typename AC, ::result_type BOOST_PP_INTERCEPT)>(
+        f, tc() BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, ac, () BOOST_PP_INTERCEPT));
+    return none();
+}
+
 # undef N
 
 #endif // BOOST_PP_IS_ITERATING 
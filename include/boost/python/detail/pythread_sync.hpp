@@ -0,0 +1,104 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef PYTHREAD_SYNC_AGENT20261017_HPP
+# define PYTHREAD_SYNC_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+# include <boost/noncopyable.hpp>
+# include <pythread.h>
+# include <algorithm>
+# include <new>
+# include <vector>
+
+namespace boost { namespace python { namespace detail { 
+
+// Synchronization for threads which may not hold the GIL, built on the
+// PyThread API so that Boost.Thread isn't needed.
+
+inline PyThread_type_lock allocate_pythread_lock()
+{
+    PyThread_type_lock lock = PyThread_allocate_lock();
+    if (lock == 0)
+        throw std::bad_alloc();
+    return lock;
+}
+
+// Holds a PyThread lock for its lifetime.
+class scoped_pythread_lock : boost::noncopyable
+{
+ public:
+    explicit scoped_pythread_lock(PyThread_type_lock lock)
+      : m_lock(lock)
+    {
+        PyThread_acquire_lock(m_lock, WAIT_LOCK);
+    }
+
+    ~scoped_pythread_lock()
+    {
+        PyThread_release_lock(m_lock);
+    }
+
+ private:
+    PyThread_type_lock m_lock;
+};
+
+// The threads waiting for a condition, each of which blocks on a lock
+// of its own until notify_all() releases it. The PyThread API has
+// locks, but no condition variables.
+class pythread_condition : boost::noncopyable
+{
+ public:
+    // Waits for the condition to be notified. The caller holds mutex,
+    // which is released meanwhile.
+    void wait(PyThread_type_lock mutex)
+    {
+        PyThread_type_lock self = allocate_pythread_lock();
+        PyThread_acquire_lock(self, WAIT_LOCK);
+        m_waiters.push_back(self);
+
+        PyThread_release_lock(mutex);
+        PyThread_acquire_lock(self, WAIT_LOCK);
+        PyThread_free_lock(self);
+        PyThread_acquire_lock(mutex, WAIT_LOCK);
+    }
+
+# if PY_VERSION_HEX >= 0x03020000
+    // Like wait(), but returns after at most the given number of
+    // microseconds if the condition isn't notified.
+    void timed_wait(PyThread_type_lock mutex, PY_TIMEOUT_T microseconds)
+    {
+        PyThread_type_lock self = allocate_pythread_lock();
+        PyThread_acquire_lock(self, WAIT_LOCK);
+        m_waiters.push_back(self);
+
+        PyThread_release_lock(mutex);
+        PyThread_acquire_lock_timed(self, microseconds, 0);
+        PyThread_acquire_lock(mutex, WAIT_LOCK);
+
+        // Unless notify_all() released it, self is still waiting
+        std::vector<PyThread_type_lock>::iterator p
+            = std::find(m_waiters.begin(), m_waiters.end(), self);
+        if (p != m_waiters.end())
+            m_waiters.erase(p);
+        PyThread_free_lock(self);
+    }
+# endif
+
+    // Wakes all the waiting threads. The caller holds the mutex passed
+    // to wait().
+    void notify_all()
+    {
+        for (std::size_t i = 0; i < m_waiters.size(); ++i)
+            PyThread_release_lock(m_waiters[i]);
+        m_waiters.clear();
+    }
+
+ private:
+    std::vector<PyThread_type_lock> m_waiters;
+};
+
+}}} // namespace boost::python::detail
+
+#endif // PYTHREAD_SYNC_AGENT20261017_HPP
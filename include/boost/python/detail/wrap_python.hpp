@@ -187,6 +187,12 @@ typedef int pid_t;
 
 #endif
 
+// The vectorcall protocol (PEP 590) is part of the public API from
+// Python 3.9 on
+#if PY_VERSION_HEX >= 0x03090000
+# define BOOST_PYTHON_HAS_VECTORCALL
+#endif
+
 
 #ifdef __MWERKS__
 # pragma warn_possunwant off
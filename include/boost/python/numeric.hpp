@@ -9,6 +9,14 @@
 
 # include <boost/python/tuple.hpp>
 # include <boost/python/str.hpp>
+# include <boost/python/ssize_t.hpp>
+# include <boost/python/buffer_view.hpp>
+# include <boost/python/buffer_protocol.hpp>
+# include <boost/iterator/iterator_facade.hpp>
+# include <boost/noncopyable.hpp>
+# include <boost/type_traits/is_const.hpp>
+# include <boost/type_traits/remove_const.hpp>
+# include <vector>
 # include <boost/preprocessor/iteration/local.hpp>
 # include <boost/preprocessor/cat.hpp>
 # include <boost/preprocessor/repetition/enum.hpp>
@@ -225,6 +233,159 @@ class array : public aux::array_base
     BOOST_PYTHON_FORWARD_OBJECT_CONSTRUCTORS(array, base);
 };
 
+# if PY_VERSION_HEX >= 0x02070000
+
+template <class T> class array_iterator;
+
+// The memory of an array, or of any other object exporting a buffer,
+// described without calling Python. The buffer is held, so the memory
+// stays valid, until the array_buffer is destroyed.
+class BOOST_PYTHON_DECL array_buffer : boost::noncopyable
+{
+ public:
+    // Raises TypeError if x doesn't export a buffer, and BufferError if
+    // writable is true but the buffer is read-only.
+    explicit array_buffer(object const& x, bool writable = false);
+    ~array_buffer();
+
+    void* data() const { return m_view.buf; }
+    bool readonly() const { return m_view.readonly != 0; }
+    char const* format() const { return m_view.format ? m_view.format : "B"; }
+    ssize_t itemsize() const { return m_view.itemsize; }
+    int ndim() const { return m_view.ndim; }
+    ssize_t shape(int axis) const { return m_view.shape[axis]; }
+    ssize_t strides(int axis) const { return m_view.strides[axis]; }
+
+    // The number of elements
+    ssize_t size() const { return m_view.len / m_view.itemsize; }
+
+    bool is_c_contiguous() const;
+
+    // The address of the first element, which must be a T. Raises
+    // TypeError if the buffer's elements can't be viewed as T, or if
+    // T isn't const and the buffer is read-only.
+    template <class T>
+    T* data() const
+    {
+        check_elements(
+            converter::buffer_element<T>::kind, sizeof(T), !is_const<T>::value);
+        return static_cast<T*>(m_view.buf);
+    }
+
+    // Iterators over the elements, as T, in C order
+    template <class T>
+    array_iterator<T> begin() const
+    {
+        return array_iterator<T>(*this, this->template data<T>(), 0);
+    }
+
+    template <class T>
+    array_iterator<T> end() const
+    {
+        return array_iterator<T>(*this, this->template data<T>(), size());
+    }
+
+ private:
+    void check_elements(
+        converter::buffer_element_kind kind, std::size_t size, bool writable) const;
+
+    Py_buffer m_view;
+};
+
+// A forward iterator over the elements of an array_buffer, in C order,
+// which follows the buffer's strides.
+template <class T>
+class array_iterator
+    : public iterator_facade<array_iterator<T>, T, forward_traversal_tag>
+{
+ public:
+    array_iterator()
+        : m_buffer(0), m_position(0), m_count(0)
+    {}
+
+    array_iterator(array_buffer const& buffer, T* first, ssize_t count)
+        : m_buffer(&buffer)
+        , m_position(reinterpret_cast<char*>(const_cast<typename remove_const<T>::type*>(first)))
+        , m_count(count)
+        , m_index(buffer.ndim())
+    {}
+
+ private:
+    friend class boost::iterator_core_access;
+
+    T& dereference() const
+    {
+        return *reinterpret_cast<T*>(m_position);
+    }
+
+    bool equal(array_iterator const& other) const
+    {
+        return m_count == other.m_count;
+    }
+
+    void increment()
+    {
+        ++m_count;
+
+        // Step along the last axis, carrying into the earlier ones
+        for (int axis = m_buffer->ndim(); axis-- > 0;)
+        {
+            m_position += m_buffer->strides(axis);
+            if (++m_index[axis] < m_buffer->shape(axis))
+                return;
+            m_position -= m_buffer->strides(axis) * m_buffer->shape(axis);
+            m_index[axis] = 0;
+        }
+    }
+
+    array_buffer const* m_buffer;
+    char* m_position;
+    ssize_t m_count;
+    std::vector<ssize_t> m_index;
+};
+
+namespace aux
+{
+  BOOST_PYTHON_DECL object make_array(
+      void* data, bool readonly, char const* format, ssize_t itemsize
+    , std::vector<ssize_t> const& shape, std::vector<ssize_t> const& strides
+    , object const& owner);
+}
+
+// Returns an array of the elements at data, with the given extents and,
+// optionally, strides in bytes, without copying them. Each of shape
+// and strides is a single integer, for a one-dimensional array, or a
+// range of integers. Without strides, the elements are in C order. The
+// array is a NumPy ndarray if NumPy is the array module in use, and
+// otherwise a memoryview. It is read-only if T is const, and keeps
+// owner alive.
+template <class T, class Shape>
+object make_array(T* data, Shape const& shape, object const& owner = object())
+{
+    std::vector<ssize_t> extents;
+    python::detail::append_extents(extents, shape);
+    typedef typename remove_const<T>::type element;
+    return aux::make_array(
+        const_cast<element*>(data), is_const<T>::value
+      , converter::buffer_element<element>::format(), sizeof(element)
+      , extents, std::vector<ssize_t>(), owner);
+}
+
+template <class T, class Shape, class Strides>
+object make_array(T* data, Shape const& shape, Strides const& strides, object const& owner)
+{
+    std::vector<ssize_t> extents, steps;
+    python::detail::append_extents(extents, shape);
+    python::detail::append_extents(steps, strides);
+    typedef typename remove_const<T>::type element;
+    return aux::make_array(
+        const_cast<element*>(data), is_const<T>::value
+      , converter::buffer_element<element>::format(), sizeof(element)
+      , extents, steps, owner);
+}
+
+# endif // PY_VERSION_HEX >= 0x02070000
+
 } // namespace boost::python::numeric
 
 namespace converter
@@ -49,6 +49,10 @@ struct BOOST_PYTHON_DECL class_base : python::api::object
     // instances.
     void set_instance_size(std::size_t bytes);
 
+    // Keep up to max_size deallocated Python instances for reuse by
+    // new ones.
+    void set_freelist_size(std::size_t max_size);
+
     // Set an __init__ function which throws an appropriate exception
     // for abstract classes.
     void def_no_init();
@@ -11,9 +11,14 @@
 # include <boost/function/function2.hpp>
 # include <boost/python/object_core.hpp>
 # include <boost/python/object/py_function.hpp>
+# include <boost/shared_ptr.hpp>
+# include <vector>
 
 namespace boost { namespace python { namespace objects { 
 
+struct keyword_plan;
+struct bound_arguments;
+struct call_arguments;
 
 struct BOOST_PYTHON_DECL function : PyObject
 {
@@ -25,6 +30,12 @@ struct BOOST_PYTHON_DECL function : PyObject
     ~function();
     
     PyObject* call(PyObject*, PyObject*) const;
+    
+# ifdef BOOST_PYTHON_HAS_VECTORCALL
+    // Calls through the vectorcall protocol: nargs positional arguments
+    // followed by the values of the keywords named in kwnames.
+    PyObject* call(PyObject* const* args, std::size_t nargs, PyObject* kwnames) const;
+# endif
 
     // Add an attribute to the name_space with the given name. If it is
     // a function object (this class), and an existing function is
@@ -47,6 +58,22 @@ struct BOOST_PYTHON_DECL function : PyObject
     object signatures(bool show_return_type=false) const;
     void argument_error(PyObject* args, PyObject* keywords) const;
     void add_overload(handle<function> const&);
+    PyObject* dispatch(call_arguments&) const;
+    PyObject* call_overload(call_arguments&, bound_arguments&) const;
+    void share_keyword_plans();
+
+    // Overload dispatch cache: remembers which overload accepted a
+    // given sequence of positional argument types, so that repeated
+    // calls can skip the conversion attempts of the other overloads.
+    struct dispatch_entry
+    {
+        function const* overload; // 0 => don't dispatch on these types
+        std::vector<handle<> > keyword_names; // in the order passed
+        std::vector<PyTypeObject*> arg_types; // positional, then keyword
+    };
+    
+    dispatch_entry* find_dispatch_entry(call_arguments const&) const;
+    void cache_overload(call_arguments const&, function const*) const;
     
  private: // data members
     py_function m_fn;
@@ -56,6 +83,12 @@ struct BOOST_PYTHON_DECL function : PyObject
     object m_doc;
     object m_arg_names;
     unsigned m_nkeyword_values;
+    boost::shared_ptr<keyword_plan> m_keyword_plan;
+    mutable std::vector<dispatch_entry> m_dispatch_cache;
+    mutable unsigned m_dispatch_next;
+# ifdef BOOST_PYTHON_HAS_VECTORCALL
+    vectorcallfunc m_vectorcall;
+# endif
     friend class function_doc_signature_generator;
 };
 
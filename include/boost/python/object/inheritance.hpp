@@ -6,11 +6,16 @@
 # define INHERITANCE_DWA200216_HPP
 
 # include <boost/python/type_id.hpp>
+# include <boost/python/detail/alignment_of.hpp>
 # include <boost/shared_ptr.hpp>
 # include <boost/mpl/if.hpp>
+# include <boost/mpl/and.hpp>
+# include <boost/mpl/not.hpp>
 # include <boost/type_traits/is_polymorphic.hpp>
 # include <boost/type_traits/is_base_and_derived.hpp>
+# include <boost/type_traits/is_virtual_base_of.hpp>
 # include <boost/detail/workaround.hpp>
+# include <cstddef>
 
 namespace boost { namespace python { namespace objects {
 
@@ -27,6 +32,11 @@ BOOST_PYTHON_DECL void register_dynamic_id_aux(
 BOOST_PYTHON_DECL void add_cast(
     class_id src_t, class_id dst_t, void* (*cast)(void*), bool is_downcast);
 
+// Record that the cast from src_t to dst_t, already added with
+// add_cast, always adds offset to the address of the source object.
+BOOST_PYTHON_DECL void add_cast_offset(
+    class_id src_t, class_id dst_t, std::ptrdiff_t offset);
+
 //
 // a generator with an execute() function which, given a source type
 // and a pointer to an object of that type, returns its most-derived
@@ -101,6 +111,47 @@ struct implicit_cast_generator
     }
 };
 
+// When Target is a non-virtual base of Source, the address of the
+// Target subobject is at the same offset in every Source object.
+template <class Source, class Target>
+struct cast_offset_generator
+{
+    static std::ptrdiff_t execute()
+    {
+        // The conversion is pointer arithmetic which never touches the
+        // object, so any suitably-aligned non-null address will do.
+        char* const source = reinterpret_cast<char*>(
+            python::detail::alignment_of<Source>::value << 8);
+        
+        Target* result = reinterpret_cast<Source*>(source);
+        return reinterpret_cast<char*>(result) - source;
+    }
+};
+
+template <class Source, class Target>
+struct is_constant_offset_cast
+  : mpl::and_<
+        is_base_and_derived<Target,Source>
+      , mpl::not_<is_virtual_base_of<Target,Source> >
+    >
+{
+};
+
+template <class Source, class Target>
+inline void register_cast_offset(mpl::false_, Source* = 0, Target* = 0)
+{
+}
+
+template <class Source, class Target>
+inline void register_cast_offset(mpl::true_, Source* = 0, Target* = 0)
+{
+    add_cast_offset(
+        python::type_id<Source>()
+      , python::type_id<Target>()
+      , cast_offset_generator<Source,Target>::execute()
+    );
+}
+
 template <class Source, class Target>
 struct cast_generator
   : mpl::if_<
@@ -125,6 +176,9 @@ inline void register_conversion(
       , &generator::execute
       , is_downcast
     );
+
+    register_cast_offset<Source,Target>(
+        is_constant_offset_cast<Source,Target>());
 }
 
 }}} // namespace boost::python::object
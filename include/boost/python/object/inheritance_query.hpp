@@ -6,12 +6,21 @@
 # define INHERITANCE_QUERY_DWA2003520_HPP
 
 # include <boost/python/type_id.hpp>
+# include <boost/python/object_fwd.hpp>
 
 namespace boost { namespace python { namespace objects {
 
 BOOST_PYTHON_DECL void* find_static_type(void* p, type_info src, type_info dst);
 BOOST_PYTHON_DECL void* find_dynamic_type(void* p, type_info src, type_info dst);
 
+// Returns a dict describing the cache of cast results
+BOOST_PYTHON_DECL object cast_cache_statistics();
+
+// Computes now, rather than on first use, everything needed to search
+// for casts between the classes registered so far. Returns a dict
+// giving the number of classes and the memory used.
+BOOST_PYTHON_DECL object finalize_class_graph();
+
 }}} // namespace boost::python::object
 
 #endif // INHERITANCE_QUERY_DWA2003520_HPP
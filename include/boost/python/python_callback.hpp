@@ -0,0 +1,195 @@
+#if !defined(BOOST_PP_IS_ITERATING)
+
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef PYTHON_CALLBACK_AGENT20261017_HPP
+# define PYTHON_CALLBACK_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+
+# include <boost/python/call.hpp>
+# include <boost/python/object_core.hpp>
+# include <boost/python/refcount.hpp>
+# include <boost/python/detail/preprocessor.hpp>
+
+# include <boost/noncopyable.hpp>
+# include <boost/scoped_ptr.hpp>
+# include <boost/shared_ptr.hpp>
+# include <boost/static_assert.hpp>
+# include <boost/type_traits/is_void.hpp>
+# include <boost/type_traits/remove_cv.hpp>
+# include <boost/type_traits/remove_reference.hpp>
+
+# include <boost/preprocessor/iterate.hpp>
+# include <boost/preprocessor/repetition/enum_params.hpp>
+# include <boost/preprocessor/repetition/enum_binary_params.hpp>
+# include <boost/preprocessor/repetition/enum_trailing_params.hpp>
+# include <boost/preprocessor/repetition/enum_trailing_binary_params.hpp>
+# include <boost/preprocessor/repetition/repeat.hpp>
+
+# include <cstddef>
+
+namespace boost { namespace python {
+
+namespace detail
+{
+  // Releases a reference to a Python object from any thread, taking
+  // the GIL to do so.
+  struct BOOST_PYTHON_DECL decref_with_gil
+  {
+      void operator()(PyObject*) const;
+  };
+
+  // A call to a Python callable waiting in a callback_queue.
+  struct BOOST_PYTHON_DECL pending_call : boost::noncopyable
+  {
+      explicit pending_call(boost::shared_ptr<PyObject> const& callable)
+        : callable(callable)
+      {}
+
+      virtual ~pending_call();
+
+      // Makes the call; the GIL must be held.
+      virtual void operator()() = 0;
+
+      boost::shared_ptr<PyObject> const callable;
+  };
+
+  // The type in which a pending call stores an argument of type T.
+  template <class T>
+  struct pending_call_arg
+    : remove_cv<typename remove_reference<T>::type>
+  {
+  };
+
+  struct callback_queue_impl;
+}
+
+// A bounded queue of calls posted by python_callback objects from any
+// thread, which are made in batches under a single acquisition of the
+// GIL, either by drain() or by a dispatcher thread.
+class BOOST_PYTHON_DECL callback_queue : boost::noncopyable
+{
+ public:
+    // What post() does when the queue is full: wait until there is
+    // room for the call, or discard it.
+    enum overflow_policy { block, discard };
+
+    explicit callback_queue(
+        std::size_t capacity = 1024
+      , overflow_policy overflow = block
+      , std::size_t batch_size = 64);
+
+    // Stops the dispatcher thread, if any. The GIL must be held.
+    ~callback_queue();
+
+    // Queues the call, taking ownership of it, from any thread. Returns
+    // false if the call was discarded because the queue was full.
+    bool post(detail::pending_call* call);
+
+    // Makes up to max_calls queued calls, returning the number made.
+    // The GIL must be held. If a call raises an exception, it is
+    // propagated and any calls following it stay queued.
+    std::size_t drain(std::size_t max_calls = std::size_t(-1));
+
+    // Starts or stops a thread which makes the queued calls batch_size
+    // at a time, reporting any exceptions they raise as unraisable.
+    // Calls still queued are made before stop() returns. The GIL must
+    // be held.
+    void start();
+    void stop();
+    bool running() const;
+
+    std::size_t size() const;
+    std::size_t capacity() const;
+    std::size_t batch_size() const;
+    overflow_policy overflow() const;
+
+    // The number of calls discarded because the queue was full.
+    std::size_t discarded() const;
+
+ private:
+    scoped_ptr<detail::callback_queue_impl> m_impl;
+};
+
+// A function object which may be called from any thread, even one not
+// known to Python, to call a Python callable through a callback_queue.
+template <class Sig>
+class python_callback;
+
+#  define BOOST_PYTHON_PENDING_CALL_ARG(z, n, _) \
+    typename detail::pending_call_arg<A##n>::type m_a##n;
+
+#  define BOOST_PYTHON_PENDING_CALL_INIT(z, n, _) \
+    , m_a##n(a##n)
+
+#  define BOOST_PP_ITERATION_PARAMS_1 (3, (0, BOOST_PYTHON_MAX_ARITY, <boost/python/python_callback.hpp>))
+#  include BOOST_PP_ITERATE()
+
+#  undef BOOST_PYTHON_PENDING_CALL_INIT
+#  undef BOOST_PYTHON_PENDING_CALL_ARG
+
+}} // namespace boost::python
+
+# endif // PYTHON_CALLBACK_AGENT20261017_HPP
+
+#else // BOOST_PP_IS_ITERATING
+
+# define N BOOST_PP_ITERATION()
+
+template <class R BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, class A)>
+class python_callback<R(BOOST_PP_ENUM_PARAMS_Z(1, N, A))>
+{
+    // Calls are made after the caller has moved on, so there is no
+    // result to return.
+    BOOST_STATIC_ASSERT(is_void<R>::value);
+
+    struct call_ : detail::pending_call
+    {
+        call_(boost::shared_ptr<PyObject> const& callable
+              BOOST_PP_ENUM_TRAILING_BINARY_PARAMS_Z(1, N, A, a))
+          : detail::pending_call(callable)
+            BOOST_PP_REPEAT_1(N, BOOST_PYTHON_PENDING_CALL_INIT, _)
+        {}
+
+        void operator()()
+        {
+            python::call<void>(this->callable.get() BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, m_a));
+        }
+
+        BOOST_PP_REPEAT_1(N, BOOST_PYTHON_PENDING_CALL_ARG, _)
+    };
+
+ public:
+    typedef bool result_type;
+
+    // The GIL must be held. The queue must outlive the callback and
+    // its copies.
+    python_callback(object const& callable, callback_queue& queue)
+      : m_callable(python::incref(callable.ptr()), detail::decref_with_gil())
+      , m_queue(&queue)
+    {}
+
+    // Copies the arguments, and queues a call to the callable with
+    // them. Returns false if the call was discarded.
+    bool operator()(BOOST_PP_ENUM_BINARY_PARAMS_Z(1, N, A, a)) const
+    {
+        return m_queue->post(
+            new call_(m_callable BOOST_PP_ENUM_TRAILING_PARAMS_Z(1, N, a)));
+    }
+
+    callback_queue& queue() const
+    {
+        return *m_queue;
+    }
+
+ private:
+    boost::shared_ptr<PyObject> m_callable;
+    callback_queue* m_queue;
+};
+
+# undef N
+
+#endif // BOOST_PP_IS_ITERATING
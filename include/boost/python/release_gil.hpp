@@ -0,0 +1,28 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef RELEASE_GIL_AGENT20261017_HPP
+# define RELEASE_GIL_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+# include <boost/python/default_call_policies.hpp>
+# include <boost/mpl/bool.hpp>
+
+namespace boost { namespace python {
+
+// Releases the GIL while the wrapped C++ function runs. Arguments are
+// converted before it is released, and it is reacquired before the
+// result is converted, Base's postcall runs, or an exception is
+// translated.
+template <class BasePolicy_ = default_call_policies>
+struct release_gil : BasePolicy_
+{
+    // Detected by detail::invoke_tag_for, which selects an invocation
+    // without the GIL.
+    typedef mpl::true_ releases_gil;
+};
+
+}} // namespace boost::python
+
+#endif // RELEASE_GIL_AGENT20261017_HPP
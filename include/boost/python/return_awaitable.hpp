@@ -0,0 +1,154 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef RETURN_AWAITABLE_AGENT20261017_HPP
+# define RETURN_AWAITABLE_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+# include <boost/python/to_python_value.hpp>
+# include <boost/python/detail/none.hpp>
+# include <boost/python/detail/value_arg.hpp>
+
+# include <boost/move/utility_core.hpp>
+# include <boost/mpl/bool.hpp>
+# include <boost/noncopyable.hpp>
+# include <boost/type_traits/is_void.hpp>
+
+# ifndef BOOST_NO_CXX11_HDR_FUTURE
+#  include <chrono>
+#  include <future>
+# endif
+
+namespace boost { namespace python {
+
+// Returns whether future has its result, without blocking. Overload it
+// for future types which have no is_ready() member.
+template <class Future>
+inline bool future_is_ready(Future const& future)
+{
+    return future.is_ready();
+}
+
+# ifndef BOOST_NO_CXX11_HDR_FUTURE
+template <class T>
+inline bool future_is_ready(std::future<T> const& future)
+{
+    return future.wait_for(std::chrono::seconds(0)) == std::future_status::ready;
+}
+
+template <class T>
+inline bool future_is_ready(std::shared_future<T> const& future)
+{
+    return future.wait_for(std::chrono::seconds(0)) == std::future_status::ready;
+}
+# endif
+
+namespace detail
+{
+  // A C++ future whose result an asyncio future is waiting for.
+  struct BOOST_PYTHON_DECL pending_future : boost::noncopyable
+  {
+      virtual ~pending_future();
+
+      // Returns whether the future is ready, without blocking. The GIL
+      // is not held.
+      virtual bool is_ready() = 0;
+
+      // Returns the future's result converted to Python, or throws the
+      // exception it holds. The GIL is held.
+      virtual PyObject* get() = 0;
+  };
+
+  // Returns a new asyncio future of the running event loop which is
+  // given the result of future once the thread polling futures finds
+  // it ready.
+  BOOST_PYTHON_DECL PyObject* make_awaitable(pending_future* future);
+
+  // The type returned by the get() member of a future-like type, such
+  // as std::future<T> or boost::unique_future<T>.
+  template <class Future>
+  struct future_result;
+
+  template <template <class> class Future, class T>
+  struct future_result<Future<T> >
+  {
+      typedef T type;
+  };
+
+  template <class Future>
+  class pending_future_impl : public pending_future
+  {
+      typedef typename future_result<Future>::type result_t;
+
+   public:
+      explicit pending_future_impl(Future& future)
+        : m_future(boost::move(future))
+      {}
+
+      bool is_ready()
+      {
+          return future_is_ready(m_future);
+      }
+
+      PyObject* get()
+      {
+          return this->get(is_void<result_t>());
+      }
+
+   private:
+      PyObject* get(mpl::true_)
+      {
+          m_future.get();
+          return python::detail::none();
+      }
+
+      PyObject* get(mpl::false_)
+      {
+          return to_python_value<typename value_arg<result_t>::type>()(m_future.get());
+      }
+
+      Future m_future;
+  };
+
+  template <class Future>
+  struct awaitable_result_converter
+  {
+      bool convertible() const
+      {
+          return true;
+      }
+
+      // The future is always the temporary returned by the wrapped
+      // function, so it may be moved from.
+      PyObject* operator()(Future const& future) const
+      {
+          return make_awaitable(
+              new pending_future_impl<Future>(const_cast<Future&>(future)));
+      }
+
+# ifndef BOOST_PYTHON_NO_PY_SIGNATURES
+      PyTypeObject const* get_pytype() const
+      {
+          return 0;
+      }
+# endif
+  };
+}
+
+// A ResultConverterGenerator for functions returning future-like
+// objects, with a get() member and an is_ready() member or
+// future_is_ready() overload, which returns an asyncio future to Python
+// instead of blocking until the result is ready.
+struct return_awaitable
+{
+    template <class R>
+    struct apply
+    {
+        typedef detail::awaitable_result_converter<R> type;
+    };
+};
+
+}} // namespace boost::python
+
+#endif // RETURN_AWAITABLE_AGENT20261017_HPP
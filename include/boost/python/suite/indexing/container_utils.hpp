@@ -1,4 +1,3 @@
-
 //  (C) Copyright Joel de Guzman 2003.
 //  Distributed under the Boost Software License, Version 1.0. (See
 //  accompanying file LICENSE_1_0.txt or copy at
@@ -7,20 +6,132 @@
 #ifndef PY_CONTAINER_UTILS_JDG20038_HPP
 # define PY_CONTAINER_UTILS_JDG20038_HPP
 
+# include <functional>
 # include <utility>
+# include <vector>
 # include <boost/foreach.hpp>
 # include <boost/python/object.hpp>
 # include <boost/python/handle.hpp>
 # include <boost/python/extract.hpp>
 # include <boost/python/stl_iterator.hpp>
+# include <boost/python/buffer_view.hpp>
+# include <boost/python/ssize_t.hpp>
 
 namespace boost { namespace python { namespace container_utils {
+
+    //  Views the elements of l, if it exports a contiguous buffer of
+    //  data_type elements (such as an array.array or a NumPy array),
+    //  so that they can be copied at once. Otherwise, returns a view
+    //  without an owner.
+    template <typename data_type>
+    buffer_view<data_type const>
+    contiguous_elements(object const& l)
+    {
+        extract<buffer_view<data_type const> > elements(l);
+        if (elements.check())
+            return elements();
+        return buffer_view<data_type const>();
+    }
+
+    //  Returns true iff the elements viewed are some of the elements of
+    //  container, which only vectors can export through the buffer
+    //  protocol.
+    template <typename Container, typename T>
+    bool
+    aliases(Container& /*container*/, buffer_view<T> const& /*elements*/)
+    {
+        return false;
+    }
+
+    template <typename U, typename Allocator, typename T>
+    bool
+    aliases(std::vector<U, Allocator>& container, buffer_view<T> const& elements)
+    {
+        if (elements.empty() || container.empty())
+            return false;
+
+        void const* begin = &container[0];
+        void const* end = &container[0] + container.size();
+        void const* data = elements.data();
+        std::less<void const*> before;
+        return !before(data, begin) && before(data, end);
+    }
+
+    template <typename Allocator, typename T>
+    bool
+    aliases(std::vector<bool, Allocator>& /*container*/, buffer_view<T> const& /*elements*/)
+    {
+        return false;
+    }
+
+    template <typename Container>
+    void
+    reserve_more(Container& /*container*/, std::size_t /*n*/)
+    {
+    }
+
+    template <typename T, typename Allocator>
+    void
+    reserve_more(std::vector<T, Allocator>& container, std::size_t n)
+    {
+        container.reserve(container.size() + n);
+    }
+
+    template <typename Container>
+    void
+    append_element(Container& container, object const& elem)
+    {
+        typedef typename Container::value_type data_type;
+
+        extract<data_type const&> x(elem);
+        //  try if elem is an exact data_type type
+        if (x.check())
+        {
+            container.push_back(x());
+        }
+        else
+        {
+            //  try to convert elem to data_type type
+            extract<data_type> x(elem);
+            if (x.check())
+            {
+                container.push_back(x());
+            }
+            else
+            {
+                PyErr_SetString(PyExc_TypeError, "Incompatible Data Type");
+                throw_error_already_set();
+            }
+        }
+    }
         
     template <typename Container>
     void
     extend_container(Container& container, object l)
     {
         typedef typename Container::value_type data_type;
+
+        //  copy buffers of data_type elements at once
+        buffer_view<data_type const> elements = 
+            contiguous_elements<data_type>(l);
+        if (elements.owner())
+        {
+            container.insert(container.end(), elements.begin(), elements.end());
+            return;
+        }
+
+        //  lists and tuples are read in place
+        if (PyList_Check(l.ptr()) || PyTuple_Check(l.ptr()))
+        {
+            reserve_more(container, PySequence_Fast_GET_SIZE(l.ptr()));
+            //  converting an element may run code changing the list
+            for (ssize_t i = 0; i < PySequence_Fast_GET_SIZE(l.ptr()); ++i)
+            {
+                append_element(container, object(handle<>(
+                    python::borrowed(PySequence_Fast_GET_ITEM(l.ptr(), i)))));
+            }
+            return;
+        }
         
         //  l must be iterable
         BOOST_FOREACH(object elem,
@@ -29,26 +140,7 @@ namespace boost { namespace python { namespace container_utils {
               boost::python::stl_input_iterator<object>()
               ))
         {
-            extract<data_type const&> x(elem);
-            //  try if elem is an exact data_type type
-            if (x.check())
-            {
-                container.push_back(x());
-            }
-            else
-            {
-                //  try to convert elem to data_type type
-                extract<data_type> x(elem);
-                if (x.check())
-                {
-                    container.push_back(x());
-                }
-                else
-                {
-                    PyErr_SetString(PyExc_TypeError, "Incompatible Data Type");
-                    throw_error_already_set();
-                }
-            }
+            append_element(container, elem);
         }          
     }
 
@@ -7,13 +7,17 @@
 # define INDEXING_SUITE_DETAIL_JDG20036_HPP
 
 # include <boost/python/extract.hpp>
+# include <boost/python/suite/indexing/container_utils.hpp>
 # include <boost/scoped_ptr.hpp>
 # include <boost/get_pointer.hpp>
-# include <boost/detail/binary_search.hpp>
 # include <boost/numeric/conversion/cast.hpp>
+# include <boost/type_traits/is_integral.hpp>
 # include <boost/type_traits/is_pointer.hpp>
+# include <boost/mpl/bool.hpp>
+# include <boost/unordered_map.hpp>
+# include <algorithm>
+# include <cstddef>
 # include <vector>
-# include <map>
 #include <iostream>
 
 namespace boost { namespace python { namespace detail {
@@ -24,63 +28,77 @@ namespace boost { namespace python { namespace detail {
 #define BOOST_PYTHON_INDEXING_CHECK_INVARIANT check_invariant()
 #endif
     
-    template <class Proxy>
-    struct compare_proxy_index
+    //  A node of a proxy_group's tree (see below). Each proxy in a
+    //  proxy_group has a node, and points back to it while the proxy
+    //  is attached to its container.
+    //
+    //  The index of a node is its *index* plus the *shift* of all of
+    //  its ancestors: a shift is only added to the indexes of a node's
+    //  children when they are next visited.
+    //
+    template <class Index>
+    struct proxy_node
     {
-        //  This functor compares a proxy and an index.
-        //  This is used by proxy_group::first_proxy to
-        //  get first proxy with index i.
-                
-        template <class Index>
-        bool operator()(PyObject* prox, Index i) const
-        {
-            typedef typename Proxy::policies_type policies_type;
-            Proxy& proxy = extract<Proxy&>(prox)();
-            return policies_type::
-                compare_index(proxy.get_container(), proxy.get_index(), i);
+        proxy_node(PyObject* proxy, Index index, unsigned priority)
+            : proxy(proxy)
+            , index(index)
+            , shift(0)
+            , priority(priority)
+            , left(0)
+            , right(0)
+            , parent(0)
+        {
         }
-    };        
+
+        PyObject* proxy;
+        Index index;
+        std::ptrdiff_t shift;
+        unsigned priority;
+        proxy_node* left;
+        proxy_node* right;
+        proxy_node* parent;
+    };
  
-    //  The proxy_group class holds a vector of container element
-    //  proxies. First, what is a container element proxy? A container 
-    //  element proxy acts like a smart pointer holding a reference to 
-    //  a container and an index (see container_element, for details). 
+    //  The proxy_group class holds the container element proxies of
+    //  a container. First, what is a container element proxy? A
+    //  container element proxy acts like a smart pointer holding a
+    //  reference to a container and an index (see container_element,
+    //  for details).
     //
-    //  The proxies are held in a vector always sorted by its index.
-    //  Various functions manage the addition, removal and searching
-    //  of proxies from the vector.
+    //  The proxies are held in a treap (a randomized binary search
+    //  tree) ordered by index, so that proxies are added, found and
+    //  removed in O(log n) time. The indexes of all the proxies
+    //  displaced by a slice assignment or deletion are adjusted at
+    //  once, by shifting a subtree, also in O(log n) time.
     //
     template <class Proxy>
     class proxy_group
     {
     public:
     
-        typedef typename std::vector<PyObject*>::const_iterator const_iterator;
-        typedef typename std::vector<PyObject*>::iterator iterator;
         typedef typename Proxy::index_type index_type;
         typedef typename Proxy::policies_type policies_type;
-        
-        iterator
-        first_proxy(index_type i)
+        typedef typename Proxy::container_type container_type;
+        typedef proxy_node<index_type> node_type;
+        typedef std::size_t size_type;
+
+        proxy_group()
+            : root(0)
+            , count(0)
+            , container(0)
+            , seed(2463534242u)
         {
-            // Return the first proxy with index <= i
-            return boost::detail::lower_bound(
-                proxies.begin(), proxies.end(), 
-                i, compare_proxy_index<Proxy>());
         }
 
         void
         remove(Proxy& proxy)
         {
             // Remove a proxy
-            for (iterator iter = first_proxy(proxy.get_index());
-                iter != proxies.end(); ++iter)
+            if (node_type* n = proxy.get_node())
             {
-                if (&extract<Proxy&>(*iter)() == &proxy)
-                {
-                    proxies.erase(iter);
-                    break;
-                }
+                proxy.set_node(0);
+                unlink(n);
+                delete n;
             }
             BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
         }
@@ -90,8 +108,15 @@ namespace boost { namespace python { namespace detail {
         {
             BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
             // Add a proxy
-            proxies.insert(
-                first_proxy(extract<Proxy&>(prox)().get_index()), prox);
+            Proxy& proxy = extract<Proxy&>(prox)();
+            container = &proxy.get_container();
+
+            node_type* n = new node_type(prox, proxy.get_index(), next_priority());
+            node_type *left, *right;
+            split(root, n->index, left, right, false);
+            set_root(merge(merge(left, n), right));
+            proxy.set_node(n);
+            ++count;
             BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
         }
 
@@ -109,15 +134,14 @@ namespace boost { namespace python { namespace detail {
         {
             BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
             // Erase the proxy with index i 
-            
-            iterator iter = first_proxy(i);
-            extract<Proxy&> p(*iter);
-            
-            if (iter != proxies.end() && p().get_index() == i)
+            if (node_type* n = find_node(i))
             {
-                extract<Proxy&> p(*iter);
-                p().detach();
-                proxies.erase(iter);
+                Proxy& proxy = extract<Proxy&>(n->proxy)();
+                proxy.set_index(index_of(n));
+                proxy.set_node(0);
+                unlink(n);
+                delete n;
+                proxy.detach();
             }
             BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
         }
@@ -137,7 +161,7 @@ namespace boost { namespace python { namespace detail {
         replace(
             index_type from, 
             index_type to, 
-            typename std::vector<PyObject*>::size_type len)
+            size_type len)
         {
             // note: this cannot be called when container is not sliceable
 
@@ -149,36 +173,26 @@ namespace boost { namespace python { namespace detail {
             // procedure involves adjusting the indexes of 
             // the proxies.
             
-            iterator left = first_proxy(from);
-            iterator right = proxies.end(); // we'll adjust this later
-            
-            for (iterator iter = left; iter != right; ++iter)
+            node_type *left, *middle, *right;
+            split(root, from, left, middle, false);
+            split(middle, to, middle, right, true);
+
+            typedef typename container_type::difference_type difference_type;
+            shift(right, difference_type(len) - (difference_type(to) - from));
+            set_root(merge(left, right));
+
+            // The proxies are detached once the tree is consistent
+            // again, as detaching one may throw.
+            std::vector<PyObject*> erased;
+            release(middle, erased);
+            count -= erased.size();
+
+            for (std::vector<PyObject*>::iterator iter = erased.begin();
+                iter != erased.end(); ++iter)
             {
-                if (extract<Proxy&>(*iter)().get_index() > to)
-                {
-                    right = iter; // adjust right
-                    break;
-                }
                 extract<Proxy&> p(*iter);
                 p().detach();
             }
-            
-            typename std::vector<PyObject*>::size_type 
-                offset = left-proxies.begin();
-            proxies.erase(left, right);
-            right = proxies.begin()+offset;
-
-            while (right != proxies.end())
-            {
-                typedef typename Proxy::container_type::difference_type difference_type;
-                extract<Proxy&> p(*right);
-                p().set_index(
-                    extract<Proxy&>(*right)().get_index() 
-                    - (difference_type(to) - from - len)
-                );
-                    
-                ++right;
-            }
             BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
         }
         
@@ -189,80 +203,293 @@ namespace boost { namespace python { namespace detail {
             // Find the proxy with *exact* index i.
             // Return 0 (null) if no proxy with the 
             // given index is found.
-            iterator iter = first_proxy(i);
-            if (iter != proxies.end()
-                && extract<Proxy&>(*iter)().get_index() == i)
-            {
-                BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
-                return *iter;
-            }
-            BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
-            return 0;
+            node_type* n = find_node(i);
+            return n != 0 ? n->proxy : 0;
         }
 
-        typename std::vector<PyObject*>::size_type 
+        size_type 
         size() const
         {
-            BOOST_PYTHON_INDEXING_CHECK_INVARIANT;
             // How many proxies are there so far?
-            return proxies.size();
+            return count;
         } 
 
+        static index_type
+        index_of(node_type const* n)
+        {
+            // The index of the proxy held by n
+            return index_of(n, mpl::bool_<is_integral<index_type>::value>());
+        }
+
     private:
 
-#if !defined(NDEBUG)
+        static index_type
+        index_of(node_type const* n, mpl::false_)
+        {
+            return n->index;
+        }
+
+        static index_type
+        index_of(node_type const* n, mpl::true_)
+        {
+            index_type i = n->index;
+            for (node_type const* p = n->parent; p != 0; p = p->parent)
+                i = index_type(i + p->shift);
+            return i;
+        }
+
+        static void
+        push_down(node_type* n)
+        {
+            push_down(n, mpl::bool_<is_integral<index_type>::value>());
+        }
+
+        static void
+        push_down(node_type* /*n*/, mpl::false_)
+        {
+            // Indexes which are not integers are never shifted
+        }
+
+        static void
+        push_down(node_type* n, mpl::true_)
+        {
+            // Pass the shift of n on to its children
+            if (n->shift != 0)
+            {
+                shift(n->left, n->shift);
+                shift(n->right, n->shift);
+                n->shift = 0;
+            }
+        }
+
+        static void
+        shift(node_type* n, std::ptrdiff_t offset)
+        {
+            // Add offset to the indexes of n and its descendants
+            if (n != 0)
+            {
+                n->index = index_type(n->index + offset);
+                n->shift += offset;
+            }
+        }
+
+        static void
+        set_parent(node_type* n, node_type* parent)
+        {
+            if (n != 0)
+                n->parent = parent;
+        }
+
         void
-        check_invariant() const
+        set_root(node_type* n)
+        {
+            root = n;
+            set_parent(root, 0);
+        }
+
+        bool
+        less(index_type a, index_type b) const
         {
-            for (const_iterator i = proxies.begin(); i != proxies.end(); ++i)
+            return policies_type::compare_index(*container, a, b);
+        }
+
+        unsigned
+        next_priority()
+        {
+            // xorshift32
+            seed ^= seed << 13;
+            seed ^= seed >> 17;
+            seed ^= seed << 5;
+            return seed;
+        }
+
+        node_type*
+        find_node(index_type i)
+        {
+            node_type* n = root;
+            while (n != 0)
             {
-                if ((*i)->ob_refcnt <= 0)
-                {
-                    PyErr_SetString(PyExc_RuntimeError, 
-                        "Invariant: Proxy vector in an inconsistent state");
-                    throw_error_already_set();
-                }
-                
-                if (i+1 != proxies.end())
-                {
-                    if (extract<Proxy&>(*(i+1))().get_index() ==
-                        extract<Proxy&>(*(i))().get_index())
-                    {
-                        PyErr_SetString(PyExc_RuntimeError, 
-                            "Invariant: Proxy vector in an inconsistent state (duplicate proxy)");
-                        throw_error_already_set();
-                    }
-                }
+                push_down(n);
+                if (less(i, n->index))
+                    n = n->left;
+                else if (less(n->index, i))
+                    n = n->right;
+                else
+                    break;
+            }
+            return n;
+        }
+
+        void
+        split(
+            node_type* n, index_type i, 
+            node_type*& left, node_type*& right, bool inclusive)
+        {
+            // Split the tree n into the nodes with indexes less than
+            // i (or equal to i, if inclusive) and the others.
+            if (n == 0)
+            {
+                left = right = 0;
+                return;
             }
+
+            push_down(n);
+            if (less(n->index, i) || (inclusive && !less(i, n->index)))
+            {
+                split(n->right, i, n->right, right, inclusive);
+                set_parent(n->right, n);
+                left = n;
+            }
+            else
+            {
+                split(n->left, i, left, n->left, inclusive);
+                set_parent(n->left, n);
+                right = n;
+            }
+        }
+
+        node_type*
+        merge(node_type* left, node_type* right)
+        {
+            // Merge two trees, all of left's indexes being
+            // less than right's.
+            if (left == 0)
+                return right;
+            if (right == 0)
+                return left;
+
+            if (left->priority > right->priority)
+            {
+                push_down(left);
+                left->right = merge(left->right, right);
+                set_parent(left->right, left);
+                return left;
+            }
+            push_down(right);
+            right->left = merge(left, right->left);
+            set_parent(right->left, right);
+            return right;
+        }
+
+        void
+        unlink(node_type* n)
+        {
+            // Take n out of the tree
+            push_down(n);
+            node_type* children = merge(n->left, n->right);
+            node_type* parent = n->parent;
+
+            set_parent(children, parent);
+            if (parent == 0)
+                root = children;
+            else if (parent->left == n)
+                parent->left = children;
+            else
+                parent->right = children;
+            --count;
+        }
+
+        static void
+        release(node_type* n, std::vector<PyObject*>& proxies)
+        {
+            // Delete the tree n, unlinking its proxies, which are
+            // appended to proxies in order.
+            if (n == 0)
+                return;
+
+            push_down(n);
+            release(n->left, proxies);
+
+            Proxy& proxy = extract<Proxy&>(n->proxy)();
+            proxy.set_index(n->index);
+            proxy.set_node(0);
+            proxies.push_back(n->proxy);
+
+            release(n->right, proxies);
+            delete n;
+        }
+
+#if !defined(NDEBUG)
+        void
+        check_invariant() const
+        {
+            node_type const* previous = 0;
+            size_type visited = 0;
+            check_invariant(root, 0, previous, visited);
+            if (visited != count)
+                invariant_violated("Invariant: Proxy tree in an inconsistent state");
+        }
+
+        void
+        check_invariant(
+            node_type const* n, node_type const* parent, 
+            node_type const*& previous, size_type& visited) const
+        {
+            if (n == 0)
+                return;
+
+            if (n->parent != parent)
+                invariant_violated("Invariant: Proxy tree in an inconsistent state");
+            check_invariant(n->left, n, previous, visited);
+
+            if (n->proxy->ob_refcnt <= 0)
+                invariant_violated("Invariant: Proxy tree in an inconsistent state");
+            if (previous != 0 && !less(index_of(previous), index_of(n)))
+                invariant_violated(
+                    "Invariant: Proxy tree in an inconsistent state (duplicate proxy)");
+            previous = n;
+            ++visited;
+
+            check_invariant(n->right, n, previous, visited);
+        }
+
+        static void
+        invariant_violated(char const* message)
+        {
+            PyErr_SetString(PyExc_RuntimeError, message);
+            throw_error_already_set();
         }
 #endif
         
-        std::vector<PyObject*> proxies;
+        node_type* root;
+        size_type count;
+        container_type* container;
+        unsigned seed;
     };
             
-    // proxy_links holds a map of Container pointers (keys)
+    // proxy_links holds a hash map of Container pointers (keys)
     // with proxy_group(s) (data). Various functions manage 
     // the addition, removal and searching of proxies from 
-    // the map.
+    // the map. Containers are only in the map while they have
+    // proxies. The containers in the map are also counted in a
+    // small table indexed by a hash of their address, so that the
+    // map isn't searched for a container which has no proxies,
+    // unless it shares its slot with one which has.
     //
     template <class Proxy, class Container>
     class proxy_links
     {
     public:
     
-        typedef std::map<Container*, proxy_group<Proxy> > links_t;
+        typedef boost::unordered_map<Container*, proxy_group<Proxy> > links_t;
         typedef typename Proxy::index_type index_type;
 
+        proxy_links()
+        {
+            std::fill(with_proxies, with_proxies + slots, std::size_t(0));
+        }
+
         void
         remove(Proxy& proxy)
         {
             // Remove a proxy.
+            if (proxy.get_node() == 0)
+                return;
             typename links_t::iterator r = links.find(&proxy.get_container());
             if (r != links.end())
             {
                 r->second.remove(proxy);
-                if (r->second.size() == 0)
-                    links.erase(r);
+                erase_if_empty(r);
             }
         }
         
@@ -270,19 +497,23 @@ namespace boost { namespace python { namespace detail {
         add(PyObject* prox, Container& container)
         {
             // Add a proxy
-            links[&container].add(prox);
+            proxy_group<Proxy>& group = links[&container];
+            if (group.size() == 0)
+                ++with_proxies[slot(container)];
+            group.add(prox);
         }
         
         template <class NoSlice>
         void erase(Container& container, index_type i, NoSlice no_slice)
         {
             // Erase the proxy with index i 
+            if (!may_have_proxies(container))
+                return;
             typename links_t::iterator r = links.find(&container);
             if (r != links.end())
             {
                 r->second.erase(i, no_slice);
-                if (r->second.size() == 0)
-                    links.erase(r);
+                erase_if_empty(r);
             }
         }
         
@@ -290,12 +521,13 @@ namespace boost { namespace python { namespace detail {
         erase(Container& container, index_type from, index_type to)
         {
             // Erase all proxies with indexes from..to 
+            if (!may_have_proxies(container))
+                return;
             typename links_t::iterator r = links.find(&container);
             if (r != links.end())
             {
                 r->second.erase(from, to);
-                if (r->second.size() == 0)
-                    links.erase(r);
+                erase_if_empty(r);
             }
         }
 
@@ -311,12 +543,13 @@ namespace boost { namespace python { namespace detail {
             // procedure involves adjusting the indexes of 
             // the proxies.
 
+            if (!may_have_proxies(container))
+                return;
             typename links_t::iterator r = links.find(&container);
             if (r != links.end())
             {
                 r->second.replace(from, to, len);
-                if (r->second.size() == 0)
-                    links.erase(r);
+                erase_if_empty(r);
             }
         }
         
@@ -326,6 +559,8 @@ namespace boost { namespace python { namespace detail {
             // Find the proxy with *exact* index i.
             // Return 0 (null) if no proxy with the given 
             // index is found.
+            if (!may_have_proxies(container))
+                return 0;
             typename links_t::iterator r = links.find(&container);
             if (r != links.end())
                 return r->second.find(i);
@@ -333,8 +568,34 @@ namespace boost { namespace python { namespace detail {
         }
 
     private:
+
+        BOOST_STATIC_CONSTANT(std::size_t, slots = 256);
+
+        static std::size_t
+        slot(Container const& container)
+        {
+            std::size_t address = reinterpret_cast<std::size_t>(&container);
+            return ((address >> 4) ^ (address >> 12)) & (slots - 1);
+        }
+
+        bool
+        may_have_proxies(Container const& container) const
+        {
+            return with_proxies[slot(container)] != 0;
+        }
+
+        void
+        erase_if_empty(typename links_t::iterator r)
+        {
+            if (r->second.size() == 0)
+            {
+                --with_proxies[slot(*r->first)];
+                links.erase(r);
+            }
+        }
     
         links_t links;
+        std::size_t with_proxies[slots];
     };
     
     // container_element is our container proxy class.
@@ -359,18 +620,21 @@ namespace boost { namespace python { namespace detail {
         typedef Policies policies_type;
         typedef container_element<Container, Index, Policies> self_t;
         typedef proxy_group<self_t> links_type;
+        typedef proxy_node<Index> node_type;
         
         container_element(object container, Index index)
             : ptr()
             , container(container)
             , index(index)
+            , node(0)
         {
         }
             
         container_element(container_element const& ce)
           : ptr(ce.ptr.get() == 0 ? 0 : new element_type(*ce.ptr.get()))
           , container(ce.container)
-          , index(ce.index)
+          , index(ce.get_index())
+          , node(0)
         {
         }
 
@@ -384,14 +648,14 @@ namespace boost { namespace python { namespace detail {
         {
             if (is_detached())
                 return *get_pointer(ptr);
-            return Policies::get_item(get_container(), index);
+            return Policies::get_item(get_container(), get_index());
         }
         
         element_type* get() const
         {
             if (is_detached())
                 return get_pointer(ptr);
-            return &Policies::get_item(get_container(), index);
+            return &Policies::get_item(get_container(), get_index());
         }
         
         void
@@ -401,7 +665,7 @@ namespace boost { namespace python { namespace detail {
             {
                 ptr.reset(
                     new element_type(
-                        Policies::get_item(get_container(), index)));
+                        Policies::get_item(get_container(), get_index())));
                 container = object(); // free container. reset it to None
             }
         }
@@ -421,7 +685,9 @@ namespace boost { namespace python { namespace detail {
         Index 
         get_index() const
         {
-            return index;
+            // While the proxy is in its container's proxy_group,
+            // its index is kept by its node there.
+            return node != 0 ? links_type::index_of(node) : index;
         }
 
         void 
@@ -429,6 +695,18 @@ namespace boost { namespace python { namespace detail {
         {
             index = i;
         }
+
+        node_type*
+        get_node() const
+        {
+            return node;
+        }
+
+        void
+        set_node(node_type* n)
+        {
+            node = n;
+        }
  
         static proxy_links<self_t, Container>&
         get_links()
@@ -448,6 +726,7 @@ namespace boost { namespace python { namespace detail {
         scoped_ptr<element_type> ptr;
         object container;
         Index index;
+        node_type* node;
     };
 
     template <
@@ -579,11 +858,46 @@ namespace boost { namespace python { namespace detail {
         static object 
         base_get_slice(Container& container, PySliceObject* slice)
         { 
+            if (!is_unit_step(slice))
+            {
+                std::vector<Index> indexes;
+                base_get_step_slice_indexes(container, slice, indexes);
+                return DerivedPolicies::get_items(container, indexes);
+            }
+
             Index from, to;
             base_get_slice_data(container, slice, from, to);
             return DerivedPolicies::get_slice(container, from, to);
         }
 
+        static bool
+        is_unit_step(PySliceObject* slice)
+        {
+            return Py_None == slice->step || extract<long>(slice->step) == 1;
+        }
+
+        static void
+        base_get_step_slice_indexes(
+            Container& container, PySliceObject* slice, std::vector<Index>& indexes)
+        {
+            Py_ssize_t start, stop, step, length;
+            if (PySlice_GetIndicesEx(
+# if PY_VERSION_HEX >= 0x03020000
+                    reinterpret_cast<PyObject*>(slice)
+# else
+                    slice
+# endif
+                  , DerivedPolicies::get_max_index(container)
+                  , &start, &stop, &step, &length) < 0)
+            {
+                throw_error_already_set();
+            }
+
+            indexes.reserve(length);
+            for (Py_ssize_t k = 0; k < length; ++k)
+                indexes.push_back(Index(start + k * step));
+        }
+
         static void
         base_get_slice_data(
             Container& container, PySliceObject* slice, Index& from_, Index& to_)
@@ -628,13 +942,44 @@ namespace boost { namespace python { namespace detail {
         static void 
         base_set_slice(Container& container, PySliceObject* slice, PyObject* v)
         {
+            if (!is_unit_step(slice))
+            {
+                std::vector<Index> indexes;
+                base_get_step_slice_indexes(container, slice, indexes);
+                base_set_items(container, indexes, v);
+                return;
+            }
+
             Index from, to;
             base_get_slice_data(container, slice, from, to);
             
+            handle<> l_(python::borrowed(v));
+            object l(l_);
+
+            //  copy buffers of Data elements at once
+            buffer_view<Data const> elements = 
+                container_utils::contiguous_elements<Data>(l);
+            if (elements.owner())
+            {
+                //  unless they are the container's own elements, which
+                //  are copied out first
+                if (!container_utils::aliases(container, elements))
+                {
+                    base_check_resize(container, from, to, elements.size());
+                    ProxyHandler::base_replace_indexes(container, from, to, 
+                        elements.size());
+                    DerivedPolicies::set_slice(container, from, to, 
+                        elements.begin(), elements.end());
+                    return;
+                }
+                elements = buffer_view<Data const>();
+            }
+
             extract<Data&> elem(v);
             // try if elem is an exact Data
             if (elem.check())
             {
+                base_check_resize(container, from, to, 1);
                 ProxyHandler::base_replace_indexes(container, from, to, 1);
                 DerivedPolicies::set_slice(container, from, to, elem());
             }
@@ -644,42 +989,17 @@ namespace boost { namespace python { namespace detail {
                 extract<Data> elem(v);
                 if (elem.check())
                 {
+                    base_check_resize(container, from, to, 1);
                     ProxyHandler::base_replace_indexes(container, from, to, 1);
                     DerivedPolicies::set_slice(container, from, to, elem());
                 }
                 else
                 {
                     //  Otherwise, it must be a list or some container
-                    handle<> l_(python::borrowed(v));
-                    object l(l_);
-    
                     std::vector<Data> temp;
-                    for (int i = 0; i < l.attr("__len__")(); i++)
-                    {
-                        object elem(l[i]);
-                        extract<Data const&> x(elem);
-                        //  try if elem is an exact Data type
-                        if (x.check())
-                        {
-                            temp.push_back(x());
-                        }
-                        else
-                        {
-                            //  try to convert elem to Data type
-                            extract<Data> x(elem);
-                            if (x.check())
-                            {
-                                temp.push_back(x());
-                            }
-                            else
-                            {
-                                PyErr_SetString(PyExc_TypeError, 
-                                    "Invalid sequence element");
-                                throw_error_already_set();
-                            }
-                        }
-                    }          
+                    container_utils::extend_container(temp, l);
                   
+                    base_check_resize(container, from, to, temp.size());
                     ProxyHandler::base_replace_indexes(container, from, to, 
                         temp.end()-temp.begin());
                     DerivedPolicies::set_slice(container, from, to, 
@@ -691,11 +1011,239 @@ namespace boost { namespace python { namespace detail {
         static void 
         base_delete_slice(Container& container, PySliceObject* slice)
         { 
+            if (!is_unit_step(slice))
+            {
+                std::vector<Index> indexes;
+                base_get_step_slice_indexes(container, slice, indexes);
+                base_delete_items(container, indexes);
+                return;
+            }
+
             Index from, to;
             base_get_slice_data(container, slice, from, to);
+            if (from < to)
+                DerivedPolicies::check_resize(container);
             ProxyHandler::base_erase_indexes(container, from, to);
             DerivedPolicies::delete_slice(container, from, to);
         }  
+
+        // Replacing the elements from..to by len elements resizes the
+        // container unless there were len of them.
+        static void
+        base_check_resize(
+            Container& container, Index from, Index to, std::size_t len)
+        {
+            std::size_t replaced = from < to ? to - from : 0;
+            if (len != replaced)
+                DerivedPolicies::check_resize(container);
+        }
+
+        // Returns true iff i is an index array: a sequence of indexes,
+        // or a boolean mask, such as a list or a one dimensional NumPy
+        // array.
+        static bool
+        is_index_array(PyObject* i)
+        {
+            if (PyList_Check(i) || PyTuple_Check(i))
+                return true;
+
+# if PY_VERSION_HEX >= 0x02070000
+            if (!PyObject_CheckBuffer(i) || PyBytes_Check(i) || PyByteArray_Check(i))
+                return false;
+
+            handle<> view(allow_null(PyMemoryView_FromObject(i)));
+            if (!view)
+            {
+                PyErr_Clear();
+                return false;
+            }
+            return PyMemoryView_GET_BUFFER(view.get())->ndim == 1;
+# else
+            return false;
+# endif
+        }
+
+        static object
+        base_get_index_array(Container& container, PyObject* i)
+        {
+            std::vector<Index> indexes;
+            base_get_index_array_data(container, i, indexes);
+            return DerivedPolicies::get_items(container, indexes);
+        }
+
+        static void
+        base_set_index_array(Container& container, PyObject* i, PyObject* v)
+        {
+            std::vector<Index> indexes;
+            base_get_index_array_data(container, i, indexes);
+            base_set_items(container, indexes, v);
+        }
+
+        static void
+        base_delete_index_array(Container& container, PyObject* i)
+        {
+            std::vector<Index> indexes;
+            base_get_index_array_data(container, i, indexes);
+            base_delete_items(container, indexes);
+        }
+
+        static void
+        base_get_index_array_data(
+            Container& container, PyObject* i, std::vector<Index>& indexes)
+        {
+            handle<> l_(python::borrowed(i));
+            object l(l_);
+
+            //  read buffers of masks and indexes in place
+            buffer_view<bool const> mask = 
+                container_utils::contiguous_elements<bool>(l);
+            if (mask.owner())
+            {
+                base_get_mask_indexes(container, mask, indexes);
+                return;
+            }
+
+            buffer_view<ssize_t const> elements = 
+                container_utils::contiguous_elements<ssize_t>(l);
+            if (elements.owner())
+            {
+                indexes.reserve(elements.size());
+                for (std::size_t k = 0; k < elements.size(); ++k)
+                    indexes.push_back(base_convert_index(container, elements[k]));
+                return;
+            }
+
+            //  otherwise, convert the elements of the sequence
+            handle<> seq(PySequence_Fast(i, "Invalid index type"));
+            ssize_t n = PySequence_Fast_GET_SIZE(seq.get());
+            PyObject** items = PySequence_Fast_ITEMS(seq.get());
+
+            bool is_mask = n > 0;
+            for (ssize_t k = 0; is_mask && k < n; ++k)
+                is_mask = PyBool_Check(items[k]);
+            if (is_mask)
+            {
+                std::vector<bool> flags;
+                flags.reserve(n);
+                for (ssize_t k = 0; k < n; ++k)
+                    flags.push_back(items[k] == Py_True);
+                base_get_mask_indexes(container, flags, indexes);
+                return;
+            }
+
+            indexes.reserve(n);
+            for (ssize_t k = 0; k < n; ++k)
+            {
+                extract<long> index(items[k]);
+                if (!index.check())
+                {
+                    PyErr_SetString(PyExc_TypeError, "Invalid index type");
+                    throw_error_already_set();
+                }
+                indexes.push_back(base_convert_index(container, index()));
+            }
+        }
+
+        template <class Mask>
+        static void
+        base_get_mask_indexes(
+            Container& container, Mask const& mask, std::vector<Index>& indexes)
+        {
+            if (mask.size() != std::size_t(DerivedPolicies::get_max_index(container)))
+            {
+                PyErr_SetString(PyExc_IndexError, 
+                    "Boolean index does not match the length of the container");
+                throw_error_already_set();
+            }
+
+            for (std::size_t k = 0; k < mask.size(); ++k)
+            {
+                if (mask[k])
+                    indexes.push_back(Index(k));
+            }
+        }
+
+        static Index
+        base_convert_index(Container& container, long index)
+        {
+            long max_index = long(DerivedPolicies::get_max_index(container));
+            if (index < 0)
+                index += max_index;
+            if (index >= max_index || index < 0)
+            {
+                PyErr_SetString(PyExc_IndexError, "Index out of range");
+                throw_error_already_set();
+            }
+            return Index(index);
+        }
+
+        static void
+        base_set_items(
+            Container& container, std::vector<Index> const& indexes, PyObject* v)
+        {
+            extract<Data&> elem(v);
+            // try if elem is an exact Data, which is assigned to all
+            // the elements indexed
+            if (elem.check())
+            {
+                Data const value(elem());
+                base_assign_items(container, indexes, value);
+                return;
+            }
+
+            //  try to convert elem to Data
+            extract<Data> value(v);
+            if (value.check())
+            {
+                base_assign_items(container, indexes, value());
+                return;
+            }
+
+            //  Otherwise, it must be a sequence of as many elements
+            handle<> l_(python::borrowed(v));
+            object l(l_);
+            std::vector<Data> temp;
+            container_utils::extend_container(temp, l);
+
+            if (temp.size() != indexes.size())
+            {
+                PyErr_Format(PyExc_ValueError, 
+                    "attempt to assign sequence of size %lu to an index array "
+                    "or extended slice of size %lu"
+                  , static_cast<unsigned long>(temp.size())
+                  , static_cast<unsigned long>(indexes.size()));
+                throw_error_already_set();
+            }
+
+            for (std::size_t k = 0; k < indexes.size(); ++k)
+                DerivedPolicies::set_item(container, indexes[k], temp[k]);
+        }
+
+        static void
+        base_assign_items(
+            Container& container, std::vector<Index> const& indexes, Data const& v)
+        {
+            for (std::size_t k = 0; k < indexes.size(); ++k)
+                DerivedPolicies::set_item(container, indexes[k], v);
+        }
+
+        static void
+        base_delete_items(Container& container, std::vector<Index>& indexes)
+        {
+            std::sort(indexes.begin(), indexes.end());
+            indexes.erase(
+                std::unique(indexes.begin(), indexes.end()), indexes.end());
+            if (indexes.empty())
+                return;
+
+            DerivedPolicies::check_resize(container);
+            for (typename std::vector<Index>::reverse_iterator 
+                    p = indexes.rbegin(); p != indexes.rend(); ++p)
+            {
+                ProxyHandler::base_erase_index(container, *p, mpl::false_());
+            }
+            DerivedPolicies::delete_items(container, indexes);
+        }
     };
     
     template <
@@ -732,6 +1280,31 @@ namespace boost { namespace python { namespace detail {
         { 
             slicing_not_suported();
         }  
+
+        static bool
+        is_index_array(PyObject* /*i*/)
+        {
+            return false;
+        }
+
+        static object
+        base_get_index_array(Container& /*container*/, PyObject* /*i*/)
+        {
+            slicing_not_suported();
+            return object();
+        }
+
+        static void
+        base_set_index_array(Container& /*container*/, PyObject* /*i*/, PyObject* /*v*/)
+        {
+            slicing_not_suported();
+        }
+
+        static void
+        base_delete_index_array(Container& /*container*/, PyObject* /*i*/)
+        {
+            slicing_not_suported();
+        }
     };
 
 #ifdef BOOST_NO_ARGUMENT_DEPENDENT_LOOKUP
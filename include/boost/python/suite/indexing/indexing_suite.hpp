@@ -15,6 +15,7 @@
 # include <boost/mpl/or.hpp>
 # include <boost/mpl/not.hpp>
 # include <boost/type_traits/is_same.hpp>
+# include <vector>
 
 namespace boost { namespace python {
 
@@ -55,6 +56,12 @@ namespace boost { namespace python {
     //      static void
     //      delete_slice(Container& container, index_type from, index_type to);
     //
+    //      static object
+    //      get_items(Container& container, std::vector<index_type> const& indexes);
+    //
+    //      static void
+    //      delete_items(Container& container, std::vector<index_type> const& indexes);
+    //
     //      static size_t
     //      size(Container& container);
     //
@@ -70,6 +77,9 @@ namespace boost { namespace python {
     //          index_type to, size_type len
     //      );
     //
+    //      static void
+    //      check_resize(Container& container);
+    //
     // Most of these policies are self explanatory. convert_index and
     // adjust_index, however, deserves some explanation.
     //
@@ -94,6 +104,18 @@ namespace boost { namespace python {
     // the function should return the adjusted index when data in the
     // container at index from..to is replaced by *len* elements.
     //
+    // Containers supporting slices may also be indexed by stepped
+    // slices and index arrays: sequences of indexes or boolean masks,
+    // such as lists or one dimensional NumPy arrays. get_items returns
+    // a new container of the elements at the given indexes, in order,
+    // and delete_items deletes the elements at the given indexes, which
+    // are sorted and unique. By default, index arrays are rejected.
+    //
+    // check_resize is called before the container is expanded or
+    // contracted, and should raise a Python exception if it can't be
+    // right now (e.g. while its elements are viewed through the buffer
+    // protocol). By default, containers may always be resized.
+    //
 
     template <
           class Container
@@ -187,6 +209,7 @@ namespace boost { namespace python {
             ;
 
             DerivedPolicies::extension_def(cl);
+            DerivedPolicies::visit_options(*this, cl);
         }
 
         template <class Class>
@@ -197,8 +220,58 @@ namespace boost { namespace python {
             // no more extensions
         }
 
+        template <class Class>
+        static void
+        visit_options(indexing_suite const& /*suite*/, Class& /*cl*/)
+        {
+            // default.
+            // the suite has no options
+        }
+
+        static void
+        check_resize(Container& /*container*/)
+        {
+            // default.
+            // the container may always be resized
+        }
+
+        static object
+        get_items(Container& /*container*/, std::vector<Index> const& /*indexes*/)
+        {
+            // default.
+            // index arrays are not supported
+            index_arrays_not_supported();
+            return object();
+        }
+
+        static void
+        delete_items(Container& /*container*/, std::vector<Index> const& /*indexes*/)
+        {
+            // default.
+            // index arrays are not supported
+            index_arrays_not_supported();
+        }
+
+    protected:
+
+        // Detaches the proxies of the elements from..to, which are
+        // about to be replaced by as many other elements (e.g. when
+        // the container is sorted in place).
+        static void
+        base_replace_elements(Container& container, Index from, Index to)
+        {
+            proxy_handler::base_replace_indexes(container, from, to, to - from);
+        }
+
     private:
 
+        static void
+        index_arrays_not_supported()
+        {
+            PyErr_SetString(PyExc_TypeError, "Invalid index type");
+            throw_error_already_set();
+        }
+
         static object
         base_get_item(back_reference<Container&> container, PyObject* i)
         {
@@ -206,6 +279,9 @@ namespace boost { namespace python {
                 return slice_handler::base_get_slice(
                     container.get(), static_cast<PySliceObject*>(static_cast<void*>(i)));
 
+            if (slice_handler::is_index_array(i))
+                return slice_handler::base_get_index_array(container.get(), i);
+
             return proxy_handler::base_get_item_(container, i);
         }
 
@@ -217,6 +293,10 @@ namespace boost { namespace python {
                  slice_handler::base_set_slice(container,
                      static_cast<PySliceObject*>(static_cast<void*>(i)), v);
             }
+            else if (slice_handler::is_index_array(i))
+            {
+                slice_handler::base_set_index_array(container, i, v);
+            }
             else
             {
                 extract<Data&> elem(v);
@@ -258,7 +338,14 @@ namespace boost { namespace python {
                 return;
             }
 
+            if (slice_handler::is_index_array(i))
+            {
+                slice_handler::base_delete_index_array(container, i);
+                return;
+            }
+
             Index index = DerivedPolicies::convert_index(container, i);
+            DerivedPolicies::check_resize(container);
             proxy_handler::base_erase_index(container, index, mpl::bool_<NoSlice>());
             DerivedPolicies::delete_item(container, index);
         }
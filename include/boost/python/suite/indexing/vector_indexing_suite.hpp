@@ -9,12 +9,25 @@
 # include <boost/python/suite/indexing/indexing_suite.hpp>
 # include <boost/python/suite/indexing/container_utils.hpp>
 # include <boost/python/iterator.hpp>
+# include <boost/python/args.hpp>
+# include <boost/python/buffer_protocol.hpp>
+# include <boost/python/buffer_view.hpp>
+# include <boost/python/ssize_t.hpp>
+# include <boost/type_traits/has_less.hpp>
+# include <boost/type_traits/is_pod.hpp>
+# include <boost/unordered_map.hpp>
+# include <algorithm>
+# include <cstddef>
+# include <vector>
 
 namespace boost { namespace python {
             
-    // Forward declaration
+    // Forward declarations
     template <class Container, bool NoProxy, class DerivedPolicies>
     class vector_indexing_suite;
+
+    template <class Container, bool NoProxy, class DerivedPolicies>
+    class vector_search_methods;
     
     namespace detail
     {
@@ -22,6 +35,147 @@ namespace boost { namespace python {
         class final_vector_derived_policies 
             : public vector_indexing_suite<Container, 
                 NoProxy, final_vector_derived_policies<Container, NoProxy> > {};
+
+        // vector_buffer_exportable<Container>::value is true iff the
+        // elements of a Container are stored contiguously and can be
+        // exported through the buffer protocol. Specialize it for other
+        // vector like containers.
+        template <class Container>
+        struct vector_buffer_exportable : mpl::false_ {};
+
+        template <class T, class Allocator>
+        struct vector_buffer_exportable<std::vector<T, Allocator> >
+            : mpl::bool_<
+                converter::has_buffer_element<T>::value || is_pod<T>::value> {};
+
+        template <class Allocator>
+        struct vector_buffer_exportable<std::vector<bool, Allocator> >
+            : mpl::false_ {};
+
+        // Counts the buffers exported by each container, which must not
+        // be resized until they are released.
+        template <class Container>
+        struct vector_buffer_pins
+        {
+            typedef boost::unordered_map<Container const*, std::size_t> map_type;
+
+            static void pin(Container const& container)
+            {
+                ++counts()[&container];
+            }
+
+            static void unpin(Container const& container)
+            {
+                typename map_type::iterator p = counts().find(&container);
+                if (p != counts().end() && --p->second == 0)
+                    counts().erase(p);
+            }
+
+            static bool pinned(Container const& container)
+            {
+                return !counts().empty()
+                    && counts().find(&container) != counts().end();
+            }
+
+         private:
+            static map_type& counts()
+            {
+                static map_type pins;
+                return pins;
+            }
+        };
+
+        // The struct module format of the elements: their own, or
+        // opaque bytes for other POD types.
+        template <class T>
+        char const* vector_buffer_format(mpl::true_)
+        {
+            return converter::buffer_element<T>::format();
+        }
+
+        template <class T>
+        char const* vector_buffer_format(mpl::false_)
+        {
+            static char format[32] = "";
+            if (format[0] == '\0')
+            {
+                PyOS_snprintf(format, sizeof(format), "%lus"
+                  , static_cast<unsigned long>(sizeof(T)));
+            }
+            return format;
+        }
+
+        // Orders elements by operator<, in reverse
+        template <class T>
+        struct reverse_less
+        {
+            bool operator()(T const& a, T const& b) const
+            {
+                return b < a;
+            }
+        };
+
+        // Orders the positions of Python objects by comparing the
+        // objects, in reverse if reverse is true.
+        struct python_position_less
+        {
+            python_position_less(std::vector<object> const& keys, bool reverse)
+                : keys(keys), reverse(reverse)
+            {}
+
+            bool operator()(std::size_t a, std::size_t b) const
+            {
+                return reverse ? less(keys[b], keys[a]) : less(keys[a], keys[b]);
+            }
+
+            static bool less(object const& a, object const& b)
+            {
+                int result = PyObject_RichCompareBool(a.ptr(), b.ptr(), Py_LT);
+                if (result < 0)
+                    throw_error_already_set();
+                return result != 0;
+            }
+
+            std::vector<object> const& keys;
+            bool reverse;
+        };
+
+# if PY_VERSION_HEX >= 0x02060000
+        // Exports the elements of the wrapped vector in place, as a
+        // writable one-dimensional buffer.
+        template <class Container>
+        struct vector_buffer_exporter : objects::buffer_exporter
+        {
+            typedef typename Container::value_type data_type;
+
+            int get_buffer(PyObject* self, Py_buffer* view, int flags) const
+            {
+                Container& container = extract<Container&>(self);
+
+                static data_type no_elements[1];
+                std::vector<ssize_t> shape(1, container.size());
+                int result = objects::fill_buffer(
+                    self, view, flags
+                  , container.empty() ? no_elements : &container[0]
+                  , false
+                  , vector_buffer_format<data_type>(
+                        converter::has_buffer_element<data_type>())
+                  , sizeof(data_type)
+                  , shape, std::vector<ssize_t>());
+
+                if (result == 0)
+                    vector_buffer_pins<Container>::pin(container);
+                return result;
+            }
+
+            void release_buffer(PyObject* self, Py_buffer* /*view*/) const
+            {
+                extract<Container&> container(self);
+                if (container.check())
+                    vector_buffer_pins<Container>::unpin(container());
+            }
+        };
+# endif
     }
 
     // The vector_indexing_suite class is a predefined indexing_suite derived 
@@ -40,6 +194,15 @@ namespace boost { namespace python {
     // By default indexed elements are returned by proxy. This can be
     // disabled by supplying *true* in the NoProxy template parameter.
     //
+    // Supplying *true* to the constructor makes the wrapped vector
+    // export its elements in place through the buffer protocol, if
+    // they are arithmetic or POD types, so that memoryview(v) and
+    // numpy.asarray(v) don't copy them. The vector can't be resized
+    // while such views exist.
+    //
+    // See vector_search_methods below for sort, bisect and search
+    // methods.
+    //
     template <
         class Container, 
         bool NoProxy = false,
@@ -55,6 +218,10 @@ namespace boost { namespace python {
         typedef typename Container::size_type index_type;
         typedef typename Container::size_type size_type;
         typedef typename Container::difference_type difference_type;
+
+        explicit vector_indexing_suite(bool export_buffer = false)
+            : m_export_buffer(export_buffer)
+        {}
         
         template <class Class>
         static void 
@@ -65,6 +232,27 @@ namespace boost { namespace python {
                 .def("extend", &base_extend)
             ;
         }
+
+        template <class Suite, class Class>
+        static void
+        visit_options(Suite const& suite, Class& cl)
+        {
+            if (static_cast<vector_indexing_suite const&>(suite).m_export_buffer)
+                add_buffer_exporter(cl, detail::vector_buffer_exportable<Container>());
+        }
+
+        static void
+        check_resize(Container& container)
+        {
+            if (detail::vector_buffer_pins<Container>::pinned(container))
+            {
+# if PY_VERSION_HEX >= 0x02060000
+                PyErr_SetString(PyExc_BufferError, 
+                    "Existing exports of data: object cannot be re-sized");
+                throw_error_already_set();
+# endif
+            }
+        }
         
         static 
         typename mpl::if_<
@@ -133,6 +321,39 @@ namespace boost { namespace python {
             }
             container.erase(container.begin()+from, container.begin()+to);
         }
+
+        static object
+        get_items(Container& container, std::vector<index_type> const& indexes)
+        {
+            Container result;
+            container_utils::reserve_more(result, indexes.size());
+            for (typename std::vector<index_type>::const_iterator 
+                    i = indexes.begin(); i != indexes.end(); ++i)
+            {
+                result.push_back(container[*i]);
+            }
+            return object(result);
+        }
+
+        static void
+        delete_items(Container& container, std::vector<index_type> const& indexes)
+        {
+            if (indexes.empty())
+                return;
+
+            // Move the elements kept over the deleted ones in one pass
+            typename std::vector<index_type>::const_iterator 
+                next = indexes.begin();
+            index_type to = indexes.front();
+            for (index_type from = to; from < container.size(); ++from)
+            {
+                if (next != indexes.end() && *next == from)
+                    ++next;
+                else
+                    container[to++] = container[from];
+            }
+            container.erase(container.begin()+to, container.end());
+        }
         
         static size_t
         size(Container& container)
@@ -201,10 +422,33 @@ namespace boost { namespace python {
         }
         
     private:
+
+        template <class Class>
+        static void
+        add_buffer_exporter(Class& cl, mpl::true_)
+        {
+# if PY_VERSION_HEX >= 0x02060000
+            objects::add_buffer_exporter(cl, 
+                new detail::vector_buffer_exporter<Container>());
+# else
+            add_buffer_exporter(cl, mpl::false_());
+# endif
+        }
+
+        template <class Class>
+        static void
+        add_buffer_exporter(Class& /*cl*/, mpl::false_)
+        {
+            PyErr_SetString(PyExc_TypeError, 
+                "The container can't export its elements as a buffer");
+            throw_error_already_set();
+        }
     
         static void
         base_append(Container& container, object v)
         {
+            DerivedPolicies::check_resize(container);
+
             extract<data_type&> elem(v);
             // try if elem is an exact Data
             if (elem.check())
@@ -231,10 +475,267 @@ namespace boost { namespace python {
         static void
         base_extend(Container& container, object v)
         {
+            DerivedPolicies::check_resize(container);
+
+            //  copy buffers of data_type elements at once, unless they
+            //  are the container's own elements, which are copied out
+            //  first
+            {
+                buffer_view<data_type const> elements = 
+                    container_utils::contiguous_elements<data_type>(v);
+                if (elements.owner() 
+                    && !container_utils::aliases(container, elements))
+                {
+                    DerivedPolicies::extend(container, elements.begin(), elements.end());
+                    return;
+                }
+            }
+
             std::vector<data_type> temp;
             container_utils::extend_container(temp, v);
             DerivedPolicies::extend(container, temp.begin(), temp.end());
         }
+
+        typedef mpl::bool_<has_less<data_type>::value> has_less_;
+
+        static object
+        element_object(Container& container, index_type i)
+        {
+            // Comparing in Python may run code changing the container
+            if (i >= container.size())
+            {
+                PyErr_SetString(PyExc_IndexError, "Index out of range");
+                throw_error_already_set();
+            }
+            return object(data_type(container[i]));
+        }
+
+        static void
+        base_sort(Container& container, object key, bool reverse)
+        {
+            if (key.ptr() == Py_None)
+                base_sort_elements(container, reverse, has_less_());
+            else
+                base_sort_by_key(container, key, reverse);
+        }
+
+        static void
+        base_sort_elements(Container& container, bool reverse, mpl::true_)
+        {
+            DerivedPolicies::base_replace_elements(
+                container, 0, DerivedPolicies::size(container));
+            // stable, as list.sort is
+            if (reverse)
+            {
+                std::stable_sort(container.begin(), container.end()
+                  , detail::reverse_less<data_type>());
+            }
+            else
+            {
+                std::stable_sort(container.begin(), container.end());
+            }
+        }
+
+        static void
+        base_sort_elements(Container& container, bool reverse, mpl::false_)
+        {
+            // Without operator<, the elements are compared in Python
+            base_sort_by_key(container, object(), reverse);
+        }
+
+        static void
+        base_sort_by_key(Container& container, object key, bool reverse)
+        {
+            // Decorate the elements with their keys, computed once,
+            // sort their positions by key, and undecorate
+            index_type n = container.size();
+            std::vector<object> keys;
+            keys.reserve(n);
+            for (index_type i = 0; i < n; ++i)
+                keys.push_back(element_object(container, i));
+            if (key.ptr() != Py_None)
+            {
+                for (index_type i = 0; i < n; ++i)
+                    keys[i] = key(keys[i]);
+            }
+
+            std::vector<index_type> positions(n);
+            for (index_type i = 0; i < n; ++i)
+                positions[i] = i;
+            std::stable_sort(positions.begin(), positions.end()
+              , detail::python_position_less(keys, reverse));
+
+            if (container.size() != n)
+            {
+                PyErr_SetString(PyExc_ValueError, "vector modified during sort");
+                throw_error_already_set();
+            }
+
+            // The elements are copied back in place, rather than
+            // swapped, so that buffers exported stay valid
+            std::vector<data_type> sorted;
+            sorted.reserve(n);
+            for (index_type i = 0; i < n; ++i)
+                sorted.push_back(container[positions[i]]);
+            DerivedPolicies::base_replace_elements(container, 0, n);
+            std::copy(sorted.begin(), sorted.end(), container.begin());
+        }
+
+        static index_type
+        base_bisect_left(Container& container, object x)
+        {
+            return base_bisect(container, x, false);
+        }
+
+        static index_type
+        base_bisect_right(Container& container, object x)
+        {
+            return base_bisect(container, x, true);
+        }
+
+        static index_type
+        base_bisect(Container& container, object x, bool right)
+        {
+            extract<data_type const&> elem(x);
+            //  try if x is an exact data_type
+            if (elem.check())
+                return base_bisect(container, elem(), right, has_less_());
+
+            //  try to convert x to data_type
+            extract<data_type> value(x);
+            if (value.check())
+                return base_bisect(container, value(), right, has_less_());
+
+            return base_bisect_python(container, x, right);
+        }
+
+        static index_type
+        base_bisect(Container& container, data_type const& x, bool right, mpl::true_)
+        {
+            return (right 
+                ? std::upper_bound(container.begin(), container.end(), x)
+                : std::lower_bound(container.begin(), container.end(), x)
+            ) - container.begin();
+        }
+
+        static index_type
+        base_bisect(Container& container, data_type const& x, bool right, mpl::false_)
+        {
+            return base_bisect_python(container, object(x), right);
+        }
+
+        static index_type
+        base_bisect_python(Container& container, object const& x, bool right)
+        {
+            // As the bisect module does, comparing only with <
+            index_type lo = 0, hi = container.size();
+            while (lo < hi)
+            {
+                index_type mid = lo + (hi - lo) / 2;
+                bool before = right 
+                    ? !detail::python_position_less::less(x, element_object(container, mid))
+                    : detail::python_position_less::less(element_object(container, mid), x);
+                if (before)
+                    lo = mid + 1;
+                else
+                    hi = mid;
+            }
+            return lo;
+        }
+
+        static index_type
+        base_index(Container& container, object x)
+        {
+            extract<data_type const&> elem(x);
+            //  try if x is an exact data_type
+            if (elem.check())
+                return base_find_index(container, elem());
+
+            //  try to convert x to data_type
+            extract<data_type> value(x);
+            if (value.check())
+                return base_find_index(container, value());
+
+            PyErr_SetString(PyExc_ValueError, "vector.index(x): x not in vector");
+            throw_error_already_set();
+            return index_type();
+        }
+
+        static index_type
+        base_find_index(Container& container, data_type const& x)
+        {
+            typename Container::iterator i = 
+                std::find(container.begin(), container.end(), x);
+            if (i == container.end())
+            {
+                PyErr_SetString(PyExc_ValueError, "vector.index(x): x not in vector");
+                throw_error_already_set();
+            }
+            return i - container.begin();
+        }
+
+        static size_type
+        base_count(Container& container, object x)
+        {
+            extract<data_type const&> elem(x);
+            //  try if x is an exact data_type
+            if (elem.check())
+                return std::count(container.begin(), container.end(), elem());
+
+            //  try to convert x to data_type
+            extract<data_type> value(x);
+            if (value.check())
+                return std::count(container.begin(), container.end(), value());
+
+            return 0;
+        }
+
+        template <class C, bool N, class D> friend class vector_search_methods;
+
+        bool m_export_buffer;
+    };
+
+    // The vector_search_methods class adds sort(key=None, reverse=False),
+    // bisect_left(x), bisect_right(x), index(x) and count(x) methods to a
+    // vector wrapped by the vector_indexing_suite with the same template
+    // parameters. Example usage:
+    //
+    //      class_<std::vector<double> >("DoubleVec")
+    //          .def(vector_indexing_suite<std::vector<double> >())
+    //          .def(vector_search_methods<std::vector<double> >())
+    //      ;
+    //
+    // The elements are compared in C++ with operator< and operator==
+    // where possible, and through Python otherwise. A key is called
+    // once per element.
+    //
+    template <
+        class Container, 
+        bool NoProxy = false,
+        class DerivedPolicies 
+            = detail::final_vector_derived_policies<Container, NoProxy> >
+    class vector_search_methods
+        : public def_visitor<
+            vector_search_methods<Container, NoProxy, DerivedPolicies> >
+    {
+    private:
+
+        typedef vector_indexing_suite<Container, NoProxy, DerivedPolicies> suite;
+
+        friend class def_visitor_access;
+
+        template <class Class>
+        void visit(Class& cl) const
+        {
+            cl
+                .def("sort", &suite::base_sort, 
+                    (python::arg("key") = object(), python::arg("reverse") = false))
+                .def("bisect_left", &suite::base_bisect_left)
+                .def("bisect_right", &suite::base_bisect_right)
+                .def("index", &suite::base_index)
+                .def("count", &suite::base_count)
+            ;
+        }
     };
        
 }} // namespace boost::python 
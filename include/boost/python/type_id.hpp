@@ -11,6 +11,7 @@
 # include <boost/operators.hpp>
 # include <typeinfo>
 # include <cstring>
+# include <cstddef>
 # include <ostream>
 # include <boost/static_assert.hpp>
 # include <boost/detail/workaround.hpp>
@@ -53,6 +54,9 @@ struct type_info : private totally_ordered<type_info>
     inline bool operator<(type_info const& rhs) const;
     inline bool operator==(type_info const& rhs) const;
 
+    // A hash value consistent with operator==
+    inline std::size_t hash() const;
+
     char const* name() const;
     friend BOOST_PYTHON_DECL std::ostream& operator<<(
         std::ostream&, type_info const&);
@@ -140,6 +144,23 @@ inline bool type_info::operator==(type_info const& rhs) const
 #  endif 
 }
 
+inline std::size_t type_info::hash() const
+{
+    // Equal types may be represented by distinct std::type_info
+    // objects, but their names always match.
+    char const* raw_name
+        = m_base_type
+#  ifndef BOOST_PYTHON_TYPE_ID_NAME
+          ->name()
+#  endif
+        ;
+
+    std::size_t result = 2166136261u;
+    for (; *raw_name; ++raw_name)
+        result = (result ^ static_cast<unsigned char>(*raw_name)) * 16777619u;
+    return result;
+}
+
 #  ifdef BOOST_PYTHON_HAVE_GCC_CP_DEMANGLE
 namespace detail
 {
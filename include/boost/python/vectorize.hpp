@@ -0,0 +1,341 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#ifndef VECTORIZE_AGENT20261017_HPP
+# define VECTORIZE_AGENT20261017_HPP
+
+# include <boost/python/detail/prefix.hpp>
+# include <boost/python/buffer_view.hpp>
+# include <boost/python/default_call_policies.hpp>
+# include <boost/python/object_core.hpp>
+# include <boost/python/ssize_t.hpp>
+# include <boost/python/arg_from_python.hpp>
+# include <boost/python/detail/allow_threads.hpp>
+# include <boost/python/detail/caller.hpp>
+# include <boost/python/detail/preprocessor.hpp>
+# include <boost/python/detail/scope.hpp>
+# include <boost/python/detail/signature.hpp>
+# include <boost/python/object/function_object.hpp>
+# include <boost/python/object/py_function.hpp>
+
+# include <boost/preprocessor/repetition/enum.hpp>
+# include <boost/preprocessor/repetition/enum_trailing.hpp>
+# include <boost/preprocessor/repetition/enum_trailing_params.hpp>
+# include <boost/preprocessor/repetition/repeat.hpp>
+# include <boost/preprocessor/repetition/repeat_from_to.hpp>
+# include <boost/preprocessor/arithmetic/inc.hpp>
+
+# include <boost/mpl/at.hpp>
+# include <boost/mpl/front.hpp>
+# include <boost/mpl/size.hpp>
+# include <boost/noncopyable.hpp>
+# include <boost/type_traits/alignment_of.hpp>
+# include <boost/type_traits/remove_cv.hpp>
+# include <boost/type_traits/remove_reference.hpp>
+
+# include <cstring>
+# include <vector>
+
+// Calls of vectorized functions computing at least this many elements
+// release the GIL while the wrapped function runs.
+# ifndef BOOST_PYTHON_VECTORIZE_GIL_THRESHOLD
+#  define BOOST_PYTHON_VECTORIZE_GIL_THRESHOLD 4096
+# endif
+
+# if PY_VERSION_HEX >= 0x02070000
+
+namespace boost { namespace python {
+
+namespace detail
+{
+  // The arguments of a call to a vectorized function, broadcast
+  // against each other as NumPy does. Arguments exporting a buffer are
+  // arrays; the others are scalars, whose converted values are
+  // supplied with set_scalar(). The result has the broadcast shape, and
+  // is traversed in C order one row, along the last axis, at a time.
+  class BOOST_PYTHON_DECL vectorized_operands : boost::noncopyable
+  {
+   public:
+      // Returns true iff one of args exports a buffer of at least one
+      // dimension.
+      static bool any_array(PyObject* args);
+
+      // Gets the buffers of the arrays in args. Raises ValueError if
+      // their shapes can't be broadcast together.
+      explicit vectorized_operands(PyObject* args);
+      ~vectorized_operands();
+
+      bool is_array(std::size_t i) const { return m_operands[i].is_array; }
+      char const* format(std::size_t i) const;
+      ssize_t itemsize(std::size_t i) const { return m_operands[i].buffer.itemsize; }
+
+      // The struct module code of the elements of array i. Raises
+      // TypeError unless they are booleans, integers or floating point
+      // numbers of a native size and byte order.
+      char code(std::size_t i) const;
+
+      // True iff every element of array i is aligned to the given
+      // boundary.
+      bool aligned(std::size_t i, std::size_t alignment) const;
+
+      // Broadcasts the value of scalar i
+      void set_scalar(std::size_t i, void const* value)
+      {
+          m_operands[i].data = static_cast<char const*>(value);
+      }
+
+      // The number of elements of the result
+      ssize_t size() const;
+
+      ssize_t rows() const;
+      ssize_t row_length() const;
+
+      // The address of the first element of operand i in row r of the
+      // result, and the distance in bytes between its elements along
+      // the row.
+      char const* row(std::size_t i, ssize_t r) const;
+      ssize_t step(std::size_t i) const
+      {
+          return m_shape.empty() ? 0 : m_operands[i].strides.back();
+      }
+
+      // Returns a new writable array of the result's shape, of elements
+      // with the given format and size, in C order, storing the address
+      // of its first element in *data.
+      object allocate_result(char const* format, ssize_t itemsize, void** data) const;
+
+   private:
+      void broadcast(PyObject* args);
+      void release();
+
+      struct operand
+      {
+          operand() : is_array(false), data(0) {}
+
+          bool is_array;
+          Py_buffer buffer;
+          char const* data;
+          // The strides along each axis of the result; 0 along the axes
+          // the operand is broadcast along.
+          std::vector<ssize_t> strides;
+      };
+
+      std::vector<operand> m_operands;
+      std::vector<ssize_t> m_shape;
+  };
+
+  template <class T, class U>
+  T read_vectorized_element(char const* p)
+  {
+      U u;
+      std::memcpy(&u, p, sizeof(U));
+      return static_cast<T>(u);
+  }
+
+  // Returns a function reading an element with the given struct module
+  // code, as a T.
+  template <class T>
+  T (*vectorized_element_reader(char code))(char const*)
+  {
+      switch (code)
+      {
+      case '?': return &read_vectorized_element<T, bool>;
+      case 'b': return &read_vectorized_element<T, signed char>;
+      case 'B': return &read_vectorized_element<T, unsigned char>;
+      case 'h': return &read_vectorized_element<T, short>;
+      case 'H': return &read_vectorized_element<T, unsigned short>;
+      case 'i': return &read_vectorized_element<T, int>;
+      case 'I': return &read_vectorized_element<T, unsigned int>;
+      case 'l': return &read_vectorized_element<T, long>;
+      case 'L': return &read_vectorized_element<T, unsigned long>;
+# ifdef HAVE_LONG_LONG
+      case 'q': return &read_vectorized_element<T, BOOST_PYTHON_LONG_LONG>;
+      case 'Q': return &read_vectorized_element<T, unsigned BOOST_PYTHON_LONG_LONG>;
+# endif
+      case 'n': return &read_vectorized_element<T, ssize_t>;
+      case 'N': return &read_vectorized_element<T, std::size_t>;
+      case 'f': return &read_vectorized_element<T, float>;
+      case 'd': return &read_vectorized_element<T, double>;
+      case 'g': return &read_vectorized_element<T, long double>;
+      }
+      return 0;
+  }
+
+  // True iff operand i of a vectorized call can be read in place as
+  // elements of type T.
+  template <class T>
+  bool vectorized_operand_is_exact(vectorized_operands const& operands, std::size_t i)
+  {
+      return !operands.is_array(i)
+          || (converter::buffer_format_matches(
+                  operands.format(i), operands.itemsize(i)
+                , converter::buffer_element<T>::kind, sizeof(T))
+              && operands.aligned(i, alignment_of<T>::value));
+  }
+
+  template <class Sig, int N>
+  struct vectorized_argument
+      : remove_cv<typename remove_reference<typename mpl::at_c<Sig, N + 1>::type>::type>
+  {};
+
+  template <unsigned Arity> struct vectorized_loop;
+
+# define BOOST_PYTHON_VECTORIZED_ARGUMENT(z, n, _)                                      \
+      typedef typename vectorized_argument<Sig, n>::type A##n;                          \
+      A##n v##n = A##n();                                                               \
+      if (!operands.is_array(n))                                                        \
+      {                                                                                 \
+          arg_from_python<A##n> c##n(PyTuple_GET_ITEM(args, n));                        \
+          if (!c##n.convertible())                                                      \
+              return 0;                                                                 \
+          v##n = c##n();                                                                \
+          operands.set_scalar(n, &v##n);                                                \
+      }                                                                                 \
+      exact = exact && vectorized_operand_is_exact<A##n>(operands, n);
+
+# define BOOST_PYTHON_VECTORIZED_READER(z, n, _)                                        \
+      A##n (*read##n)(char const*) = exact ? 0                                          \
+          : operands.is_array(n) ? vectorized_element_reader<A##n>(operands.code(n))    \
+          : &read_vectorized_element<A##n, A##n>;
+
+# define BOOST_PYTHON_VECTORIZED_READER_PARAM(z, n, _) A##n (*read##n)(char const*)
+
+# define BOOST_PYTHON_VECTORIZED_ROW(z, n, _)                                           \
+      char const* p##n = operands.row(n, r);                                            \
+      ssize_t const s##n = operands.step(n);
+
+# define BOOST_PYTHON_VECTORIZED_EXACT(z, n, _)                                         \
+      *reinterpret_cast<A##n const*>(p##n + k * s##n)
+
+# define BOOST_PYTHON_VECTORIZED_CONVERT(z, n, _)                                       \
+      read##n(p##n + k * s##n)
+
+# define BOOST_PYTHON_VECTORIZED_LOOP(z, n, _)                                          \
+  template <>                                                                           \
+  struct vectorized_loop<n>                                                             \
+  {                                                                                     \
+      template <class R, class F BOOST_PP_ENUM_TRAILING_PARAMS_Z(z, n, class A)>        \
+      static void exact_loop(F f, vectorized_operands const& operands, R* result)       \
+      {                                                                                 \
+          ssize_t const length = operands.row_length();                                 \
+          for (ssize_t r = 0; r < operands.rows(); ++r, result += length)               \
+          {                                                                             \
+              BOOST_PP_REPEAT_ ## z(n, BOOST_PYTHON_VECTORIZED_ROW, _)                  \
+              for (ssize_t k = 0; k < length; ++k)                                      \
+                  result[k] = f(BOOST_PP_ENUM_ ## z(n, BOOST_PYTHON_VECTORIZED_EXACT, _)); \
+          }                                                                             \
+      }                                                                                 \
+                                                                                        \
+      template <class R, class F BOOST_PP_ENUM_TRAILING_PARAMS_Z(z, n, class A)>        \
+      static void convert_loop(                                                         \
+          F f, vectorized_operands const& operands, R* result                           \
+          BOOST_PP_ENUM_TRAILING_ ## z(n, BOOST_PYTHON_VECTORIZED_READER_PARAM, _))     \
+      {                                                                                 \
+          ssize_t const length = operands.row_length();                                 \
+          for (ssize_t r = 0; r < operands.rows(); ++r, result += length)               \
+          {                                                                             \
+              BOOST_PP_REPEAT_ ## z(n, BOOST_PYTHON_VECTORIZED_ROW, _)                  \
+              for (ssize_t k = 0; k < length; ++k)                                      \
+                  result[k] = f(BOOST_PP_ENUM_ ## z(n, BOOST_PYTHON_VECTORIZED_CONVERT, _)); \
+          }                                                                             \
+      }                                                                                 \
+                                                                                        \
+      template <class R, class Sig, class F>                                            \
+      static PyObject* call(F f, PyObject* args)                                        \
+      {                                                                                 \
+          vectorized_operands operands(args);                                           \
+          bool exact = true;                                                            \
+          BOOST_PP_REPEAT_ ## z(n, BOOST_PYTHON_VECTORIZED_ARGUMENT, _)                 \
+                                                                                        \
+          void* data;                                                                   \
+          object result(                                                                \
+              operands.allocate_result(                                                 \
+                  converter::buffer_element<R>::format(), sizeof(R), &data));           \
+          BOOST_PP_REPEAT_ ## z(n, BOOST_PYTHON_VECTORIZED_READER, _)                   \
+                                                                                        \
+          allow_threads unlocked(operands.size() >= BOOST_PYTHON_VECTORIZE_GIL_THRESHOLD); \
+          if (exact)                                                                    \
+              exact_loop<R, F BOOST_PP_ENUM_TRAILING_PARAMS_Z(z, n, A)>(                \
+                  f, operands, static_cast<R*>(data));                                  \
+          else                                                                          \
+              convert_loop<R, F BOOST_PP_ENUM_TRAILING_PARAMS_Z(z, n, A)>(              \
+                  f, operands, static_cast<R*>(data)                                    \
+                  BOOST_PP_ENUM_TRAILING_PARAMS_Z(z, n, read));                         \
+          return python::incref(result.ptr());                                          \
+      }                                                                                 \
+  };
+
+  BOOST_PP_REPEAT_FROM_TO(1, BOOST_PP_INC(BOOST_PYTHON_MAX_ARITY), BOOST_PYTHON_VECTORIZED_LOOP, _)
+
+# undef BOOST_PYTHON_VECTORIZED_LOOP
+# undef BOOST_PYTHON_VECTORIZED_CONVERT
+# undef BOOST_PYTHON_VECTORIZED_EXACT
+# undef BOOST_PYTHON_VECTORIZED_ROW
+# undef BOOST_PYTHON_VECTORIZED_READER_PARAM
+# undef BOOST_PYTHON_VECTORIZED_READER
+# undef BOOST_PYTHON_VECTORIZED_ARGUMENT
+
+  // Calls f element by element when any argument is an array, and
+  // otherwise exactly as the function wrapped by make_function(f) does.
+  template <class F, class Sig>
+  struct vectorized_caller
+  {
+      typedef caller<F, default_call_policies, Sig> scalar_caller;
+      typedef typename mpl::front<Sig>::type result_type;
+      BOOST_STATIC_CONSTANT(unsigned, arity = mpl::size<Sig>::value - 1);
+
+      vectorized_caller(F f)
+          : m_f(f), m_caller(f, default_call_policies())
+      {}
+
+      PyObject* operator()(PyObject* args, PyObject* kw)
+      {
+          if ((kw && PyDict_Size(kw) != 0)
+              || PyTuple_GET_SIZE(args) != static_cast<ssize_t>(arity)
+              || !vectorized_operands::any_array(args))
+          {
+              return m_caller(args, kw);
+          }
+          return vectorized_loop<arity>::template call<result_type, Sig>(m_f, args);
+      }
+
+      static unsigned min_arity() { return scalar_caller::min_arity(); }
+      static py_func_sig_info signature() { return scalar_caller::signature(); }
+
+   private:
+      F m_f;
+      scalar_caller m_caller;
+  };
+
+  template <class F, class Sig>
+  object make_vectorized_aux(F f, Sig)
+  {
+      return objects::function_object(
+          objects::py_function(vectorized_caller<F, Sig>(f)));
+  }
+}
+
+// Returns a Python function which calls f, a function taking and
+// returning arithmetic values, like make_function(f) when its
+// arguments are scalars. When any argument exports a buffer, the
+// arguments are broadcast together as NumPy does, and f is applied to
+// each set of elements in a C++ loop, returning a new array of the
+// results. The GIL is released meanwhile for large arrays.
+template <class F>
+object make_vectorized(F f)
+{
+    return detail::make_vectorized_aux(f, detail::get_signature(f));
+}
+
+template <class F>
+void def_vectorized(char const* name, F f, char const* doc = 0)
+{
+    detail::scope_setattr_doc(name, make_vectorized(f), doc);
+}
+
+}} // namespace boost::python
+
+# endif // PY_VERSION_HEX >= 0x02070000
+
+#endif // VECTORIZE_AGENT20261017_HPP
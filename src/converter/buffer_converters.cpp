@@ -0,0 +1,219 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/buffer_view.hpp>
+#include <boost/python/handle.hpp>
+#include <boost/python/type_id.hpp>
+#include <boost/python/errors.hpp>
+
+#include <boost/python/converter/builtin_converters.hpp>
+#include <boost/python/converter/rvalue_from_python_data.hpp>
+#include <boost/python/converter/registry.hpp>
+
+#include <boost/type_traits/is_const.hpp>
+#include <cstring>
+
+namespace boost { namespace python { namespace converter {
+
+namespace
+{
+  bool little_endian()
+  {
+      int const one = 1;
+      return *reinterpret_cast<char const*>(&one) == 1;
+  }
+}
+
+BOOST_PYTHON_DECL bool buffer_format_matches(
+    char const* format, std::size_t itemsize
+    , buffer_element_kind kind, std::size_t element_size)
+{
+    if (itemsize != element_size)
+        return false;
+
+    // Buffers which don't describe their format hold unsigned bytes
+    if (format == 0)
+        format = "B";
+
+    // Elements in other than the native byte order can't be viewed in
+    // place. Their sizes were checked above.
+    switch (*format)
+    {
+    case '@': case '=':
+        ++format;
+        break;
+    case '<':
+        if (!little_endian())
+            return false;
+        ++format;
+        break;
+    case '>': case '!':
+        if (little_endian())
+            return false;
+        ++format;
+        break;
+    }
+
+    char const* codes = 0;
+    if (*format == 'Z')
+    {
+        if (kind != buffer_complex)
+            return false;
+        ++format;
+        codes = "fdg";
+    }
+    else
+    {
+        switch (kind)
+        {
+        case buffer_signed: codes = "bhilqn"; break;
+        case buffer_unsigned: codes = "BHILQN"; break;
+        case buffer_floating: codes = "efdg"; break;
+        case buffer_bool: codes = "?"; break;
+        case buffer_character: codes = "cbB"; break;
+        case buffer_complex: return false;
+        }
+    }
+
+    // Only a single element code is accepted; counts and structures
+    // can't be viewed as a single C++ type.
+    return format[0] != 0 && format[1] == 0 && std::strchr(codes, format[0]) != 0;
+}
+
+#if PY_VERSION_HEX >= 0x02070000
+
+namespace
+{
+  bool accepts_buffer(
+      Py_buffer const& buffer, buffer_element_kind kind, std::size_t element_size, bool writable)
+  {
+      return buffer_format_matches(buffer.format, buffer.itemsize, kind, element_size)
+          && PyBuffer_IsContiguous(const_cast<Py_buffer*>(&buffer), 'C')
+          && !(writable && buffer.readonly);
+  }
+}
+
+BOOST_PYTHON_DECL bool is_contiguous_buffer(
+    PyObject* obj, buffer_element_kind kind, std::size_t element_size, bool writable)
+{
+    if (!PyObject_CheckBuffer(obj))
+        return false;
+
+    Py_buffer buffer;
+    if (PyObject_GetBuffer(obj, &buffer, writable ? PyBUF_RECORDS : PyBUF_RECORDS_RO) != 0)
+    {
+        PyErr_Clear();
+        return false;
+    }
+    bool result = accepts_buffer(buffer, kind, element_size, writable);
+    PyBuffer_Release(&buffer);
+    return result;
+}
+
+BOOST_PYTHON_DECL handle<> get_contiguous_buffer(
+    PyObject* obj, buffer_element_kind kind, std::size_t element_size, bool writable
+    , void** data, std::size_t* size)
+{
+    handle<> view(allow_null(PyMemoryView_FromObject(obj)));
+    if (!view)
+        return view;
+
+    Py_buffer const& buffer = *PyMemoryView_GET_BUFFER(view.get());
+    if (!accepts_buffer(buffer, kind, element_size, writable))
+    {
+        PyErr_SetString(
+            PyExc_TypeError
+            , writable
+            ? "expected a writable C-contiguous buffer of a matching element type"
+            : "expected a C-contiguous buffer of a matching element type");
+        return handle<>();
+    }
+
+    *data = buffer.buf;
+    *size = buffer.len / buffer.itemsize;
+    return view;
+}
+
+namespace
+{
+  // Registers a from_python converter to buffer_view<T> from objects
+  // exporting a contiguous buffer of T. A const T accepts read-only
+  // buffers. The buffer is only inspected and released by convertible(),
+  // so that an overload which is not chosen doesn't hold it; the view
+  // built by construct() acquires it for as long as the view is alive.
+  template <class T>
+  struct buffer_from_python
+  {
+      buffer_from_python()
+      {
+          registry::insert(&convertible, &construct, type_id<buffer_view<T> >());
+      }
+
+   private:
+      static bool const writable = !is_const<T>::value;
+
+      static void* convertible(PyObject* obj)
+      {
+          return is_contiguous_buffer(
+              obj, buffer_element<T>::kind, sizeof(T), writable) ? obj : 0;
+      }
+
+      static void construct(PyObject* obj, rvalue_from_python_stage1_data* data)
+      {
+          void* elements;
+          std::size_t size;
+          handle<> owner(
+              get_contiguous_buffer(
+                  obj, buffer_element<T>::kind, sizeof(T), writable, &elements, &size));
+          if (!owner)
+              throw_error_already_set();
+
+          void* storage = ((rvalue_from_python_storage<buffer_view<T> >*)data)->storage.address();
+          new (storage) buffer_view<T>(owner, static_cast<T*>(elements), size);
+          data->convertible = storage;
+      }
+  };
+
+  template <class T>
+  void register_buffer_converters()
+  {
+      buffer_from_python<T>();
+      buffer_from_python<T const>();
+  }
+}
+
+void initialize_buffer_converters()
+{
+    register_buffer_converters<bool>();
+    register_buffer_converters<char>();
+    register_buffer_converters<signed char>();
+    register_buffer_converters<unsigned char>();
+    register_buffer_converters<short>();
+    register_buffer_converters<unsigned short>();
+    register_buffer_converters<int>();
+    register_buffer_converters<unsigned int>();
+    register_buffer_converters<long>();
+    register_buffer_converters<unsigned long>();
+# ifdef HAVE_LONG_LONG
+    register_buffer_converters<signed BOOST_PYTHON_LONG_LONG>();
+    register_buffer_converters<unsigned BOOST_PYTHON_LONG_LONG>();
+# endif
+    register_buffer_converters<float>();
+    register_buffer_converters<double>();
+    register_buffer_converters<long double>();
+    register_buffer_converters<std::complex<float> >();
+    register_buffer_converters<std::complex<double> >();
+    register_buffer_converters<std::complex<long double> >();
+}
+
+#else
+
+void initialize_buffer_converters()
+{
+}
+
+#endif
+
+}}} // namespace boost::python::converter
@@ -19,9 +19,14 @@
 #include <boost/python/converter/pytype_function.hpp>
 
 #include <boost/cast.hpp>
+#include <boost/utility/string_ref.hpp>
 #include <string>
 #include <complex>
 
+#ifndef BOOST_NO_CXX17_HDR_STRING_VIEW
+# include <string_view>
+#endif
+
 namespace boost { namespace python { namespace converter {
 
 shared_ptr_deleter::shared_ptr_deleter(handle<> owner)
@@ -38,6 +43,20 @@ void shared_ptr_deleter::operator()(void const*)
 namespace
 {
 
+#if PY_VERSION_HEX >= 0x03000000
+  // Returns the UTF-8 encoding of a Python 3 str without copying it.
+  // The interpreter caches the encoding in the str object, so it
+  // lives as long as the object does.
+  char const* unicode_as_utf8(PyObject* obj, ssize_t* size)
+  {
+# if PY_VERSION_HEX >= 0x03030000
+      return PyUnicode_AsUTF8AndSize(obj, size);
+# else
+      return _PyUnicode_AsStringAndSize(obj, size);
+# endif
+  }
+#endif
+
   // An lvalue conversion function which extracts a char const* from a
   // Python String.
 #if PY_VERSION_HEX < 0x03000000
@@ -48,7 +67,18 @@ namespace
 #else
   void* convert_to_cstring(PyObject* obj)
   {
-      return PyUnicode_Check(obj) ? _PyUnicode_AsString(obj) : 0;
+      if (!PyUnicode_Check(obj))
+          return 0;
+      
+      ssize_t size;
+      char const* result = unicode_as_utf8(obj, &size);
+      if (result == 0)
+      {
+          // The str can't be encoded, e.g. it contains lone surrogates
+          PyErr_Clear();
+          return 0;
+      }
+      return const_cast<char*>(result);
   }
 #endif
 
@@ -66,6 +96,7 @@ namespace
               , &slot_rvalue_from_python<T,SlotPolicy>::construct
               , type_id<T>()
               , &SlotPolicy::get_pytype
+              , true  // the slot depends only on the type
               );
       }
       
@@ -366,10 +397,22 @@ namespace
       static PyTypeObject const* get_pytype() { return &PyFloat_Type;}
   };
 
+  // Returns the characters of a Python string without copying them,
+  // or 0 if the string can't be represented in UTF-8.
+  char const* string_data(PyObject* obj, ssize_t* size)
+  {
 #if PY_VERSION_HEX >= 0x03000000
-  unaryfunc py_unicode_as_string_unaryfunc = PyUnicode_AsUTF8String;
+      if (PyUnicode_Check(obj))
+          return unicode_as_utf8(obj, size);
+      
+      *size = PyBytes_GET_SIZE(obj);
+      return PyBytes_AS_STRING(obj);
+#else
+      *size = PyString_GET_SIZE(obj);
+      return PyString_AS_STRING(obj);
 #endif
-
+  }
+  
   // A SlotPolicy for extracting C++ strings from Python objects.
   struct string_rvalue_from_python
   {
@@ -377,30 +420,69 @@ namespace
       static unaryfunc* get_slot(PyObject* obj)
       {
 #if PY_VERSION_HEX >= 0x03000000
-          return (PyUnicode_Check(obj)) ? &py_unicode_as_string_unaryfunc : 
-                  PyBytes_Check(obj) ? &py_object_identity : 0;
+          return (PyUnicode_Check(obj) || PyBytes_Check(obj)) ? &py_object_identity : 0;
 #else
-          return (PyString_Check(obj)) ? &obj->ob_type->tp_str : 0;
+          return (PyString_Check(obj)) ? &py_object_identity : 0;
 
 #endif
       };
 
-      // Remember that this will be used to construct the result object 
-#if PY_VERSION_HEX >= 0x03000000
+      // Remember that this will be used to construct the result
+      // object. The characters of a str are copied straight out of its
+      // cached UTF-8 encoding.
       static std::string extract(PyObject* intermediate)
       {
-          return std::string(PyBytes_AsString(intermediate),PyBytes_Size(intermediate));
+          ssize_t size;
+          char const* data = string_data(intermediate, &size);
+          if (data == 0)
+              throw_error_already_set();
+          return std::string(data, size);
       }
+#if PY_VERSION_HEX >= 0x03000000
       static PyTypeObject const* get_pytype() { return &PyUnicode_Type;}
 #else
-      static std::string extract(PyObject* intermediate)
-      {
-          return std::string(PyString_AsString(intermediate),PyString_Size(intermediate));
-      }
       static PyTypeObject const* get_pytype() { return &PyString_Type;}
 #endif
   };
 
+  // Registers a from_python converter to a non-owning view of the
+  // characters of a Python string, such as boost::string_ref. Nothing
+  // is copied, so the view is only valid while the Python string is
+  // alive; when the string is a function argument, that is for the
+  // duration of the call.
+  template <class View>
+  struct string_view_rvalue_from_python
+  {
+      string_view_rvalue_from_python()
+      {
+          registry::insert(
+              &convertible
+              , &construct
+              , type_id<View>()
+              , &string_rvalue_from_python::get_pytype
+              , true  // only strings are accepted
+              );
+      }
+      
+   private:
+      static void* convertible(PyObject* obj)
+      {
+          return string_rvalue_from_python::get_slot(obj) ? obj : 0;
+      }
+      
+      static void construct(PyObject* obj, rvalue_from_python_stage1_data* data)
+      {
+          ssize_t size;
+          char const* characters = string_data(obj, &size);
+          if (characters == 0)
+              throw_error_already_set();
+          
+          void* storage = ((rvalue_from_python_storage<View>*)data)->storage.address();
+          new (storage) View(characters, size);
+          data->convertible = storage;
+      }
+  };
+
 #if defined(Py_USING_UNICODE) && !defined(BOOST_NO_STD_WSTRING)
   // encode_string_unaryfunc/py_encode_string -- manufacture a unaryfunc
   // "slot" which encodes a Python string using the default encoding
@@ -565,6 +647,15 @@ void initialize_builtin_converters()
 # endif 
     slot_rvalue_from_python<std::string, string_rvalue_from_python>();
 
+    // Register converters to views of the characters of a string
+    string_view_rvalue_from_python<boost::string_ref>();
+#ifndef BOOST_NO_CXX17_HDR_STRING_VIEW
+    string_view_rvalue_from_python<std::string_view>();
+#endif
+
+    // Register converters to views of the elements of buffers
+    initialize_buffer_converters();
+
 }
 
 }}} // namespace boost::python::converter
@@ -13,8 +13,25 @@
 #include <boost/python/detail/raw_pyobject.hpp>
 #include <boost/python/cast.hpp>
 
-#include <vector>
-#include <algorithm>
+#include <boost/config.hpp>
+
+#include <cstddef>
+
+// The greatest number of implicit conversions which may be nested in
+// a single conversion from Python.
+#ifndef BOOST_PYTHON_IMPLICIT_CONVERSION_DEPTH
+# define BOOST_PYTHON_IMPLICIT_CONVERSION_DEPTH 64
+#endif
+
+#if !defined(BOOST_NO_CXX11_THREAD_LOCAL)
+# define BOOST_PYTHON_THREAD_LOCAL thread_local
+#elif defined(BOOST_MSVC)
+# define BOOST_PYTHON_THREAD_LOCAL __declspec(thread)
+#elif defined(BOOST_HAS_THREADS)
+# define BOOST_PYTHON_THREAD_LOCAL __thread
+#else
+# define BOOST_PYTHON_THREAD_LOCAL
+#endif
 
 namespace boost { namespace python { namespace converter { 
 
@@ -35,6 +52,69 @@ namespace boost { namespace python { namespace converter {
 //      x.construct(source, y) constructs an object of type T
 //      in y.storage.address() and then sets y.convertible == y.storage.address(),
 //      or else throws an exception and has no effect.
+namespace
+{
+#if PY_VERSION_HEX >= 0x02060000
+  // Where to start looking for a converter of objects of the given
+  // type in converters.rvalue_chain, or 0 if it isn't known
+  inline registration::rvalue_chain_cache_entry const*
+  find_rvalue_chain(registration const& converters, PyTypeObject* type)
+  {
+      if (!(type->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG))
+          return 0;
+      
+      for (unsigned i = 0; i < registration::rvalue_chain_cache_size; ++i)
+      {
+          registration::rvalue_chain_cache_entry const& e
+              = converters.m_rvalue_chain_cache[i];
+          
+          // A type's version tag changes when it's modified, and is
+          // never reused by another type
+          if (e.source_type == type && e.version_tag == type->tp_version_tag)
+              return &e;
+      }
+      return 0;
+  }
+  
+  inline void cache_rvalue_chain(
+      registration const& converters, PyTypeObject* type, rvalue_from_python_chain const* chain)
+  {
+      if (!(type->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG))
+          return;
+      
+      registration::rvalue_chain_cache_entry& e
+          = converters.m_rvalue_chain_cache[converters.m_rvalue_chain_cache_next];
+      converters.m_rvalue_chain_cache_next
+          = (converters.m_rvalue_chain_cache_next + 1) % registration::rvalue_chain_cache_size;
+      
+      e.source_type = type;
+      e.version_tag = type->tp_version_tag;
+      e.chain = chain;
+  }
+#endif
+
+  // The number of conversions this thread has seen refused in a way
+  // which may depend on the value of the source object
+  BOOST_PYTHON_THREAD_LOCAL unsigned long value_refusals;
+
+  // Whether source is an instance of an extension class, which may
+  // hold an object of the target class of converters even though it
+  // doesn't now: the objects held by instances of the same class may
+  // have different dynamic types, or be null.
+  inline bool may_hold_instance(PyObject* source, registration const& converters)
+  {
+      return converters.m_class_object != 0
+          && PyType_IsSubtype(
+              Py_TYPE(Py_TYPE(source))
+            , Py_TYPE(upcast<PyObject>(converters.m_class_object)));
+  }
+}
+
+BOOST_PYTHON_DECL unsigned long value_refusal_count()
+{
+    return value_refusals;
+}
+
 BOOST_PYTHON_DECL rvalue_from_python_stage1_data rvalue_from_python_stage1(
     PyObject* source
     , registration const& converters)
@@ -47,9 +127,22 @@ BOOST_PYTHON_DECL rvalue_from_python_stage1_data rvalue_from_python_stage1(
         data.construct = 0;
     if (!data.convertible)
     {
-        for (rvalue_from_python_chain const* chain = converters.rvalue_chain;
-             chain != 0;
-             chain = chain->next)
+        rvalue_from_python_chain const* chain = converters.rvalue_chain;
+        
+#if PY_VERSION_HEX >= 0x02060000
+        // Skip the converters known to refuse objects of this type
+        registration::rvalue_chain_cache_entry const* cached
+            = find_rvalue_chain(converters, Py_TYPE(source));
+        
+        if (cached)
+            chain = cached->chain;
+        
+        // The first converter whose answer isn't known from the type
+        rvalue_from_python_chain const* first_unknown = chain;
+#endif
+        bool value_refused = false;
+        
+        for (; chain != 0; chain = chain->next)
         {
             void* r = chain->convertible(source);
             if (r != 0)
@@ -58,7 +151,24 @@ BOOST_PYTHON_DECL rvalue_from_python_stage1_data rvalue_from_python_stage1(
                 data.construct = chain->construct;
                 break;
             }
+            if (!chain->type_determined)
+                value_refused = true;
+#if PY_VERSION_HEX >= 0x02060000
+            if (first_unknown == chain && chain->type_determined)
+                first_unknown = chain->next;
+#endif
         }
+        
+        if (!data.convertible
+            && (value_refused || may_hold_instance(source, converters)))
+        {
+            ++value_refusals;
+        }
+        
+#if PY_VERSION_HEX >= 0x02060000
+        if (!cached && first_unknown != converters.rvalue_chain)
+            cache_rvalue_chain(converters, Py_TYPE(source), first_unknown);
+#endif
     }
     return data;
 }
@@ -133,26 +243,44 @@ BOOST_PYTHON_DECL void* get_lvalue_from_python(
         if (r != 0)
             return r;
     }
+    
+    if (may_hold_instance(source, converters))
+        ++value_refusals;
     return 0;
 }
 
 namespace
 {
-  // Prevent looping in implicit conversions. This could/should be
-  // much more efficient, but will work for now.
-  typedef std::vector<rvalue_from_python_chain const*> visited_t;
-  static visited_t visited;
+  // Prevent looping in implicit conversions. Each thread keeps the
+  // chains whose implicit convertibility it is currently checking on
+  // a small stack of its own, so checks made by different threads
+  // never see each other's marks.
+  struct visited_chains
+  {
+      std::size_t size;
+      rvalue_from_python_chain const* chains[BOOST_PYTHON_IMPLICIT_CONVERSION_DEPTH];
+  };
+
+  // Zero-initialized, like any other object of static storage duration
+  BOOST_PYTHON_THREAD_LOCAL visited_chains visited;
 
   inline bool visit(rvalue_from_python_chain const* chain)
   {
-      visited_t::iterator const p = std::lower_bound(visited.begin(), visited.end(), chain);
-      if (p != visited.end() && *p == chain)
+      for (std::size_t i = 0; i < visited.size; ++i)
+      {
+          if (visited.chains[i] == chain)
+              return false;
+      }
+      
+      // Conversions nested more deeply than this are refused
+      if (visited.size == BOOST_PYTHON_IMPLICIT_CONVERSION_DEPTH)
           return false;
-      visited.insert(p, chain);
+      
+      visited.chains[visited.size++] = chain;
       return true;
   }
 
-  // RAII class for managing global visited marks.
+  // RAII class for managing the visited marks of this thread.
   struct unvisit
   {
       unvisit(rvalue_from_python_chain const* chain)
@@ -160,9 +288,8 @@ namespace
       
       ~unvisit()
       {
-          visited_t::iterator const p = std::lower_bound(visited.begin(), visited.end(), chain);
-          assert(p != visited.end());
-          visited.erase(p);
+          assert(visited.size > 0 && visited.chains[visited.size - 1] == chain);
+          --visited.size;
       }
    private:
       rvalue_from_python_chain const* chain;
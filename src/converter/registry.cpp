@@ -5,9 +5,15 @@
 #include <boost/python/converter/registry.hpp>
 #include <boost/python/converter/registrations.hpp>
 #include <boost/python/converter/builtin_converters.hpp>
+#include <boost/python/dict.hpp>
 
+#include <boost/noncopyable.hpp>
+
+#include <algorithm>
 #include <set>
 #include <stdexcept>
+#include <utility>
+#include <vector>
 
 #if defined(__APPLE__) && defined(__MACH__) && defined(__GNUC__) \
  && __GNUC__ == 3 && __GNUC_MINOR__ <= 4 && !defined(__APPLE_CC__)
@@ -112,8 +118,158 @@ registration::~registration()
 namespace // <unnamed>
 {
   typedef registration entry;
+
+#ifdef BOOST_PYTHON_REGISTRY_STATISTICS
+  struct registry_statistics
+  {
+      std::size_t lookups;           // calls to find() and insert()
+      std::size_t misses;            // ...which found no entry
+      std::size_t insert_collisions; // new entries put in an occupied bucket
+  };
+
+  registry_statistics statistics_ = { 0, 0, 0 };
   
-  typedef std::set<entry> registry_t;
+#  define BOOST_PYTHON_REGISTRY_COUNT(counter) (++statistics_.counter)
+#else
+#  define BOOST_PYTHON_REGISTRY_COUNT(counter) ((void)0)
+#endif
+  
+  //
+  // A chained hash table of registrations keyed on their type_info.
+  // Each entry is allocated separately and never moves, since
+  // registrations are referred to by address from all over.
+  //
+  class registry_t : boost::noncopyable
+  {
+   public:
+      registry_t()
+        : m_buckets(initial_bucket_count)
+        , m_size(0)
+      {}
+
+      ~registry_t()
+      {
+          for (std::size_t i = 0; i < m_buckets.size(); ++i)
+          {
+              for (node* p = m_buckets[i]; p != 0;)
+              {
+                  node* next = p->next;
+                  delete p;
+                  p = next;
+              }
+          }
+      }
+
+      // Return the entry for the given type, or 0 if there is none
+      entry* find(type_info type) const
+      {
+          BOOST_PYTHON_REGISTRY_COUNT(lookups);
+          entry* result = find(type, type.hash());
+          if (result == 0)
+              BOOST_PYTHON_REGISTRY_COUNT(misses);
+          return result;
+      }
+
+      // Return the entry for the given type, creating it if necessary.
+      // The second member of the result is true iff it was created.
+      std::pair<entry*,bool> insert(type_info type, bool is_shared_ptr)
+      {
+          BOOST_PYTHON_REGISTRY_COUNT(lookups);
+          std::size_t const hash = type.hash();
+          
+          if (entry* found = find(type, hash))
+              return std::make_pair(found, false);
+          
+          BOOST_PYTHON_REGISTRY_COUNT(misses);
+          
+          if (m_size >= m_buckets.size())
+              rehash(2 * m_buckets.size());
+
+          node*& bucket = m_buckets[hash % m_buckets.size()];
+          if (bucket != 0)
+              BOOST_PYTHON_REGISTRY_COUNT(insert_collisions);
+          
+          bucket = new node(type, is_shared_ptr, hash, bucket);
+          ++m_size;
+          return std::make_pair(&bucket->value, true);
+      }
+
+      std::size_t size() const { return m_size; }
+      
+      std::size_t bucket_count() const { return m_buckets.size(); }
+
+      // The length of the longest chain of entries sharing a bucket
+      std::size_t longest_chain() const
+      {
+          std::size_t result = 0;
+          for (std::size_t i = 0; i < m_buckets.size(); ++i)
+          {
+              std::size_t length = 0;
+              for (node* p = m_buckets[i]; p != 0; p = p->next)
+                  ++length;
+              result = (std::max)(result, length);
+          }
+          return result;
+      }
+
+#  ifdef BOOST_PYTHON_TRACE_REGISTRY
+      void print(std::ostream& os) const
+      {
+          for (std::size_t i = 0; i < m_buckets.size(); ++i)
+          {
+              for (node* p = m_buckets[i]; p != 0; p = p->next)
+                  os << p->value.target_type << "; ";
+          }
+      }
+#  endif
+      
+   private:
+      struct node
+      {
+          node(type_info type, bool is_shared_ptr, std::size_t hash, node* next)
+            : value(type, is_shared_ptr)
+            , hash(hash)
+            , next(next)
+          {}
+          
+          entry value;
+          std::size_t const hash;
+          node* next;
+      };
+
+      entry* find(type_info type, std::size_t hash) const
+      {
+          for (node* p = m_buckets[hash % m_buckets.size()]; p != 0; p = p->next)
+          {
+              if (p->hash == hash && p->value.target_type == type)
+                  return &p->value;
+          }
+          return 0;
+      }
+
+      void rehash(std::size_t bucket_count)
+      {
+          std::vector<node*> buckets(bucket_count);
+          
+          for (std::size_t i = 0; i < m_buckets.size(); ++i)
+          {
+              for (node* p = m_buckets[i]; p != 0;)
+              {
+                  node* next = p->next;
+                  node*& bucket = buckets[p->hash % bucket_count];
+                  p->next = bucket;
+                  bucket = p;
+                  p = next;
+              }
+          }
+          m_buckets.swap(buckets);
+      }
+
+      enum { initial_bucket_count = 256 };
+      
+      std::vector<node*> m_buckets;
+      std::size_t m_size;
+  };
   
 #ifndef BOOST_PYTHON_CONVERTER_REGISTRY_APPLE_MACH_WORKAROUND
   registry_t& entries()
@@ -132,10 +288,7 @@ namespace // <unnamed>
       }
 #  ifdef BOOST_PYTHON_TRACE_REGISTRY
       std::cout << "registry: ";
-      for (registry_t::iterator p = registry.begin(); p != registry.end(); ++p)
-      {
-          std::cout << p->target_type << "; ";
-      }
+      registry.print(std::cout);
       std::cout << '\n';
 #  endif 
 # endif 
@@ -168,10 +321,7 @@ namespace // <unnamed>
       }
 #  ifdef BOOST_PYTHON_TRACE_REGISTRY
       std::cout << "registry: ";
-      for (registry_t::iterator p = static_registry().begin(); p != static_registry().end(); ++p)
-      {
-          std::cout << p->target_type << "; ";
-      }
+      static_registry().print(std::cout);
       std::cout << '\n';
 #  endif 
 # endif 
@@ -181,22 +331,13 @@ namespace // <unnamed>
 
   entry* get(type_info type, bool is_shared_ptr = false)
   {
-#  ifdef BOOST_PYTHON_TRACE_REGISTRY
-      registry_t::iterator p = entries().find(entry(type));
+      std::pair<entry*,bool> pos_ins = entries().insert(type,is_shared_ptr);
       
+#  ifdef BOOST_PYTHON_TRACE_REGISTRY
       std::cout << "looking up " << type << ": "
-                << (p == entries().end() || p->target_type != type
-                    ? "...NOT found\n" : "...found\n");
-#  endif
-      std::pair<registry_t::const_iterator,bool> pos_ins
-          = entries().insert(entry(type,is_shared_ptr));
-      
-#  if __MWERKS__ >= 0x3000
-      // do a little invariant checking if a change was made
-      if ( pos_ins.second )
-          assert(entries().invariants());
+                << (pos_ins.second ? "...NOT found\n" : "...found\n");
 #  endif
-      return const_cast<entry*>(&*pos_ins.first);
+      return pos_ins.first;
   }
 } // namespace <unnamed>
 
@@ -242,11 +383,20 @@ namespace registry
       insert(convert, 0, key,exp_pytype);
   }
 
+  // The Python types whose conversions have been cached may be
+  // accepted by a new converter
+  inline void clear_rvalue_chain_cache(registration* r)
+  {
+      for (unsigned i = 0; i < registration::rvalue_chain_cache_size; ++i)
+          r->m_rvalue_chain_cache[i].source_type = 0;
+  }
+  
   // Insert an rvalue from_python converter
   void insert(convertible_function convertible
               , constructor_function construct
               , type_info key
-              , PyTypeObject const* (*exp_pytype)())
+              , PyTypeObject const* (*exp_pytype)()
+              , bool type_determined)
   {
 #  ifdef BOOST_PYTHON_TRACE_REGISTRY
       std::cout << "inserting rvalue from_python " << key << "\n";
@@ -257,19 +407,25 @@ namespace registry
       registration->construct = construct;
       registration->expected_pytype = exp_pytype;
       registration->next = found->rvalue_chain;
+      registration->type_determined = type_determined;
       found->rvalue_chain = registration;
+      clear_rvalue_chain_cache(found);
   }
 
   // Insert an rvalue from_python converter
   void push_back(convertible_function convertible
               , constructor_function construct
               , type_info key
-              , PyTypeObject const* (*exp_pytype)())
+              , PyTypeObject const* (*exp_pytype)()
+              , bool type_determined)
   {
 #  ifdef BOOST_PYTHON_TRACE_REGISTRY
       std::cout << "push_back rvalue from_python " << key << "\n";
 #  endif 
-      rvalue_from_python_chain** found = &get(key)->rvalue_chain;
+      entry* target = get(key);
+      clear_rvalue_chain_cache(target);
+      
+      rvalue_from_python_chain** found = &target->rvalue_chain;
       while (*found != 0)
           found = &(*found)->next;
       
@@ -278,6 +434,7 @@ namespace registry
       registration->construct = construct;
       registration->expected_pytype = exp_pytype;
       registration->next = 0;
+      registration->type_determined = type_determined;
       *found = registration;
   }
 
@@ -293,13 +450,28 @@ namespace registry
 
   registration const* query(type_info type)
   {
-      registry_t::iterator p = entries().find(entry(type));
+      entry const* p = entries().find(type);
 #  ifdef BOOST_PYTHON_TRACE_REGISTRY
       std::cout << "querying " << type
-                << (p == entries().end() || p->target_type != type
-                    ? "...NOT found\n" : "...found\n");
+                << (p == 0 ? "...NOT found\n" : "...found\n");
 #  endif 
-      return (p == entries().end() || p->target_type != type) ? 0 : &*p;
+      return p;
+  }
+
+  object statistics()
+  {
+      registry_t const& registry = entries();
+      
+      dict result;
+      result["entries"] = registry.size();
+      result["buckets"] = registry.bucket_count();
+      result["longest_chain"] = registry.longest_chain();
+#ifdef BOOST_PYTHON_REGISTRY_STATISTICS
+      result["lookups"] = statistics_.lookups;
+      result["misses"] = statistics_.misses;
+      result["insert_collisions"] = statistics_.insert_collisions;
+#endif
+      return result;
   }
 } // namespace registry
 
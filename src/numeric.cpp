@@ -9,6 +9,8 @@
 #include <boost/python/tuple.hpp>
 #include <boost/python/detail/raw_pyobject.hpp>
 #include <boost/python/extract.hpp>
+#include <boost/python/buffer_protocol.hpp>
+#include <cstring>
 
 namespace boost { namespace python { namespace numeric {
 
@@ -39,18 +41,28 @@ namespace
       {
           if (module_name.size() == 0)
           {
+              // NumPy comes last, so that code written for numarray or
+              // Numeric keeps using them where they are installed; see
+              // set_module_and_type() to choose it over them.
               module_name = "numarray";
               type_name = "NDArray";
               if (load(false))
                   return true;
+              state = unknown;
               module_name = "Numeric";
               type_name = "ArrayType";
+              if (load(false))
+                  return true;
+              state = unknown;
+              module_name = "numpy";
+              type_name = "ndarray";
           }
 
           state = failed;
           PyObject* module = ::PyImport_Import(object(module_name).ptr());
           if (module)
           {
+              array_module = handle<>(module);
               PyObject* type = ::PyObject_GetAttrString(module, const_cast<char*>(type_name.c_str()));
 
               if (type && PyType_Check(type))
@@ -82,11 +94,38 @@ namespace
       load(true);
       return object(array_function);
   }
+
+#if PY_VERSION_HEX >= 0x02070000
+  // Holds the buffer of an array, if it exports one, so that its
+  // layout can be read without calling Python.
+  struct layout
+  {
+      layout(object const& x)
+          : valid(PyObject_CheckBuffer(x.ptr())
+                  && PyObject_GetBuffer(x.ptr(), &view, PyBUF_RECORDS_RO) == 0)
+      {
+          if (!valid)
+              PyErr_Clear();
+      }
+
+      ~layout()
+      {
+          if (valid)
+              PyBuffer_Release(&view);
+      }
+
+      bool valid;
+      Py_buffer view;
+  };
+#endif
 }
 
 void array::set_module_and_type(char const* package_name, char const* type_attribute_name)
 {
     state = unknown;
+    array_module.reset();
+    array_type.reset();
+    array_function.reset();
     module_name = package_name ? package_name : "" ;
     type_name = type_attribute_name ? type_attribute_name : "" ;
 }
@@ -228,11 +267,29 @@ namespace aux
       
   long array_base::getrank() const
   {
+#if PY_VERSION_HEX >= 0x02070000
+      layout l(*this);
+      if (l.valid)
+          return l.view.ndim;
+#endif
       return extract<long>(attr("getrank")());
   }
   
   object array_base::getshape() const
   {
+#if PY_VERSION_HEX >= 0x02070000
+      layout l(*this);
+      if (l.valid)
+      {
+          tuple shape((detail::new_reference)::PyTuple_New(l.view.ndim));
+          for (int axis = 0; axis < l.view.ndim; ++axis)
+          {
+              PyTuple_SET_ITEM(
+                  shape.ptr(), axis, expect_non_null(PyLong_FromSsize_t(l.view.shape[axis])));
+          }
+          return shape;
+      }
+#endif
       return attr("getshape")();
   }
   
@@ -243,16 +300,31 @@ namespace aux
   
   bool array_base::iscontiguous() const
   {      
+#if PY_VERSION_HEX >= 0x02070000
+      layout l(*this);
+      if (l.valid)
+          return PyBuffer_IsContiguous(&l.view, 'C');
+#endif
       return extract<bool>(attr("iscontiguous")());
   }
   
   long array_base::itemsize() const
   {
+#if PY_VERSION_HEX >= 0x02070000
+      layout l(*this);
+      if (l.valid)
+          return static_cast<long>(l.view.itemsize);
+#endif
       return extract<long>(attr("itemsize")());
   }
   
   long array_base::nelements() const
   {
+#if PY_VERSION_HEX >= 0x02070000
+      layout l(*this);
+      if (l.valid)
+          return static_cast<long>(l.view.len / l.view.itemsize);
+#endif
       return extract<long>(attr("nelements")());
   }
   
@@ -322,4 +394,163 @@ namespace aux
   }
 }
 
+#if PY_VERSION_HEX >= 0x02070000
+
+array_buffer::array_buffer(object const& x, bool writable)
+{
+    if (!PyObject_CheckBuffer(x.ptr()))
+    {
+        PyErr_Format(
+            PyExc_TypeError
+          , "'%s' object does not export a buffer"
+          , Py_TYPE(x.ptr())->tp_name);
+        throw_error_already_set();
+    }
+
+    if (PyObject_GetBuffer(x.ptr(), &m_view, writable ? PyBUF_RECORDS : PyBUF_RECORDS_RO) != 0)
+        throw_error_already_set();
+}
+
+array_buffer::~array_buffer()
+{
+    PyBuffer_Release(&m_view);
+}
+
+bool array_buffer::is_c_contiguous() const
+{
+    return PyBuffer_IsContiguous(const_cast<Py_buffer*>(&m_view), 'C');
+}
+
+void array_buffer::check_elements(
+    converter::buffer_element_kind kind, std::size_t size, bool writable) const
+{
+    if (!converter::buffer_format_matches(m_view.format, m_view.itemsize, kind, size))
+    {
+        PyErr_Format(
+            PyExc_TypeError
+          , "buffer of format '%s' and item size %d doesn't hold the requested element type"
+          , format(), static_cast<int>(m_view.itemsize));
+        throw_error_already_set();
+    }
+
+    if (writable && m_view.readonly)
+    {
+        PyErr_SetString(PyExc_TypeError, "buffer is read-only");
+        throw_error_already_set();
+    }
+}
+
+namespace
+{
+  // Exports a buffer of memory belonging to some other object, which
+  // it keeps alive.
+  struct array_memory
+  {
+      PyObject_HEAD
+      PyObject* owner;
+      void* data;
+      bool readonly;
+      char const* format;
+      ssize_t itemsize;
+      std::vector<ssize_t>* shape;
+      std::vector<ssize_t>* strides;
+  };
+
+  extern "C"
+  {
+      static void array_memory_dealloc(PyObject* self)
+      {
+          array_memory* m = (array_memory*)self;
+          Py_XDECREF(m->owner);
+          delete m->shape;
+          delete m->strides;
+          PyObject_Del(self);
+      }
+
+      static int array_memory_getbuffer(PyObject* self, Py_buffer* view, int flags)
+      {
+          array_memory* m = (array_memory*)self;
+          return objects::fill_buffer(
+              self, view, flags, m->data, m->readonly, m->format, m->itemsize
+            , *m->shape, *m->strides);
+      }
+
+      static void array_memory_releasebuffer(PyObject*, Py_buffer* view)
+      {
+          // The shape and strides, allocated by fill_buffer()
+          PyMem_Free(view->internal);
+      }
+  }
+
+  PyBufferProcs array_memory_as_buffer;
+
+  PyTypeObject array_memory_type = {
+      PyVarObject_HEAD_INIT(NULL, 0)
+      const_cast<char*>("Boost.Python.array_memory"),
+      sizeof(array_memory),
+      0,
+      array_memory_dealloc,                   /* tp_dealloc */
+  };
+
+  PyTypeObject* get_array_memory_type()
+  {
+      if (Py_TYPE(&array_memory_type) == 0)
+      {
+          array_memory_as_buffer.bf_getbuffer = array_memory_getbuffer;
+          array_memory_as_buffer.bf_releasebuffer = array_memory_releasebuffer;
+          array_memory_type.tp_as_buffer = &array_memory_as_buffer;
+          array_memory_type.tp_flags = Py_TPFLAGS_DEFAULT
+# if PY_VERSION_HEX < 0x03000000
+              | Py_TPFLAGS_HAVE_NEWBUFFER
+# endif
+              ;
+          Py_TYPE(&array_memory_type) = &PyType_Type;
+          if (PyType_Ready(&array_memory_type) < 0)
+              throw_error_already_set();
+      }
+      return &array_memory_type;
+  }
+}
+
+namespace aux
+{
+  object make_array(
+      void* data, bool readonly, char const* format, ssize_t itemsize
+    , std::vector<ssize_t> const& shape, std::vector<ssize_t> const& strides
+    , object const& owner)
+  {
+      if (!strides.empty() && strides.size() != shape.size())
+      {
+          PyErr_SetString(PyExc_ValueError, "array has mismatched shape and strides");
+          throw_error_already_set();
+      }
+
+      array_memory* m = PyObject_New(array_memory, get_array_memory_type());
+      if (m == 0)
+          throw_error_already_set();
+      m->owner = python::xincref(owner.ptr());
+      m->data = data;
+      m->readonly = readonly;
+      m->format = format;
+      m->itemsize = itemsize;
+      m->shape = 0;
+      m->strides = 0;
+      object memory((detail::new_reference)(PyObject*)m);
+      m->shape = new std::vector<ssize_t>(shape);
+      m->strides = new std::vector<ssize_t>(strides);
+
+      // NumPy makes an ndarray which refers to the memory directly
+      if (load(false) && module_name == "numpy")
+      {
+          object asarray(
+              (detail::new_reference)
+              expect_non_null(PyObject_GetAttrString(array_module.get(), const_cast<char*>("asarray"))));
+          return asarray(memory);
+      }
+      return object((detail::new_reference)expect_non_null(PyMemoryView_FromObject(memory.ptr())));
+  }
+}
+
+#endif // PY_VERSION_HEX >= 0x02070000
+
 }}} // namespace boost::python::numeric
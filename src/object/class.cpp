@@ -8,6 +8,7 @@
 #include <boost/cstdint.hpp>
 
 #include <boost/python/object/class.hpp>
+#include <boost/python/buffer_protocol.hpp>
 #include <boost/python/object/instance.hpp>
 #include <boost/python/object/class_detail.hpp>
 #include <boost/python/scope.hpp>
@@ -22,10 +23,13 @@
 #include <boost/python/dict.hpp>
 #include <boost/python/str.hpp>
 #include <boost/python/ssize_t.hpp>
+#include <boost/noncopyable.hpp>
 #include <functional>
 #include <vector>
 #include <cstddef>
 #include <new>
+#include <typeinfo>
+#include <cstring>
 #include <structmember.h>
 
 namespace boost { namespace python {
@@ -248,10 +252,42 @@ extern "C"
     }
 }
 
+namespace objects
+{
+  // Each extension class is one of these. The type object proper is
+  // followed by what we need to create and destroy its instances
+  // quickly.
+  struct class_object
+  {
+      PyHeapTypeObject type;
+
+      // The number of extra bytes allocated in each instance for
+      // holders, once instance_size_known is set
+      ssize_t instance_size;
+      bool instance_size_known;
+
+      // Deallocated instances, kept for reuse
+      void* freelist;
+      std::size_t freelist_size;
+      std::size_t freelist_max_size;
+
+      // The number of items allocated in every instance once a
+      // freelist is enabled, or -1 before. Deallocated instances can
+      // only be reused while they all have that size.
+      ssize_t freelist_block_size;
+      bool instance_sizes_vary;
+
+#if PY_VERSION_HEX >= 0x02060000
+      // Describes the buffers exported by instances, if any
+      buffer_exporter const* buffer;
+#endif
+  };
+}
+
 static PyTypeObject class_metatype_object = {
     PyVarObject_HEAD_INIT(NULL, 0)
     const_cast<char*>("Boost.Python.class"),
-    PyType_Type.tp_basicsize,
+    sizeof(objects::class_object),
     0,
     0,                                      /* tp_dealloc */
     0,                                      /* tp_print */
@@ -312,6 +348,38 @@ void instance_holder::install(PyObject* self) throw()
 
 namespace objects
 {
+  namespace
+  {
+    // Deallocated instances on a class' freelist are linked through
+    // their first bytes.
+    struct free_instance
+    {
+        free_instance* next;
+    };
+
+    // Free all but max_size of the deallocated instances of c
+    void trim_freelist(class_object* c, std::size_t max_size)
+    {
+        while (c->freelist_size > max_size)
+        {
+            free_instance* block = static_cast<free_instance*>(c->freelist);
+            c->freelist = block->next;
+            --c->freelist_size;
+            c->type.ht_type.tp_free(block);
+        }
+    }
+  }
+
+  extern "C"
+  {
+      // The instances kept for reuse go with their class
+      static void class_dealloc(PyObject* type_)
+      {
+          trim_freelist(reinterpret_cast<class_object*>(type_), 0);
+          PyType_Type.tp_dealloc(type_);
+      }
+  }
+
 // Get the metatype object for all extension classes.
   BOOST_PYTHON_DECL type_handle class_metatype()
   {
@@ -319,11 +387,126 @@ namespace objects
       {
           Py_TYPE(&class_metatype_object) = &PyType_Type;
           class_metatype_object.tp_base = &PyType_Type;
+          class_metatype_object.tp_dealloc = class_dealloc;
           if (PyType_Ready(&class_metatype_object))
               return type_handle();
       }
       return type_handle(borrowed(&class_metatype_object));
   }
+  namespace
+  {
+    // Return the class_object for an extension class, or 0 for the
+    // statically-allocated class_type_object
+    inline class_object* get_class_object(PyTypeObject* type_)
+    {
+        return (type_->tp_flags & Py_TPFLAGS_HEAPTYPE)
+            ? reinterpret_cast<class_object*>(type_) : 0;
+    }
+    
+    // The number of bytes to allocate for holders in each instance of
+    // the given class
+    ssize_t extra_instance_size(PyTypeObject* type_)
+    {
+        class_object* c = get_class_object(type_);
+        if (c != 0 && c->instance_size_known)
+            return c->instance_size;
+        
+        // Attempt to find the __instance_size__ attribute, which Python
+        // subclasses inherit from the extension class. If not present,
+        // no problem.
+        PyObject* instance_size_obj = PyObject_GetAttrString(
+            upcast<PyObject>(type_), const_cast<char*>("__instance_size__"));
+
+        ssize_t instance_size = instance_size_obj ? 
+#if PY_VERSION_HEX >= 0x03000000
+            PyLong_AsSsize_t(instance_size_obj) : 0;
+#else
+            PyInt_AsLong(instance_size_obj) : 0;
+#endif
+          
+        if (instance_size < 0)
+            instance_size = 0;
+          
+        Py_XDECREF(instance_size_obj);
+        PyErr_Clear(); // Clear any errors that may have occurred.
+
+        if (c != 0)
+        {
+            c->instance_size = instance_size;
+            c->instance_size_known = true;
+        }
+        return instance_size;
+    }
+
+  }
+
+  extern "C"
+  {
+      // The tp_alloc of extension classes. Once a freelist is
+      // enabled, every instance gets the same number of items, so that
+      // any deallocated one can be reused.
+      static PyObject* instance_alloc(PyTypeObject* type_, ssize_t nitems)
+      {
+          class_object* c = get_class_object(type_);
+          
+          if (c->freelist_block_size < 0 || c->instance_sizes_vary
+              || nitems > c->freelist_block_size)
+          {
+              // Blocks of other sizes can't be told apart once
+              // deallocated, so none are kept from now on.
+              trim_freelist(c, 0);
+              c->instance_sizes_vary = true;
+              return PyType_GenericAlloc(type_, nitems);
+          }
+          
+          if (c->freelist == 0)
+              return PyType_GenericAlloc(type_, c->freelist_block_size);
+
+          free_instance* block = static_cast<free_instance*>(c->freelist);
+          c->freelist = block->next;
+          --c->freelist_size;
+
+          // Do what PyType_GenericAlloc would
+          std::memset(block, 0, _PyObject_VAR_SIZE(type_, c->freelist_block_size + 1));
+          PyObject* result = reinterpret_cast<PyObject*>(block);
+          PyObject_InitVar(reinterpret_cast<PyVarObject*>(result), type_, nitems);
+#if PY_VERSION_HEX < 0x03080000
+          Py_INCREF(type_);
+#endif
+          if (PyType_IS_GC(type_))
+              PyObject_GC_Track(result);
+          return result;
+      }
+  }
+
+  namespace
+  {
+    // Put inst on its class' freelist if there's room; otherwise
+    // return false.
+    bool recycle_instance(PyObject* inst)
+    {
+        PyTypeObject* type_ = Py_TYPE(inst);
+        class_object* c = get_class_object(type_);
+        
+        // Instances of Python subclasses are allocated by
+        // PyType_GenericAlloc, in blocks of any size.
+        if (c == 0 || type_->tp_alloc != instance_alloc || c->instance_sizes_vary
+            || c->freelist_size >= c->freelist_max_size)
+        {
+            return false;
+        }
+
+        if (PyType_IS_GC(type_))
+            PyObject_GC_UnTrack(inst);
+
+        free_instance* block = reinterpret_cast<free_instance*>(inst);
+        block->next = static_cast<free_instance*>(c->freelist);
+        c->freelist = block;
+        ++c->freelist_size;
+        return true;
+    }
+  }
+  
   extern "C"
   {
       static void instance_dealloc(PyObject* inst)
@@ -346,27 +529,14 @@ namespace objects
 
           Py_XDECREF(kill_me->dict);
           
-          Py_TYPE(inst)->tp_free(inst);
+          if (!recycle_instance(inst))
+              Py_TYPE(inst)->tp_free(inst);
       }
 
       static PyObject *
       instance_new(PyTypeObject* type_, PyObject* /*args*/, PyObject* /*kw*/)
       {
-          // Attempt to find the __instance_size__ attribute. If not present, no problem.
-          PyObject* d = type_->tp_dict;
-          PyObject* instance_size_obj = PyObject_GetAttrString(d, const_cast<char*>("__instance_size__"));
-
-          ssize_t instance_size = instance_size_obj ? 
-#if PY_VERSION_HEX >= 0x03000000
-              PyLong_AsSsize_t(instance_size_obj) : 0;
-#else
-              PyInt_AsLong(instance_size_obj) : 0;
-#endif
-          
-          if (instance_size < 0)
-              instance_size = 0;
-          
-          PyErr_Clear(); // Clear any errors that may have occurred.
+          ssize_t instance_size = extra_instance_size(type_);
 
           instance<>* result = (instance<>*)type_->tp_alloc(type_, instance_size);
           if (result)
@@ -480,6 +650,103 @@ namespace objects
       return type_handle(borrowed(&class_type_object));
   }
 
+  namespace
+  {
+    // Remembers, for each class and requested C++ type, where the
+    // first holder of its instances keeps an object of that type.
+    //
+    // An entry is made only when the object found lies within a holder
+    // allocated in the instance, i.e. it is held by value and its
+    // offset within the holder depends only on the holder's type. Any
+    // holder of the same type then holds the requested type at the same
+    // offset. Other holder types are remembered too, so the check is
+    // only made once. Later holders are only consulted when earlier
+    // ones refuse, which may depend on their values, so they aren't
+    // cached.
+    class holder_index : boost::noncopyable
+    {
+     public:
+        holder_index()
+        {
+            for (std::size_t i = 0; i < set_count; ++i)
+                m_next_way[i] = 0;
+        }
+        
+        // Return true iff there's an entry for the first holder of
+        // self. If it holds the object by value, set found.
+        bool find(instance<>* self, type_info type, bool null_ptr_only, void*& found) const
+        {
+            instance_holder* holder = self->objects;
+            if (holder == 0)
+                return false;
+            
+            entry const* const set = m_entries[set_of(Py_TYPE(self))];
+            for (entry const* e = set; e != set + ways; ++e)
+            {
+                if (e->cls == Py_TYPE(self) && e->type == type
+                    && e->null_ptr_only == null_ptr_only && typeid(*holder) == *e->holder)
+                {
+                    if (e->by_value)
+                        found = (char*)holder + e->offset;
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        void insert(instance<>* self, type_info type, bool null_ptr_only, void* found)
+        {
+            instance_holder* holder = self->objects;
+            
+            // The extra instance memory, if the holder was allocated there
+            char* const storage = (char*)self + offsetof(instance<>,storage);
+            char* const storage_end = Py_SIZE(self) > 0
+                ? storage + extra_instance_size(Py_TYPE(self)) : storage;
+
+            std::size_t const set = set_of(Py_TYPE(self));
+            entry& e = m_entries[set][m_next_way[set]];
+            m_next_way[set] = (m_next_way[set] + 1) % ways;
+
+            e.cls = Py_TYPE(self);
+            e.type = type;
+            e.null_ptr_only = null_ptr_only;
+            e.holder = &typeid(*holder);
+            e.by_value = (char*)holder >= storage && (char*)holder < storage_end
+                && (char*)found >= (char*)holder && (char*)found < storage_end;
+            e.offset = (char*)found - (char*)holder;
+        }
+        
+     private:
+        struct entry
+        {
+            entry() : cls(0), null_ptr_only(false), holder(0), by_value(false), offset(0) {}
+            
+            PyTypeObject* cls;
+            type_info type;
+            bool null_ptr_only;
+            std::type_info const* holder;   // dynamic type of the holder
+            bool by_value;
+            std::ptrdiff_t offset;          // of the object within the holder
+        };
+
+        static std::size_t set_of(PyTypeObject* cls)
+        {
+            return (reinterpret_cast<std::size_t>(cls) >> 4) % set_count;
+        }
+        
+        enum { set_count = 256, ways = 4 };
+        
+        entry m_entries[set_count][ways];
+        unsigned m_next_way[set_count];
+    };
+
+    holder_index& instance_holder_index()
+    {
+        static holder_index x;
+        return x;
+    }
+  }
+  
   BOOST_PYTHON_DECL void*
   find_instance_impl(PyObject* inst, type_info type, bool null_shared_ptr_only)
   {
@@ -489,11 +756,21 @@ namespace objects
     
       instance<>* self = reinterpret_cast<instance<>*>(inst);
 
+      holder_index& index = instance_holder_index();
+      void* found = 0;
+      bool const known = index.find(self, type, null_shared_ptr_only, found);
+      if (found)
+          return found;
+      
       for (instance_holder* match = self->objects; match != 0; match = match->next())
       {
-          void* const found = match->holds(type, null_shared_ptr_only);
+          found = match->holds(type, null_shared_ptr_only);
           if (found)
+          {
+              if (!known && match == self->objects)
+                  index.insert(self, type, null_shared_ptr_only, found);
               return found;
+          }
       }
       return 0;
   }
@@ -575,6 +852,11 @@ namespace objects
       
       object result = object(class_metatype())(name, bases, d);
       assert(PyType_IsSubtype(Py_TYPE(result.ptr()), &PyType_Type));
+
+      // Python subclasses are left with PyType_GenericAlloc
+      class_object* c = reinterpret_cast<class_object*>(result.ptr());
+      c->freelist_block_size = -1;
+      c->type.ht_type.tp_alloc = instance_alloc;
       
       if (scope().ptr() != Py_None)
           scope().attr(name) = result;
@@ -612,8 +894,190 @@ namespace objects
   void class_base::set_instance_size(std::size_t instance_size)
   {
       this->attr("__instance_size__") = instance_size;
+
+      class_object* c = reinterpret_cast<class_object*>(this->ptr());
+      c->instance_size = instance_size;
+      c->instance_size_known = true;
   }
   
+  void class_base::set_freelist_size(std::size_t max_size)
+  {
+      class_object* c = reinterpret_cast<class_object*>(this->ptr());
+      if (c->freelist_block_size < 0)
+          c->freelist_block_size = extra_instance_size(&c->type.ht_type);
+      trim_freelist(c, max_size);
+      c->freelist_max_size = max_size;
+  }
+
+#if PY_VERSION_HEX >= 0x02060000
+  buffer_exporter::~buffer_exporter() {}
+
+  void buffer_exporter::release_buffer(PyObject*, Py_buffer*) const {}
+
+  namespace
+  {
+    // Returns the buffer exporter of the nearest extension class in
+    // type's method resolution order which has one, or 0.
+    buffer_exporter const* find_buffer_exporter(PyTypeObject* type_)
+    {
+        PyObject* mro = type_->tp_mro;
+        for (ssize_t i = 0, n = PyTuple_GET_SIZE(mro); i < n; ++i)
+        {
+            PyTypeObject* base = (PyTypeObject*)PyTuple_GET_ITEM(mro, i);
+            if (PyType_IsSubtype(Py_TYPE(base), &class_metatype_object))
+            {
+                class_object* c = get_class_object(base);
+                if (c != 0 && c->buffer != 0)
+                    return c->buffer;
+            }
+        }
+        return 0;
+    }
+
+    struct get_buffer_fn
+    {
+        get_buffer_fn(
+            int& result, buffer_exporter const* exporter, PyObject* self, Py_buffer* view, int flags)
+            : result(result), exporter(exporter), self(self), view(view), flags(flags)
+        {}
+
+        void operator()() const
+        {
+            result = exporter->get_buffer(self, view, flags);
+        }
+
+        int& result;
+        buffer_exporter const* exporter;
+        PyObject* self;
+        Py_buffer* view;
+        int flags;
+    };
+  }
+
+  extern "C"
+  {
+      static int instance_getbuffer(PyObject* self, Py_buffer* view, int flags)
+      {
+          buffer_exporter const* exporter = find_buffer_exporter(Py_TYPE(self));
+          if (exporter == 0)
+          {
+              PyErr_SetString(PyExc_BufferError, "object does not export a buffer");
+              return -1;
+          }
+
+          int result = -1;
+          handle_exception(get_buffer_fn(result, exporter, self, view, flags));
+          return result;
+      }
+
+      static void instance_releasebuffer(PyObject* self, Py_buffer* view)
+      {
+          if (buffer_exporter const* exporter = find_buffer_exporter(Py_TYPE(self)))
+              exporter->release_buffer(self, view);
+
+          // The shape and strides, allocated by fill_buffer()
+          PyMem_Free(view->internal);
+      }
+  }
+
+  BOOST_PYTHON_DECL void add_buffer_exporter(object const& cls, buffer_exporter* exporter)
+  {
+      class_object* c = reinterpret_cast<class_object*>(cls.ptr());
+      delete c->buffer;
+      c->buffer = exporter;
+
+      c->type.as_buffer.bf_getbuffer = instance_getbuffer;
+      c->type.as_buffer.bf_releasebuffer = instance_releasebuffer;
+      c->type.ht_type.tp_as_buffer = &c->type.as_buffer;
+# if PY_VERSION_HEX < 0x03000000
+      c->type.ht_type.tp_flags |= Py_TPFLAGS_HAVE_NEWBUFFER;
+# endif
+      PyType_Modified(&c->type.ht_type);
+  }
+
+  BOOST_PYTHON_DECL int fill_buffer(
+      PyObject* self, Py_buffer* view, int flags
+    , void* data, bool readonly, char const* format, ssize_t itemsize
+    , std::vector<ssize_t> const& shape, std::vector<ssize_t> const& strides)
+  {
+      view->obj = 0;
+      if (readonly && (flags & PyBUF_WRITABLE) == PyBUF_WRITABLE)
+      {
+          PyErr_SetString(PyExc_BufferError, "object's buffer is read-only");
+          return -1;
+      }
+
+      std::size_t const ndim = shape.size();
+      if (!strides.empty() && strides.size() != ndim)
+      {
+          PyErr_SetString(PyExc_BufferError, "buffer has mismatched shape and strides");
+          return -1;
+      }
+
+      // The shape and strides live until the buffer is released
+      ssize_t* extents = static_cast<ssize_t*>(PyMem_Malloc(2 * ndim * sizeof(ssize_t) + 1));
+      if (extents == 0)
+      {
+          PyErr_NoMemory();
+          return -1;
+      }
+
+      ssize_t len = itemsize;
+      for (std::size_t i = 0; i < ndim; ++i)
+      {
+          extents[i] = shape[i];
+          len *= shape[i];
+      }
+
+      // Use the strides of C order, unless others were given
+      ssize_t stride = itemsize;
+      for (std::size_t i = ndim; i-- > 0;)
+      {
+          extents[ndim + i] = strides.empty() ? stride : strides[i];
+          stride *= shape[i];
+      }
+
+      Py_buffer info = Py_buffer();
+      info.buf = data;
+      info.len = len;
+      info.itemsize = itemsize;
+      info.ndim = static_cast<int>(ndim);
+      info.shape = extents;
+      info.strides = extents + ndim;
+
+      // A consumer that can't follow strides needs the elements in the
+      // order it asked for.
+      bool contiguous = true;
+      if ((flags & PyBUF_ANY_CONTIGUOUS) == PyBUF_ANY_CONTIGUOUS)
+          contiguous = PyBuffer_IsContiguous(&info, 'A');
+      else if ((flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS)
+          contiguous = PyBuffer_IsContiguous(&info, 'F');
+      else if ((flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS
+               || (flags & PyBUF_STRIDES) != PyBUF_STRIDES)
+          contiguous = PyBuffer_IsContiguous(&info, 'C');
+
+      if (!contiguous)
+      {
+          PyMem_Free(extents);
+          PyErr_SetString(PyExc_BufferError, "buffer is not contiguous in the requested order");
+          return -1;
+      }
+
+      view->buf = data;
+      view->obj = python::incref(self);
+      view->len = len;
+      view->readonly = readonly;
+      view->itemsize = itemsize;
+      view->format = (flags & PyBUF_FORMAT) ? const_cast<char*>(format) : 0;
+      view->ndim = static_cast<int>(ndim);
+      view->shape = (flags & PyBUF_ND) == PyBUF_ND ? extents : 0;
+      view->strides = (flags & PyBUF_STRIDES) == PyBUF_STRIDES ? extents + ndim : 0;
+      view->suboffsets = 0;
+      view->internal = extents;
+      return 0;
+  }
+#endif
+  
   void class_base::add_property(
     char const* name, object const& fget, char const* docstr)
   {
@@ -197,7 +197,8 @@ enum_base::enum_base(
 
     converters.m_class_object = downcast<PyTypeObject>(this->ptr());
     converter::registry::insert(to_python, id);
-    converter::registry::insert(convertible, construct, id);
+    // Only instances of the enum class are accepted
+    converter::registry::insert(convertible, construct, id, 0, true);
 }
 
 void enum_base::add_value(char const* name_, long value)
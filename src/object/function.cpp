@@ -16,15 +16,20 @@
 #include <boost/python/tuple.hpp>
 #include <boost/python/list.hpp>
 #include <boost/python/ssize_t.hpp>
+#include <boost/python/converter/from_python.hpp>
 
 #include <boost/python/detail/signature.hpp>
 #include <boost/python/detail/none.hpp>
+#include <boost/python/detail/preprocessor.hpp>
 #include <boost/mpl/vector/vector10.hpp>
 
 #include <boost/bind.hpp>
 
 #include <algorithm>
 #include <cstring>
+#include <functional>
+#include <utility>
+#include <vector>
 
 #if BOOST_PYTHON_DEBUG_ERROR_MESSAGES
 # include <cstdio>
@@ -53,6 +58,278 @@ unsigned py_function_impl_base::max_arity() const
 
 extern PyTypeObject function_type;
 
+#ifdef BOOST_PYTHON_HAS_VECTORCALL
+extern "C"
+{
+    static PyObject* function_vectorcall(
+        PyObject* func, PyObject* const* args, std::size_t nargsf, PyObject* kwnames);
+}
+#endif
+
+namespace
+{
+  inline PyObject* intern_string(char const* s)
+  {
+#if PY_VERSION_HEX >= 0x03000000
+      return PyUnicode_InternFromString(s);
+#else
+      return PyString_InternFromString(s);
+#endif
+  }
+
+  typedef std::pair<PyObject*, unsigned> name_position;
+  
+  struct name_address_less
+  {
+      bool operator()(name_position const& x, name_position const& y) const
+      {
+          return std::less<PyObject*>()(x.first, y.first);
+      }
+  };
+}
+
+//
+// The keyword names accepted by a function, indexed by argument
+// position, along with a map from names to positions. A plan is
+// built once per function, and overloads whose names are a prefix of
+// another overload's names share its plan, so that the keyword
+// arguments of a call are bound only once for all of them.
+//
+struct keyword_plan
+{
+    keyword_plan(
+        python::detail::keyword const* names, unsigned num_keywords, unsigned max_arity);
+
+    // The argument position with the given name, or -1 if there is none
+    int position(PyObject* name) const;
+
+    // True iff every name in other appears at the same position here
+    bool extends(keyword_plan const& other) const;
+
+    std::size_t size() const { return m_names.size(); }
+    
+ private:
+    std::vector<handle<> > m_names;         // null for positional-only arguments
+    std::vector<name_position> m_positions; // sorted by name address
+};
+
+keyword_plan::keyword_plan(
+    python::detail::keyword const* names, unsigned num_keywords, unsigned max_arity)
+    : m_names(max_arity)
+{
+    unsigned keyword_offset = max_arity > num_keywords ? max_arity - num_keywords : 0;
+
+    for (unsigned i = 0; i < num_keywords && i + keyword_offset < max_arity; ++i)
+    {
+        unsigned position = i + keyword_offset;
+        m_names[position] = handle<>(intern_string(names[i].name));
+        m_positions.push_back(name_position(m_names[position].get(), position));
+    }
+    std::sort(m_positions.begin(), m_positions.end(), name_address_less());
+}
+
+int keyword_plan::position(PyObject* name) const
+{
+    // Keyword names from Python source code are interned, so usually
+    // the address alone identifies them.
+    std::vector<name_position>::const_iterator p = std::lower_bound(
+        m_positions.begin(), m_positions.end(), name_position(name, 0), name_address_less());
+    
+    if (p != m_positions.end() && p->first == name)
+        return p->second;
+
+    for (std::size_t i = 0; i < m_names.size(); ++i)
+    {
+        if (!m_names[i])
+            continue;
+        
+        int equal = PyObject_RichCompareBool(m_names[i].get(), name, Py_EQ);
+        if (equal > 0)
+            return i;
+        if (equal < 0)
+            PyErr_Clear();
+    }
+    return -1;
+}
+
+bool keyword_plan::extends(keyword_plan const& other) const
+{
+    if (other.m_names.size() > m_names.size())
+        return false;
+    
+    for (std::size_t i = 0; i < other.m_names.size(); ++i)
+    {
+        if (other.m_names[i].get() != m_names[i].get())
+            return false;
+    }
+    return true;
+}
+
+//
+// The arguments of a call, as received either through tp_call (a
+// tuple and an optional dict) or through vectorcall (an array and a
+// tuple of keyword names). The tuple and dict forms are only built
+// if some overload needs them, at most once per call.
+//
+// Overloads called with positional arguments only still need the
+// tuple, since py_function takes one and CallPolicies index into it
+// in precall() and postcall(). Vectorcall saves the kwargs dict and
+// the bound method's argument tuple, not that one.
+//
+struct call_arguments
+{
+    call_arguments(PyObject* args, PyObject* keywords)
+      : n_positional(PyTuple_GET_SIZE(args))
+      , n_keywords(keywords ? PyDict_Size(keywords) : 0)
+      , m_stack(0)
+      , m_kwnames(0)
+      , m_args(borrowed(args))
+      , m_keywords(allow_null(borrowed(keywords)))
+    {}
+
+    call_arguments(PyObject* const* stack, std::size_t nargs, PyObject* kwnames)
+      : n_positional(nargs)
+      , n_keywords(kwnames ? PyTuple_GET_SIZE(kwnames) : 0)
+      , m_stack(stack)
+      , m_kwnames(kwnames)
+    {}
+
+    PyObject* positional(std::size_t i) const
+    {
+        return m_stack ? m_stack[i] : PyTuple_GET_ITEM(m_args.get(), i);
+    }
+
+    // The positional arguments as a tuple
+    PyObject* args();
+
+    // The keyword arguments as a dict, or 0 if there are none
+    PyObject* keywords();
+
+    // Steps through the keyword arguments; pos starts at 0
+    bool next_keyword(ssize_t& pos, PyObject*& name, PyObject*& value) const;
+
+    std::size_t const n_positional;
+    std::size_t const n_keywords;
+    
+ private:
+    PyObject* const* m_stack;
+    PyObject* m_kwnames;
+    handle<> m_args;
+    handle<> m_keywords;
+};
+
+PyObject* call_arguments::args()
+{
+    if (!m_args)
+    {
+        m_args = handle<>(PyTuple_New(static_cast<ssize_t>(n_positional)));
+        for (std::size_t i = 0; i < n_positional; ++i)
+            PyTuple_SET_ITEM(m_args.get(), i, incref(m_stack[i]));
+    }
+    return m_args.get();
+}
+
+PyObject* call_arguments::keywords()
+{
+    if (!m_keywords && n_keywords != 0)
+    {
+        m_keywords = handle<>(PyDict_New());
+        for (std::size_t i = 0; i < n_keywords; ++i)
+        {
+            if (PyDict_SetItem(
+                    m_keywords.get()
+                  , PyTuple_GET_ITEM(m_kwnames, i)
+                  , m_stack[n_positional + i]) < 0)
+            {
+                throw_error_already_set();
+            }
+        }
+    }
+    return m_keywords.get();
+}
+
+bool call_arguments::next_keyword(ssize_t& pos, PyObject*& name, PyObject*& value) const
+{
+    if (m_kwnames)
+    {
+        if (pos >= static_cast<ssize_t>(n_keywords))
+            return false;
+        name = PyTuple_GET_ITEM(m_kwnames, pos);
+        value = m_stack[n_positional + pos];
+        ++pos;
+        return true;
+    }
+    return m_keywords && PyDict_Next(m_keywords.get(), &pos, &name, &value);
+}
+
+//
+// The arguments of a call arranged by position according to a
+// keyword_plan. Defaults are not filled in, since they belong to the
+// individual overloads.
+//
+struct bound_arguments
+{
+    bound_arguments() : plan(0) {}
+
+    void bind(keyword_plan const& plan, call_arguments const& arguments);
+    
+    keyword_plan const* plan;   // the plan these arguments were bound by
+    bool valid;                 // false if some argument couldn't be bound
+    std::size_t extent;         // one past the last position bound
+    PyObject** values;          // borrowed references, 0 if not supplied
+    
+ private:
+    PyObject* m_storage[BOOST_PYTHON_MAX_ARITY + 1];
+    std::vector<PyObject*> m_large_storage;
+};
+
+void bound_arguments::bind(keyword_plan const& plan_, call_arguments const& arguments)
+{
+    std::size_t n_unnamed_actual = arguments.n_positional;
+    std::size_t size = plan_.size();
+    
+    this->plan = &plan_;
+    
+    if (size <= sizeof(m_storage) / sizeof(*m_storage))
+    {
+        this->values = m_storage;
+    }
+    else
+    {
+        m_large_storage.resize(size);
+        this->values = &m_large_storage[0];
+    }
+    std::fill(values, values + size, (PyObject*)0);
+
+    this->valid = n_unnamed_actual <= size;
+    if (!valid)
+        return;
+    
+    // Fill in the positional arguments
+    for (std::size_t i = 0; i < n_unnamed_actual; ++i)
+        values[i] = arguments.positional(i);
+    this->extent = n_unnamed_actual;
+
+    // Place each keyword argument at the position of its name
+    ssize_t pos = 0;
+    PyObject* name;
+    PyObject* value;
+    while (arguments.next_keyword(pos, name, value))
+    {
+        int const arg_pos = plan_.position(name);
+
+        // An unknown name, or one already supplied positionally, fails
+        // the matching
+        if (arg_pos < 0 || values[arg_pos] != 0)
+        {
+            this->valid = false;
+            return;
+        }
+        values[arg_pos] = value;
+        this->extent = (std::max)(extent, std::size_t(arg_pos + 1));
+    }
+}
+
 function::function(
     py_function const& implementation
 #if BOOST_WORKAROUND(__EDG_VERSION__, == 245)
@@ -64,6 +341,7 @@ function::function(
     )
     : m_fn(implementation)
     , m_nkeyword_values(0)
+    , m_dispatch_next(0)
 {
     if (names_and_defaults != 0)
     {
@@ -102,11 +380,29 @@ function::function(
                 , incref(kv.ptr())
                 );
         }
+
+        if (num_keywords != 0)
+        {
+            m_keyword_plan.reset(
+                new keyword_plan(names_and_defaults, num_keywords, max_arity));
+        }
     }
     
     PyObject* p = this;
+    
+#ifdef BOOST_PYTHON_HAS_VECTORCALL
+    m_vectorcall = function_vectorcall;
+#endif
+    
     if (Py_TYPE(&function_type) == 0)
     {
+#ifdef BOOST_PYTHON_HAS_VECTORCALL
+        // function isn't a POD, so we can't use offsetof to locate
+        // the vectorcall slot
+        function_type.tp_vectorcall_offset
+            = reinterpret_cast<char*>(&m_vectorcall) - reinterpret_cast<char*>(p);
+        function_type.tp_flags |= Py_TPFLAGS_HAVE_VECTORCALL;
+#endif
         Py_TYPE(&function_type) = &PyType_Type;
         ::PyType_Ready(&function_type);
     }
@@ -120,110 +416,70 @@ function::~function()
 {
 }
 
+namespace
+{
+  // The number of argument type sequences remembered by each
+  // overloaded function.
+  std::size_t const dispatch_cache_size = 4;
+}
+
 PyObject* function::call(PyObject* args, PyObject* keywords) const
 {
-    std::size_t n_unnamed_actual = PyTuple_GET_SIZE(args);
-    std::size_t n_keyword_actual = keywords ? PyDict_Size(keywords) : 0;
-    std::size_t n_actual = n_unnamed_actual + n_keyword_actual;
+    call_arguments arguments(args, keywords);
+    return dispatch(arguments);
+}
+
+#ifdef BOOST_PYTHON_HAS_VECTORCALL
+PyObject* function::call(PyObject* const* args, std::size_t nargs, PyObject* kwnames) const
+{
+    call_arguments arguments(args, nargs, kwnames);
+    return dispatch(arguments);
+}
+#endif
+
+PyObject* function::dispatch(call_arguments& arguments) const
+{
+    // Keyword arguments are bound at most once for all the overloads
+    // sharing a keyword_plan.
+    bound_arguments bound;
+    function const* cached = 0;
+    
+#ifndef BOOST_PYTHON_NO_DISPATCH_CACHE
+    // Functions that are not overloaded have nothing to gain from the
+    // dispatch cache.
+    if (m_overloads)
+    {
+        dispatch_entry const* entry = find_dispatch_entry(arguments);
+        cached = entry ? entry->overload : 0;
+    }
+
+    if (cached)
+    {
+        PyObject* result = cached->call_overload(arguments, bound);
+        if (result != 0 || PyErr_Occurred())
+            return result;
+
+        // The overload which accepted these argument types before has
+        // rejected them now, so one of the converters involved looks
+        // at values as well as types. Selecting an overload from the
+        // types alone isn't safe; stop using the cache for them.
+        if (dispatch_entry* entry = find_dispatch_entry(arguments))
+            entry->overload = 0;
+    }
+
+    // Counts the overloads below refusing the arguments for their
+    // values rather than their types.
+    unsigned long value_refusals = converter::value_refusal_count();
+#endif 
     
     function const* f = this;
 
     // Try overloads looking for a match
     do
     {
-        // Check for a plausible number of arguments
-        unsigned min_arity = f->m_fn.min_arity();
-        unsigned max_arity = f->m_fn.max_arity();
-
-        if (n_actual + f->m_nkeyword_values >= min_arity
-            && n_actual <= max_arity)
+        if (f != cached)
         {
-            // This will be the args that actually get passed
-            handle<>inner_args(allow_null(borrowed(args)));
-
-            if (n_keyword_actual > 0      // Keyword arguments were supplied
-                 || n_actual < min_arity) // or default keyword values are needed
-            {                            
-                if (f->m_arg_names.is_none())
-                {
-                    // this overload doesn't accept keywords
-                    inner_args = handle<>();
-                }
-                else
-                {
-                    // "all keywords are none" is a special case
-                    // indicating we will accept any number of keyword
-                    // arguments
-                    if (PyTuple_Size(f->m_arg_names.ptr()) == 0)
-                    {
-                        // no argument preprocessing
-                    }
-                    else if (n_actual > max_arity)
-                    {
-                        // too many arguments
-                        inner_args = handle<>();
-                    }
-                    else
-                    {
-                        // build a new arg tuple, will adjust its size later
-                        assert(max_arity <= static_cast<std::size_t>(ssize_t_max));
-                        inner_args = handle<>(
-                            PyTuple_New(static_cast<ssize_t>(max_arity)));
-
-                        // Fill in the positional arguments
-                        for (std::size_t i = 0; i < n_unnamed_actual; ++i)
-                            PyTuple_SET_ITEM(inner_args.get(), i, incref(PyTuple_GET_ITEM(args, i)));
-
-                        // Grab remaining arguments by name from the keyword dictionary
-                        std::size_t n_actual_processed = n_unnamed_actual;
-                
-                        for (std::size_t arg_pos = n_unnamed_actual; arg_pos < max_arity ; ++arg_pos)
-                        {
-                            // Get the keyword[, value pair] corresponding
-                            PyObject* kv = PyTuple_GET_ITEM(f->m_arg_names.ptr(), arg_pos);
-
-                            // If there were any keyword arguments,
-                            // look up the one we need for this
-                            // argument position
-                            PyObject* value = n_keyword_actual
-                                ? PyDict_GetItem(keywords, PyTuple_GET_ITEM(kv, 0))
-                                : 0;
-
-                            if (!value)
-                            {
-                                // Not found; check if there's a default value
-                                if (PyTuple_GET_SIZE(kv) > 1)
-                                    value = PyTuple_GET_ITEM(kv, 1);
-                        
-                                if (!value)
-                                {
-                                    // still not found; matching fails
-                                    PyErr_Clear();
-                                    inner_args = handle<>();
-                                    break;
-                                }
-                            }
-                            else
-                            {
-                                ++n_actual_processed;
-                            }
-
-                            PyTuple_SET_ITEM(inner_args.get(), arg_pos, incref(value));
-                        }
-
-                        if (inner_args.get())
-                        {
-                            //check if we proccessed all the arguments
-                            if(n_actual_processed < n_actual)
-                                inner_args = handle<>();
-                        }
-                    }
-                }
-            }
-            
-            // Call the function.  Pass keywords in case it's a
-            // function accepting any number of keywords
-            PyObject* result = inner_args ? f->m_fn(inner_args.get(), keywords) : 0;
+            PyObject* result = f->call_overload(arguments, bound);
             
             // If the result is NULL but no error was set, m_fn failed
             // the argument-matching test.
@@ -232,16 +488,176 @@ PyObject* function::call(PyObject* args, PyObject* keywords) const
             // well-behaved and never return NULL to python without
             // setting an error.
             if (result != 0 || PyErr_Occurred())
+            {
+#ifndef BOOST_PYTHON_NO_DISPATCH_CACHE
+                // An overload which refused these arguments for their
+                // values might accept others of the same types, so f
+                // is only known to be the one selected by the types
+                // when every refusal came from the types alone.
+                if (result != 0 && m_overloads)
+                {
+                    cache_overload(
+                        arguments
+                        , converter::value_refusal_count() == value_refusals ? f : 0);
+                }
+#endif 
                 return result;
+            }
         }
         f = f->m_overloads.get();
     }
     while (f);
     // None of the overloads matched; time to generate the error message
-    argument_error(args, keywords);
+    argument_error(arguments.args(), arguments.keywords());
     return 0;
 }
 
+PyObject* function::call_overload(
+    call_arguments& arguments, bound_arguments& bound) const
+{
+    std::size_t n_keyword_actual = arguments.n_keywords;
+    std::size_t n_actual = arguments.n_positional + n_keyword_actual;
+    
+    // Check for a plausible number of arguments
+    unsigned min_arity = m_fn.min_arity();
+    unsigned max_arity = m_fn.max_arity();
+
+    if (n_actual + m_nkeyword_values < min_arity || n_actual > max_arity)
+        return 0;
+    
+    if (n_keyword_actual > 0      // Keyword arguments were supplied
+         || n_actual < min_arity) // or default keyword values are needed
+    {                            
+        if (m_arg_names.is_none())
+        {
+            // this overload doesn't accept keywords
+            return 0;
+        }
+        
+        // "all keywords are none" is a special case indicating we
+        // will accept any number of keyword arguments, and has no
+        // keyword_plan
+        if (m_keyword_plan)
+        {
+            if (bound.plan != m_keyword_plan.get())
+                bound.bind(*m_keyword_plan, arguments);
+
+            if (!bound.valid || bound.extent > max_arity)
+                return 0;
+            
+            // This will be the args that actually get passed
+            assert(max_arity <= static_cast<std::size_t>(ssize_t_max));
+            handle<> inner_args(PyTuple_New(static_cast<ssize_t>(max_arity)));
+
+            for (std::size_t arg_pos = 0; arg_pos < max_arity; ++arg_pos)
+            {
+                PyObject* value = bound.values[arg_pos];
+                
+                if (!value)
+                {
+                    // Not supplied; check if there's a default value
+                    PyObject* kv = PyTuple_GET_ITEM(m_arg_names.ptr(), arg_pos);
+                    
+                    if (kv == Py_None || PyTuple_GET_SIZE(kv) < 2)
+                        return 0; // matching fails
+
+                    value = PyTuple_GET_ITEM(kv, 1);
+                }
+                
+                PyTuple_SET_ITEM(inner_args.get(), arg_pos, incref(value));
+            }
+
+            // All keyword arguments have been placed by position
+            return m_fn(inner_args.get(), 0);
+        }
+    }
+    
+    // Call the function.  Pass keywords in case it's a
+    // function accepting any number of keywords. The argument tuple is
+    // built for the first overload needing it, and shared by the rest.
+    return m_fn(arguments.args(), arguments.keywords());
+}
+
+function::dispatch_entry* function::find_dispatch_entry(
+    call_arguments const& arguments) const
+{
+    std::size_t n_args = arguments.n_positional;
+    std::size_t n_keywords = arguments.n_keywords;
+    
+    for (std::vector<dispatch_entry>::iterator p = m_dispatch_cache.begin();
+         p != m_dispatch_cache.end(); ++p)
+    {
+        if (p->keyword_names.size() != n_keywords
+            || p->arg_types.size() != n_args + n_keywords)
+        {
+            continue;
+        }
+
+        std::size_t i = 0;
+        while (i < n_args && p->arg_types[i] == Py_TYPE(arguments.positional(i)))
+            ++i;
+
+        if (i < n_args)
+            continue;
+
+        // Keyword names are compared by identity, since they are nearly
+        // always interned; an equal name which isn't only misses the
+        // entry. The same keywords passed in another order make another.
+        ssize_t pos = 0;
+        PyObject* name;
+        PyObject* value;
+        while (arguments.next_keyword(pos, name, value)
+               && p->keyword_names[i - n_args].get() == name
+               && p->arg_types[i] == Py_TYPE(value))
+        {
+            ++i;
+        }
+        
+        if (i == n_args + n_keywords)
+            return &*p;
+    }
+    return 0;
+}
+
+void function::cache_overload(
+    call_arguments const& arguments, function const* overload) const
+{
+    // Leave existing entries alone; in particular, argument types
+    // which have been found unsuitable for caching stay that way. A
+    // null overload records them as unsuitable.
+    if (find_dispatch_entry(arguments))
+        return;
+    
+    std::size_t n_args = arguments.n_positional;
+    
+    dispatch_entry entry;
+    entry.overload = overload;
+    entry.keyword_names.reserve(arguments.n_keywords);
+    entry.arg_types.reserve(n_args + arguments.n_keywords);
+    for (std::size_t i = 0; i < n_args; ++i)
+        entry.arg_types.push_back(Py_TYPE(arguments.positional(i)));
+
+    ssize_t pos = 0;
+    PyObject* name;
+    PyObject* value;
+    while (arguments.next_keyword(pos, name, value))
+    {
+        entry.keyword_names.push_back(handle<>(borrowed(name)));
+        entry.arg_types.push_back(Py_TYPE(value));
+    }
+
+    // Replace the entries round-robin once the cache is full.
+    if (m_dispatch_cache.size() < dispatch_cache_size)
+    {
+        m_dispatch_cache.push_back(entry);
+    }
+    else
+    {
+        std::swap(m_dispatch_cache[m_dispatch_next], entry);
+        m_dispatch_next = (m_dispatch_next + 1) % dispatch_cache_size;
+    }
+}
+
 object function::signature(bool show_return_type) const
 {
     py_function const& impl = m_fn;
@@ -328,11 +744,36 @@ void function::add_overload(handle<function> const& overload_)
 
     parent->m_overloads = overload_;
 
+    // The overload chain has changed; forget which overloads matched.
+    m_dispatch_cache.clear();
+    m_dispatch_next = 0;
+
     // If we have no documentation, get the docs from the overload
     if (!m_doc)
         m_doc = overload_->m_doc;
 }
 
+void function::share_keyword_plans()
+{
+    // Let each overload bind its keywords by the longest plan among
+    // the overloads which extends its own.
+    for (function* f = this; f; f = f->m_overloads.get())
+    {
+        if (!f->m_keyword_plan)
+            continue;
+        
+        for (function* g = this; g; g = g->m_overloads.get())
+        {
+            if (g->m_keyword_plan
+                && g->m_keyword_plan->size() > f->m_keyword_plan->size()
+                && g->m_keyword_plan->extends(*f->m_keyword_plan))
+            {
+                f->m_keyword_plan = g->m_keyword_plan;
+            }
+        }
+    }
+}
+
 namespace
 {
   char const* const binary_operator_names[] =
@@ -486,6 +927,8 @@ void function::add_to_namespace(
             new_func->add_overload(not_implemented_function());
         }
 
+        new_func->share_keyword_plans();
+
         // A function is named the first time it is added to a namespace.
         if (new_func->name().is_none())
             new_func->m_name = name;
@@ -591,6 +1034,33 @@ namespace
       PyObject* m_args;
       PyObject* m_keywords;
   };
+
+#ifdef BOOST_PYTHON_HAS_VECTORCALL
+  struct bind_vectorcall_return
+  {
+      bind_vectorcall_return(
+          PyObject*& result, function const* f
+        , PyObject* const* args, std::size_t nargs, PyObject* kwnames)
+          : m_result(result)
+            , m_f(f)
+            , m_args(args)
+            , m_nargs(nargs)
+            , m_kwnames(kwnames)
+      {}
+
+      void operator()() const
+      {
+          m_result = m_f->call(m_args, m_nargs, m_kwnames);
+      }
+      
+   private:
+      PyObject*& m_result;
+      function const* m_f;
+      PyObject* const* m_args;
+      std::size_t m_nargs;
+      PyObject* m_kwnames;
+  };
+#endif
 }
 
 extern "C"
@@ -627,6 +1097,18 @@ extern "C"
         return result;
     }
 
+#ifdef BOOST_PYTHON_HAS_VECTORCALL
+    static PyObject *
+    function_vectorcall(PyObject *func, PyObject *const *args, std::size_t nargsf, PyObject *kwnames)
+    {
+        PyObject* result = 0;
+        handle_exception(
+            bind_vectorcall_return(
+                result, static_cast<function*>(func), args, PyVectorcall_NARGS(nargsf), kwnames));
+        return result;
+    }
+#endif
+
     //
     // Here we're using the function's tp_getset rather than its
     // tp_members to set up __doc__ and __name__, because tp_members
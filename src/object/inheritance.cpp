@@ -3,7 +3,9 @@
 // accompanying file LICENSE_1_0.txt or copy at
 // http://www.boost.org/LICENSE_1_0.txt)
 #include <boost/python/object/inheritance.hpp>
+#include <boost/python/object/inheritance_query.hpp>
 #include <boost/python/type_id.hpp>
+#include <boost/python/dict.hpp>
 #include <boost/graph/breadth_first_search.hpp>
 #if _MSC_FULL_VER >= 13102171 && _MSC_FULL_VER <= 13102179
 # include <boost/graph/reverse_graph.hpp>
@@ -13,12 +15,22 @@
 #include <boost/property_map/property_map.hpp>
 #include <boost/bind.hpp>
 #include <boost/integer_traits.hpp>
+#include <boost/cstdint.hpp>
 #include <boost/tuple/tuple.hpp>
 #include <boost/tuple/tuple_comparison.hpp>
+#include <boost/atomic.hpp>
+#include <boost/noncopyable.hpp>
+#include <boost/static_assert.hpp>
+#include <boost/python/detail/pythread_sync.hpp>
 #include <queue>
 #include <vector>
 #include <functional>
 
+// The number of entries in the cast cache; must be a power of two.
+#ifndef BOOST_PYTHON_CAST_CACHE_SIZE
+# define BOOST_PYTHON_CAST_CACHE_SIZE 4096
+#endif
+
 //
 // Procedure:
 //
@@ -77,7 +89,14 @@ namespace
   
   struct smart_graph
   {
-      typedef std::vector<std::size_t>::const_iterator node_distance_map;
+      // Distances are kept in a vertex-count-squared matrix, so they
+      // are stored compactly. Inheritance chains are never long
+      // enough to overflow them.
+      typedef boost::uint16_t distance_t;
+      typedef std::vector<distance_t>::const_iterator node_distance_map;
+
+      BOOST_STATIC_CONSTANT(
+          distance_t, unreachable = integer_traits<distance_t>::const_max);
       
       typedef std::pair<cast_graph::out_edge_iterator
                         , cast_graph::out_edge_iterator> out_edges_t;
@@ -90,11 +109,12 @@ namespace
           if (m_distances.size() != n * n)
           {
               m_distances.clear();
-              m_distances.resize(n * n, (std::numeric_limits<std::size_t>::max)());
+              m_distances.resize(n * n, distance_t(unreachable));
               m_known_vertices = n;
+              m_frozen = false;
           }
           
-          std::vector<std::size_t>::iterator to_target = m_distances.begin() + n * target;
+          std::vector<distance_t>::iterator to_target = m_distances.begin() + n * target;
 
           // this node hasn't been used as a target yet
           if (to_target[target] != 0)
@@ -123,17 +143,50 @@ namespace
           return to_target;
       }
 
+      // Compute the distances to every node now, rather than on the
+      // first search for each one. They stay valid until the graph
+      // changes.
+      void freeze() const
+      {
+          if (m_frozen && m_known_vertices == num_vertices(m_topology))
+              return;
+          
+          std::size_t n = num_vertices(m_topology);
+          for (std::size_t v = 0; v < n; ++v)
+              distances_to(v);
+          m_frozen = true;
+      }
+
+      // Forget all distances; call after adding an edge
+      void invalidate()
+      {
+          m_distances.clear();
+          m_frozen = false;
+      }
+      
+      bool frozen() const
+      {
+          return m_frozen && m_known_vertices == num_vertices(m_topology);
+      }
+      
+      std::size_t distance_bytes() const
+      {
+          return m_distances.capacity() * sizeof(distance_t);
+      }
+
       cast_graph& topology() { return m_topology; }
       cast_graph const& topology() const { return m_topology; }
 
       smart_graph()
           : m_known_vertices(0)
+          , m_frozen(false)
       {}
       
    private:
       cast_graph m_topology;
-      mutable std::vector<std::size_t> m_distances;
+      mutable std::vector<distance_t> m_distances;
       mutable std::size_t m_known_vertices;
+      mutable bool m_frozen;
   };
   
   smart_graph& full_graph()
@@ -234,9 +287,132 @@ namespace
       return std::make_pair(first, second);
   }
 
+  //
+  // Casts at constant offsets. Where every edge along some path from
+  // one class to another is a cast to a non-virtual base, the cast
+  // along the whole path just adds a constant to the address. We
+  // record the offset for every pair of classes connected by such a
+  // path, so those casts needn't search the graph.
+  //
+  struct static_path
+  {
+      static_path(vertex_t target, std::ptrdiff_t offset, bool ambiguous)
+          : target(target)
+          , offset(offset)
+          , ambiguous(ambiguous)
+      {}
+      
+      vertex_t target;
+      std::ptrdiff_t offset;
+      bool ambiguous;   // the paths to target have different offsets
+
+      bool operator<(static_path const& rhs) const
+      {
+          return target < rhs.target;
+      }
+  };
+  
+  class static_path_table
+  {
+   public:
+      static_path_table()
+          : m_size(0)
+      {}
+      
+      // Return the path from src to dst, or 0 if there's no
+      // unambiguous one
+      static_path const* find(vertex_t src, vertex_t dst) const
+      {
+          if (src >= m_paths.size())
+              return 0;
+          
+          std::vector<static_path> const& paths = m_paths[src];
+          std::vector<static_path>::const_iterator p = std::lower_bound(
+              paths.begin(), paths.end(), static_path(dst, 0, false));
+          
+          return p == paths.end() || p->target != dst || p->ambiguous ? 0 : &*p;
+      }
+
+      // Add an edge at the given offset, and all the paths through it
+      void add(vertex_t src, vertex_t dst, std::ptrdiff_t offset)
+      {
+          std::size_t n = (std::max)(src, dst) + 1;
+          if (m_paths.size() < n)
+          {
+              m_paths.resize(n);
+              m_sources.resize(n);
+          }
+
+          // Everything reaching src (as paths whose target is the
+          // start), and everything reached from dst
+          std::vector<static_path> heads(1, static_path(src, 0, false));
+          for (std::vector<vertex_t>::const_iterator p = m_sources[src].begin();
+               p != m_sources[src].end(); ++p)
+          {
+              static_path const* to_src = lookup(*p, src);
+              heads.push_back(static_path(*p, to_src->offset, to_src->ambiguous));
+          }
+          
+          std::vector<static_path> tails(m_paths[dst]);
+          tails.push_back(static_path(dst, 0, false));
+
+          for (std::vector<static_path>::const_iterator h = heads.begin(); h != heads.end(); ++h)
+          {
+              for (std::vector<static_path>::const_iterator t = tails.begin(); t != tails.end(); ++t)
+              {
+                  if (h->target != t->target)
+                      update(
+                          h->target, t->target, h->offset + offset + t->offset
+                        , h->ambiguous || t->ambiguous);
+              }
+          }
+      }
+
+      std::size_t size() const { return m_size; }
+      
+   private:
+      static_path* lookup(vertex_t src, vertex_t dst)
+      {
+          std::vector<static_path>& paths = m_paths[src];
+          std::vector<static_path>::iterator p = std::lower_bound(
+              paths.begin(), paths.end(), static_path(dst, 0, false));
+          return p == paths.end() || p->target != dst ? 0 : &*p;
+      }
+      
+      void update(vertex_t src, vertex_t dst, std::ptrdiff_t offset, bool ambiguous)
+      {
+          std::vector<static_path>& paths = m_paths[src];
+          std::vector<static_path>::iterator p = std::lower_bound(
+              paths.begin(), paths.end(), static_path(dst, 0, false));
+          
+          if (p == paths.end() || p->target != dst)
+          {
+              paths.insert(p, static_path(dst, offset, ambiguous));
+              m_sources[dst].push_back(src);
+              ++m_size;
+          }
+          else if (ambiguous || p->offset != offset)
+          {
+              // Distinct non-virtual base subobjects of the same type
+              // are at distinct offsets; leave those to the graph search.
+              p->ambiguous = true;
+          }
+      }
+      
+      std::vector<std::vector<static_path> > m_paths;  // sorted, by source
+      std::vector<std::vector<vertex_t> > m_sources;   // by target
+      std::size_t m_size;
+  };
+
+  static_path_table& static_paths()
+  {
+      static static_path_table x;
+      return x;
+  }
+  
   struct q_elt
   {
-      q_elt(std::size_t distance
+      q_elt(smart_graph::distance_t distance
             , void* src_address
             , vertex_t target
             , cast_function cast
@@ -247,7 +423,7 @@ namespace
           , cast(cast)
       {}
       
-      std::size_t distance;
+      smart_graph::distance_t distance;
       void* src_address;
       vertex_t target;
       cast_function cast;
@@ -292,7 +468,7 @@ namespace
       
       smart_graph::node_distance_map d(g.distances_to(dst));
 
-      if (d[src] == (std::numeric_limits<std::size_t>::max)())
+      if (d[src] == smart_graph::unreachable)
           return 0;
 
       typedef property_map<cast_graph,edge_cast_t>::const_type cast_map;
@@ -347,48 +523,375 @@ namespace
       return 0;
   }
 
-  struct cache_element
+  //
+  // A cache of cast results, keyed on (source static type, target
+  // type, offset of the source within the most-derived object,
+  // most-derived type). It is an open-addressing hash table of fixed
+  // size: an entry lives within a few slots of its home position, and
+  // when those are all occupied one of them is evicted, preferring
+  // entries which haven't been used since the last eviction in that
+  // neighborhood (a "clock" policy).
+  //
+  // Lookups don't take any lock, so the cache can be read without the
+  // GIL or graph_lock(). Each slot carries a sequence number which is
+  // odd while the slot is being written; a reader passes over a slot
+  // whose number changed while it was reading. Writers are serialized
+  // by graph_lock() below.
+  //
+  class cast_cache : boost::noncopyable
   {
-      typedef tuples::tuple<
-          class_id              // source static type
-          , class_id            // target type
-          , std::ptrdiff_t      // offset within source object
-          , class_id            // source dynamic type
-          >::inherited key_type;
-
-      cache_element(key_type const& k)
-          : key(k)
-          , offset(0)
+   public:
+      // The cached offset for an unreachable target
+      BOOST_STATIC_CONSTANT(
+          std::ptrdiff_t, not_found = integer_traits<std::ptrdiff_t>::const_min);
+
+      struct key_type
+      {
+          class_id src_t;
+          class_id dst_t;
+          std::ptrdiff_t src_offset;   // offset within most-derived object
+          class_id src_dynamic_t;
+          
+          std::size_t hash() const
+          {
+              std::size_t h = src_t.hash();
+              h = h * 31 + dst_t.hash();
+              h = h * 31 + static_cast<std::size_t>(src_offset);
+              if (!(src_dynamic_t == src_t))
+                  h = h * 31 + src_dynamic_t.hash();
+              return h;
+          }
+      };
+      
+      cast_cache()
+        : m_generation(0)
+        , m_size(0)
+        , m_hits(0)
+        , m_misses(0)
+        , m_evictions(0)
       {}
+
+      // If key is in the cache, store its offset and return true
+      bool find(key_type const& key, std::size_t hash, std::ptrdiff_t& offset)
+      {
+          std::size_t const home = hash & mask;
+          
+          for (std::size_t i = 0; i < probe_length; ++i)
+          {
+              slot& s = m_slots[(home + i) & mask];
+              
+              unsigned const sequence = s.sequence.load(boost::memory_order_acquire);
+              bool const occupied = s.occupied.load(boost::memory_order_relaxed);
+              key_type k;
+              k.src_t = s.src_t.load(boost::memory_order_relaxed);
+              k.dst_t = s.dst_t.load(boost::memory_order_relaxed);
+              k.src_offset = s.src_offset.load(boost::memory_order_relaxed);
+              k.src_dynamic_t = s.src_dynamic_t.load(boost::memory_order_relaxed);
+              std::ptrdiff_t const result = s.offset.load(boost::memory_order_relaxed);
+              unsigned const generation = s.generation.load(boost::memory_order_relaxed);
+              boost::atomic_thread_fence(boost::memory_order_acquire);
+              
+              if ((sequence & 1) || s.sequence.load(boost::memory_order_relaxed) != sequence)
+                  continue; // being written; skip it
+
+              if (!occupied)
+                  break;    // entries are never removed, so key isn't here
+              
+              if (!equal(k, key))
+                  continue;
+              
+              // Adding a cast may have made an unreachable target reachable
+              if (result == not_found
+                  && generation != m_generation.load(boost::memory_order_relaxed))
+              {
+                  break;
+              }
+              
+              if (!s.referenced.load(boost::memory_order_relaxed))
+                  s.referenced.store(true, boost::memory_order_relaxed);
+              
+              m_hits.fetch_add(1, boost::memory_order_relaxed);
+              offset = result;
+              return true;
+          }
+          m_misses.fetch_add(1, boost::memory_order_relaxed);
+          return false;
+      }
+
+      // Record the offset for key. Requires graph_lock().
+      void insert(key_type const& key, std::size_t hash, std::ptrdiff_t offset)
+      {
+          std::size_t const home = hash & mask;
+          slot* target = 0;
+          
+          for (std::size_t i = 0; i < probe_length && !target; ++i)
+          {
+              slot& s = m_slots[(home + i) & mask];
+              if (!s.occupied.load(boost::memory_order_relaxed))
+              {
+                  target = &s;
+                  ++m_size;
+              }
+              else if (equal(load_key(s), key))
+              {
+                  target = &s;
+              }
+          }
+
+          if (!target)
+          {
+              target = victim(home);
+              m_evictions.fetch_add(1, boost::memory_order_relaxed);
+          }
+          
+          unsigned const sequence = target->sequence.load(boost::memory_order_relaxed);
+          target->sequence.store(sequence + 1, boost::memory_order_relaxed);
+          boost::atomic_thread_fence(boost::memory_order_release);
+          
+          target->src_t.store(key.src_t, boost::memory_order_relaxed);
+          target->dst_t.store(key.dst_t, boost::memory_order_relaxed);
+          target->src_offset.store(key.src_offset, boost::memory_order_relaxed);
+          target->src_dynamic_t.store(key.src_dynamic_t, boost::memory_order_relaxed);
+          target->offset.store(offset, boost::memory_order_relaxed);
+          target->generation.store(
+              m_generation.load(boost::memory_order_relaxed), boost::memory_order_relaxed);
+          target->referenced.store(false, boost::memory_order_relaxed);
+          target->occupied.store(true, boost::memory_order_relaxed);
+          
+          target->sequence.store(sequence + 2, boost::memory_order_release);
+      }
+
+      // Forget which targets were unreachable. Requires graph_lock().
+      void new_generation()
+      {
+          m_generation.fetch_add(1, boost::memory_order_relaxed);
+      }
+
+      std::size_t size() const { return m_size; }
+      std::size_t capacity() const { return slot_count; }
+      std::size_t hits() const { return m_hits.load(boost::memory_order_relaxed); }
+      std::size_t misses() const { return m_misses.load(boost::memory_order_relaxed); }
+      std::size_t evictions() const { return m_evictions.load(boost::memory_order_relaxed); }
       
-      key_type key;
-      std::ptrdiff_t offset;
+   private:
+      struct slot
+      {
+          slot()
+            : sequence(0)
+            , occupied(false)
+            , referenced(false)
+          {}
+          
+          boost::atomic<unsigned> sequence;
+          boost::atomic<bool> occupied;
+          boost::atomic<bool> referenced;
+          boost::atomic<class_id> src_t;
+          boost::atomic<class_id> dst_t;
+          boost::atomic<std::ptrdiff_t> src_offset;
+          boost::atomic<class_id> src_dynamic_t;
+          boost::atomic<std::ptrdiff_t> offset;
+          boost::atomic<unsigned> generation;
+      };
+
+      static bool equal(key_type const& x, key_type const& y)
+      {
+          return x.src_offset == y.src_offset
+              && x.src_t == y.src_t
+              && x.dst_t == y.dst_t
+              && x.src_dynamic_t == y.src_dynamic_t;
+      }
 
-      BOOST_STATIC_CONSTANT(
-          std::ptrdiff_t, not_found = integer_traits<std::ptrdiff_t>::const_min);
+      static key_type load_key(slot const& s)
+      {
+          key_type k;
+          k.src_t = s.src_t.load(boost::memory_order_relaxed);
+          k.dst_t = s.dst_t.load(boost::memory_order_relaxed);
+          k.src_offset = s.src_offset.load(boost::memory_order_relaxed);
+          k.src_dynamic_t = s.src_dynamic_t.load(boost::memory_order_relaxed);
+          return k;
+      }
+
+      // Choose the slot to evict from the neighborhood of home: the
+      // first one not used since it was last passed over, or else home
+      // itself. Every slot passed over loses its reference mark.
+      slot* victim(std::size_t home)
+      {
+          for (std::size_t i = 0; i < probe_length; ++i)
+          {
+              slot& s = m_slots[(home + i) & mask];
+              if (!s.referenced.load(boost::memory_order_relaxed))
+                  return &s;
+              s.referenced.store(false, boost::memory_order_relaxed);
+          }
+          return &m_slots[home];
+      }
+      
+      enum
+      {
+          slot_count = BOOST_PYTHON_CAST_CACHE_SIZE
+        , mask = slot_count - 1
+        , probe_length = 8
+      };
+      
+      BOOST_STATIC_ASSERT((slot_count & mask) == 0 && slot_count >= probe_length);
+      
+      slot m_slots[slot_count];
+      boost::atomic<unsigned> m_generation;
+      std::size_t m_size;
+      boost::atomic<std::size_t> m_hits;
+      boost::atomic<std::size_t> m_misses;
+      boost::atomic<std::size_t> m_evictions;
+  };
+
+  cast_cache& cache()
+  {
+      static cast_cache x;
+      return x;
+  }
+
+  //
+  // The dynamic_id functions of polymorphic classes, read without a
+  // lock in the same way as the cast cache, so that a cache hit never
+  // has to consult the type index. A class whose entry has been
+  // displaced by others is looked up in the index again.
+  //
+  class dynamic_id_cache : boost::noncopyable
+  {
+   public:
+      dynamic_id_cache() : m_next(0) {}
       
-      bool operator<(cache_element const& rhs) const
+      // Return the function cached for type, or 0
+      dynamic_id_function find(class_id type) const
       {
-          return this->key < rhs.key;
+          std::size_t const home = type.hash() & mask;
+          
+          for (std::size_t i = 0; i < probe_length; ++i)
+          {
+              slot const& s = m_slots[(home + i) & mask];
+              
+              unsigned const sequence = s.sequence.load(boost::memory_order_acquire);
+              class_id const t = s.type.load(boost::memory_order_relaxed);
+              dynamic_id_function const f = s.function.load(boost::memory_order_relaxed);
+              boost::atomic_thread_fence(boost::memory_order_acquire);
+              
+              if ((sequence & 1) || s.sequence.load(boost::memory_order_relaxed) != sequence)
+                  continue; // being written; skip it
+
+              if (f == 0)
+                  break;    // slots are never emptied, so type isn't here
+              
+              if (t == type)
+                  return f;
+          }
+          return 0;
       }
 
-      bool unreachable() const
+      // Record the function, which isn't 0, for type. Requires
+      // graph_lock().
+      void insert(class_id type, dynamic_id_function f)
       {
-          return offset == not_found;
+          std::size_t const home = type.hash() & mask;
+          slot* target = 0;
+          
+          for (std::size_t i = 0; i < probe_length && !target; ++i)
+          {
+              slot& s = m_slots[(home + i) & mask];
+              if (s.function.load(boost::memory_order_relaxed) == 0
+                  || s.type.load(boost::memory_order_relaxed) == type)
+              {
+                  target = &s;
+              }
+          }
+
+          // Displace the entries of a full neighborhood in turn
+          if (!target)
+              target = &m_slots[(home + m_next++ % probe_length) & mask];
+          
+          unsigned const sequence = target->sequence.load(boost::memory_order_relaxed);
+          target->sequence.store(sequence + 1, boost::memory_order_relaxed);
+          boost::atomic_thread_fence(boost::memory_order_release);
+          
+          target->type.store(type, boost::memory_order_relaxed);
+          target->function.store(f, boost::memory_order_relaxed);
+          
+          target->sequence.store(sequence + 2, boost::memory_order_release);
       }
+      
+   private:
+      struct slot
+      {
+          slot() : sequence(0), function(0) {}
+          
+          boost::atomic<unsigned> sequence;
+          boost::atomic<class_id> type;
+          boost::atomic<dynamic_id_function> function;
+      };
+
+      enum
+      {
+          slot_count = 1024
+        , mask = slot_count - 1
+        , probe_length = 8
+      };
+      
+      slot m_slots[slot_count];
+      std::size_t m_next;
   };
-  
-  enum { kdst_t = ksrc_static_t + 1, koffset, ksrc_dynamic_t };
-  typedef std::vector<cache_element> cache_t;
 
-  cache_t& cache()
+  dynamic_id_cache& dynamic_ids()
   {
-      static cache_t x;
+      static dynamic_id_cache x;
       return x;
   }
 
+  // Serializes access to the type index, the casting graphs and
+  // writes to the caches. Searches of the graph are made while holding
+  // it, so it is a lock which blocks rather than spins. It is first
+  // used while a class is registered, with the GIL held.
+  PyThread_type_lock graph_lock()
+  {
+      static PyThread_type_lock const x = python::detail::allocate_pythread_lock();
+      return x;
+  }
+
+  typedef python::detail::scoped_pythread_lock scoped_graph_lock;
+
   inline void* convert_type(void* const p, class_id src_t, class_id dst_t, bool polymorphic)
   {
+      // Look up the dynamic_id function and call it to get the dynamic
+      // info
+      boost::python::objects::dynamic_id_t dynamic_id(p, src_t);
+      if (polymorphic)
+      {
+          dynamic_id_function get_dynamic_id = dynamic_ids().find(src_t);
+          if (get_dynamic_id == 0)
+          {
+              scoped_graph_lock lock(graph_lock());
+              
+              // Quickly rule out unregistered types
+              index_entry* src_p = seek_type(src_t);
+              if (src_p == 0)
+                  return 0;
+              get_dynamic_id = tuples::get<kdynamic_id>(*src_p);
+              dynamic_ids().insert(src_t, get_dynamic_id);
+          }
+          dynamic_id = get_dynamic_id(p);
+      }
+    
+      // Look in the cache first for a quickie address translation
+      cast_cache::key_type key;
+      key.src_t = src_t;
+      key.dst_t = dst_t;
+      key.src_offset = (char*)p - (char*)dynamic_id.first;
+      key.src_dynamic_t = dynamic_id.second;
+      std::size_t const hash = key.hash();
+
+      std::ptrdiff_t offset;
+      if (cache().find(key, hash, offset))
+          return offset == cast_cache::not_found ? 0 : (char*)p + offset;
+
+      scoped_graph_lock lock(graph_lock());
+      
       // Quickly rule out unregistered types
       index_entry* src_p = seek_type(src_t);
       if (src_p == 0)
@@ -397,40 +900,28 @@ namespace
       index_entry* dst_p = seek_type(dst_t);
       if (dst_p == 0)
           return 0;
-    
-      // Look up the dynamic_id function and call it to get the dynamic
-      // info
-      boost::python::objects::dynamic_id_t dynamic_id = polymorphic
-          ? tuples::get<kdynamic_id>(*src_p)(p)
-          : std::make_pair(p, src_t);
-    
-      // Look in the cache first for a quickie address translation
-      std::ptrdiff_t offset = (char*)p - (char*)dynamic_id.first;
-
-      cache_element seek(boost::make_tuple(src_t, dst_t, offset, dynamic_id.second));
-      cache_t& c = cache();
-      cache_t::iterator const cache_pos
-          = std::lower_bound(c.begin(), c.end(), seek);
-                      
 
-      // if found in the cache, we're done
-      if (cache_pos != c.end() && cache_pos->key == seek.key)
+      vertex_t const src = tuples::get<kvertex>(*src_p);
+      vertex_t const dst = tuples::get<kvertex>(*dst_p);
+      
+      void* result;
+      if (static_path const* path = static_paths().find(src, dst))
       {
-          return cache_pos->offset == cache_element::not_found
-              ? 0 : (char*)p + cache_pos->offset;
+          // An upcast along non-virtual bases
+          result = (char*)p + path->offset;
       }
-
-      // If we are starting at the most-derived type, only look in the up graph
-      smart_graph const& g = polymorphic && dynamic_id.second != src_t
-          ? full_graph() : up_graph();
+      else
+      {
+          // If we are starting at the most-derived type, only look in the up graph
+          smart_graph const& g = polymorphic && dynamic_id.second != src_t
+              ? full_graph() : up_graph();
     
-      void* result = search(
-          g, p, tuples::get<kvertex>(*src_p)
-          , tuples::get<kvertex>(*dst_p));
+          result = search(g, p, src, dst);
+      }
 
       // update the cache
-      c.insert(cache_pos, seek)->offset
-          = (result == 0) ? cache_element::not_found : (char*)result - (char*)p;
+      cache().insert(
+          key, hash, (result == 0) ? cast_cache::not_found : (char*)result - (char*)p);
 
       return result;
   }
@@ -451,21 +942,11 @@ BOOST_PYTHON_DECL void* find_static_type(void* p, class_id src_t, class_id dst_t
 BOOST_PYTHON_DECL void add_cast(
     class_id src_t, class_id dst_t, cast_function cast, bool is_downcast)
 {
+    scoped_graph_lock lock(graph_lock());
+    
     // adding an edge will invalidate any record of unreachability in
     // the cache.
-    static std::size_t expected_cache_len = 0;
-    cache_t& c = cache();
-    if (c.size() > expected_cache_len)
-    {
-        c.erase(std::remove_if(
-                    c.begin(), c.end(),
-                    mem_fn(&cache_element::unreachable))
-                , c.end());
-
-        // If any new cache entries get added, we'll have to do this
-        // again when the next edge is added
-        expected_cache_len = c.size();
-    }
+    cache().new_generation();
     
     type_index_iterator_pair types = demand_types(src_t, dst_t);
     vertex_t src = tuples::get<kvertex>(*types.first);
@@ -484,12 +965,56 @@ BOOST_PYTHON_DECL void add_cast(
         put(get(edge_cast, **p), e, cast);
         put(get(edge_index, **p), e, num_edges(full_graph().topology()) - 1);
     }
+
+    // The new edge may shorten any path
+    up_graph().invalidate();
+    full_graph().invalidate();
+}
+
+BOOST_PYTHON_DECL void add_cast_offset(
+    class_id src_t, class_id dst_t, std::ptrdiff_t offset)
+{
+    scoped_graph_lock lock(graph_lock());
+    
+    type_index_iterator_pair types = demand_types(src_t, dst_t);
+    static_paths().add(
+        tuples::get<kvertex>(*types.first), tuples::get<kvertex>(*types.second), offset);
 }
 
 BOOST_PYTHON_DECL void register_dynamic_id_aux(
     class_id static_id, dynamic_id_function get_dynamic_id)
 {
+    scoped_graph_lock lock(graph_lock());
     tuples::get<kdynamic_id>(*demand_type(static_id)) = get_dynamic_id;
+    dynamic_ids().insert(static_id, get_dynamic_id);
+}
+
+BOOST_PYTHON_DECL object finalize_class_graph()
+{
+    scoped_graph_lock lock(graph_lock());
+    
+    up_graph().freeze();
+    full_graph().freeze();
+    
+    dict result;
+    result["classes"] = num_vertices(full_graph().topology());
+    result["distance_bytes"] = up_graph().distance_bytes() + full_graph().distance_bytes();
+    return result;
+}
+
+BOOST_PYTHON_DECL object cast_cache_statistics()
+{
+    cast_cache const& c = cache();
+    
+    dict result;
+    result["size"] = c.size();
+    result["capacity"] = c.capacity();
+    result["hits"] = c.hits();
+    result["misses"] = c.misses();
+    result["evictions"] = c.evictions();
+    result["static_paths"] = static_paths().size();
+    result["graph_frozen"] = up_graph().frozen() && full_graph().frozen();
+    return result;
 }
 
 }}} // namespace boost::python::objects
@@ -0,0 +1,407 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/python_callback.hpp>
+#include <boost/python/errors.hpp>
+#include <boost/python/detail/allow_threads.hpp>
+#include <boost/python/detail/pythread_sync.hpp>
+#include <boost/atomic.hpp>
+#include <boost/scoped_array.hpp>
+#include <memory>
+
+namespace boost { namespace python {
+
+namespace detail
+{
+  void decref_with_gil::operator()(PyObject* p) const
+  {
+      PyGILState_STATE const state = PyGILState_Ensure();
+      Py_DECREF(p);
+      PyGILState_Release(state);
+  }
+
+  pending_call::~pending_call()
+  {
+  }
+
+  namespace
+  {
+    std::size_t round_up_to_power_of_2(std::size_t n)
+    {
+        std::size_t result = 1;
+        while (result < n)
+            result <<= 1;
+        return result;
+    }
+  }
+
+  // Calls are kept in a bounded lock-free ring in which each cell
+  // carries a sequence number, saying whether it is ready to be
+  // written or read in the current lap (Dmitry Vyukov's bounded MPMC
+  // queue). Threads only take m_mutex to sleep, when the ring is full
+  // or, in the dispatcher, empty.
+  struct callback_queue_impl
+  {
+      struct cell
+      {
+          boost::atomic<std::size_t> sequence;
+          pending_call* call;
+      };
+
+      callback_queue_impl(
+          std::size_t capacity
+        , callback_queue::overflow_policy overflow
+        , std::size_t batch_size)
+        : m_capacity(capacity)
+        , m_mask(round_up_to_power_of_2(capacity ? capacity : 1) - 1)
+        , m_cells(new cell[m_mask + 1])
+        , m_overflow(overflow)
+        , m_batch_size(batch_size ? batch_size : 1)
+        , m_enqueue_pos(0)
+        , m_dequeue_pos(0)
+        , m_discarded(0)
+        , m_blocked_producers(0)
+        , m_idle_dispatchers(0)
+        , m_running(false)
+        , m_stopping(false)
+        , m_mutex(allocate_pythread_lock())
+        , m_finished(0)
+      {
+          for (std::size_t i = 0; i <= m_mask; ++i)
+          {
+              m_cells[i].sequence.store(i, boost::memory_order_relaxed);
+              m_cells[i].call = 0;
+          }
+      }
+
+      ~callback_queue_impl()
+      {
+          while (pending_call* call = pop())
+              delete call;
+          PyThread_free_lock(m_mutex);
+      }
+
+      bool push(pending_call* call)
+      {
+          std::size_t pos = m_enqueue_pos.load(boost::memory_order_relaxed);
+          for (;;)
+          {
+              // Calls beyond the requested capacity are refused even
+              // if it was rounded up.
+              std::size_t const head = m_dequeue_pos.load(boost::memory_order_acquire);
+              if (static_cast<std::ptrdiff_t>(pos - head)
+                  >= static_cast<std::ptrdiff_t>(m_capacity))
+                  return false;
+
+              cell& c = m_cells[pos & m_mask];
+              std::size_t const sequence = c.sequence.load(boost::memory_order_acquire);
+              std::ptrdiff_t const lap = static_cast<std::ptrdiff_t>(sequence - pos);
+
+              if (lap == 0)
+              {
+                  if (m_enqueue_pos.compare_exchange_weak(
+                          pos, pos + 1, boost::memory_order_relaxed))
+                  {
+                      c.call = call;
+                      c.sequence.store(pos + 1, boost::memory_order_release);
+                      return true;
+                  }
+              }
+              else if (lap < 0)
+              {
+                  return false; // full
+              }
+              else
+              {
+                  pos = m_enqueue_pos.load(boost::memory_order_relaxed);
+              }
+          }
+      }
+
+      pending_call* pop()
+      {
+          std::size_t pos = m_dequeue_pos.load(boost::memory_order_relaxed);
+          for (;;)
+          {
+              cell& c = m_cells[pos & m_mask];
+              std::size_t const sequence = c.sequence.load(boost::memory_order_acquire);
+              std::ptrdiff_t const lap = static_cast<std::ptrdiff_t>(sequence - (pos + 1));
+
+              if (lap == 0)
+              {
+                  if (m_dequeue_pos.compare_exchange_weak(
+                          pos, pos + 1, boost::memory_order_relaxed))
+                  {
+                      pending_call* call = c.call;
+                      c.sequence.store(pos + m_mask + 1, boost::memory_order_release);
+                      return call;
+                  }
+              }
+              else if (lap < 0)
+              {
+                  return 0; // empty
+              }
+              else
+              {
+                  pos = m_dequeue_pos.load(boost::memory_order_relaxed);
+              }
+          }
+      }
+
+      bool empty() const
+      {
+          return m_enqueue_pos.load(boost::memory_order_acquire)
+              == m_dequeue_pos.load(boost::memory_order_acquire);
+      }
+
+      // Sleepers announce themselves in m_blocked_producers or
+      // m_idle_dispatchers before checking the ring a last time, and
+      // the threads changing the ring check those counts afterwards,
+      // so that either the sleeper sees the change or it is woken.
+      void wake(boost::atomic<unsigned>& sleepers, pythread_condition& c)
+      {
+          boost::atomic_thread_fence(boost::memory_order_seq_cst);
+          if (sleepers.load(boost::memory_order_relaxed) != 0)
+          {
+              scoped_pythread_lock lock(m_mutex);
+              c.notify_all();
+          }
+      }
+
+      bool post(pending_call* call)
+      {
+          std::auto_ptr<pending_call> owner(call);
+
+          if (!push(call))
+          {
+              if (m_overflow == callback_queue::discard)
+              {
+                  ++m_discarded;
+                  return false;
+              }
+
+# if PY_VERSION_HEX >= 0x03040000
+              // Nothing else may be able to drain the queue while this
+              // thread holds the GIL, so it makes room itself.
+              if (PyGILState_Check())
+              {
+                  while (!push(call))
+                      drain(m_batch_size);
+                  owner.release();
+                  wake(m_idle_dispatchers, m_not_empty);
+                  return true;
+              }
+# endif
+              scoped_pythread_lock lock(m_mutex);
+              ++m_blocked_producers;
+              boost::atomic_thread_fence(boost::memory_order_seq_cst);
+              while (!push(call))
+                  m_not_full.wait(m_mutex);
+              --m_blocked_producers;
+          }
+          owner.release();
+          wake(m_idle_dispatchers, m_not_empty);
+          return true;
+      }
+
+      std::size_t drain(std::size_t max_calls)
+      {
+          std::size_t n = 0;
+          for (; n < max_calls; ++n)
+          {
+              std::auto_ptr<pending_call> call(pop());
+              if (call.get() == 0)
+                  break;
+              wake(m_blocked_producers, m_not_full);
+              (*call)();
+          }
+          return n;
+      }
+
+      // Makes up to max_calls calls, reporting the exceptions they
+      // raise instead of propagating them.
+      void drain_reporting_errors(std::size_t max_calls)
+      {
+          for (std::size_t n = 0; n < max_calls; ++n)
+          {
+              std::auto_ptr<pending_call> call(pop());
+              if (call.get() == 0)
+                  break;
+              wake(m_blocked_producers, m_not_full);
+
+              try
+              {
+                  (*call)();
+              }
+              catch (...)
+              {
+                  handle_exception();
+                  PyErr_WriteUnraisable(call->callable.get());
+              }
+          }
+      }
+
+      // Sleeps until there are calls to make or the dispatcher is asked
+      // to stop. The GIL must not be held.
+      void wait_for_calls()
+      {
+          scoped_pythread_lock lock(m_mutex);
+          ++m_idle_dispatchers;
+          boost::atomic_thread_fence(boost::memory_order_seq_cst);
+          while (empty() && !m_stopping.load())
+              m_not_empty.wait(m_mutex);
+          --m_idle_dispatchers;
+      }
+
+      static void dispatch(void* self)
+      {
+          static_cast<callback_queue_impl*>(self)->dispatch();
+      }
+
+      void dispatch()
+      {
+          for (;;)
+          {
+              wait_for_calls();
+              if (m_stopping.load() && empty())
+                  break;
+
+              PyGILState_STATE const state = PyGILState_Ensure();
+              drain_reporting_errors(m_batch_size);
+              PyGILState_Release(state);
+          }
+          PyThread_release_lock(m_finished);
+      }
+
+      void start()
+      {
+          if (m_running)
+              return;
+
+# if PY_VERSION_HEX < 0x03070000
+          PyEval_InitThreads();
+# endif
+          m_finished = allocate_pythread_lock();
+          PyThread_acquire_lock(m_finished, WAIT_LOCK);
+          m_stopping.store(false);
+
+          if ((unsigned long)PyThread_start_new_thread(&dispatch, this) == (unsigned long)-1)
+          {
+              PyThread_free_lock(m_finished);
+              m_finished = 0;
+              PyErr_SetString(PyExc_RuntimeError, "can't start a callback dispatcher thread");
+              throw_error_already_set();
+          }
+          m_running = true;
+      }
+
+      void stop()
+      {
+          if (!m_running)
+              return;
+
+          m_stopping.store(true);
+          {
+              scoped_pythread_lock lock(m_mutex);
+              m_not_empty.notify_all();
+          }
+          {
+              // The dispatcher needs the GIL to finish its calls.
+              allow_threads unlocked;
+              PyThread_acquire_lock(m_finished, WAIT_LOCK);
+          }
+          PyThread_free_lock(m_finished);
+          m_finished = 0;
+          m_running = false;
+      }
+
+      std::size_t const m_capacity;
+      std::size_t const m_mask;
+      boost::scoped_array<cell> m_cells;
+      callback_queue::overflow_policy const m_overflow;
+      std::size_t const m_batch_size;
+
+      boost::atomic<std::size_t> m_enqueue_pos;
+      boost::atomic<std::size_t> m_dequeue_pos;
+      boost::atomic<std::size_t> m_discarded;
+
+      boost::atomic<unsigned> m_blocked_producers;
+      boost::atomic<unsigned> m_idle_dispatchers;
+
+      bool m_running;
+      boost::atomic<bool> m_stopping;
+
+      PyThread_type_lock m_mutex;
+      pythread_condition m_not_full;
+      pythread_condition m_not_empty;
+
+      // Held until the dispatcher thread exits.
+      PyThread_type_lock m_finished;
+  };
+}
+
+callback_queue::callback_queue(
+    std::size_t capacity, overflow_policy overflow, std::size_t batch_size)
+  : m_impl(new detail::callback_queue_impl(capacity, overflow, batch_size))
+{
+}
+
+callback_queue::~callback_queue()
+{
+    m_impl->stop();
+}
+
+bool callback_queue::post(detail::pending_call* call)
+{
+    return m_impl->post(call);
+}
+
+std::size_t callback_queue::drain(std::size_t max_calls)
+{
+    return m_impl->drain(max_calls);
+}
+
+void callback_queue::start()
+{
+    m_impl->start();
+}
+
+void callback_queue::stop()
+{
+    m_impl->stop();
+}
+
+bool callback_queue::running() const
+{
+    return m_impl->m_running;
+}
+
+std::size_t callback_queue::size() const
+{
+    std::size_t const dequeued = m_impl->m_dequeue_pos.load();
+    return m_impl->m_enqueue_pos.load() - dequeued;
+}
+
+std::size_t callback_queue::capacity() const
+{
+    return m_impl->m_capacity;
+}
+
+std::size_t callback_queue::batch_size() const
+{
+    return m_impl->m_batch_size;
+}
+
+callback_queue::overflow_policy callback_queue::overflow() const
+{
+    return m_impl->m_overflow;
+}
+
+std::size_t callback_queue::discarded() const
+{
+    return m_impl->m_discarded.load();
+}
+
+}} // namespace boost::python
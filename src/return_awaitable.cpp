@@ -0,0 +1,420 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/return_awaitable.hpp>
+#include <boost/python/python_callback.hpp>
+#include <boost/python/errors.hpp>
+#include <boost/python/handle.hpp>
+#include <boost/python/import.hpp>
+#include <boost/python/object.hpp>
+
+#if PY_VERSION_HEX >= 0x03050000 && !defined(_WIN32)
+# include <boost/python/detail/pythread_sync.hpp>
+# include <boost/cstdint.hpp>
+# include <boost/shared_ptr.hpp>
+# include <algorithm>
+# include <memory>
+# include <vector>
+# include <errno.h>
+# include <fcntl.h>
+# include <unistd.h>
+# ifdef __linux__
+#  include <sys/eventfd.h>
+# endif
+# define BOOST_PYTHON_HAS_AWAITABLES
+#endif
+
+// The longest time, in microseconds, between two polls of the C++
+// futures returned to Python as awaitables.
+#ifndef BOOST_PYTHON_AWAITABLE_POLL_INTERVAL
+# define BOOST_PYTHON_AWAITABLE_POLL_INTERVAL 1000
+#endif
+
+namespace boost { namespace python { namespace detail {
+
+pending_future::~pending_future()
+{
+}
+
+#ifdef BOOST_PYTHON_HAS_AWAITABLES
+
+namespace
+{
+  class loop_notifier;
+
+  // A C++ future and the asyncio future waiting for it.
+  struct awaited_future : boost::noncopyable
+  {
+      awaited_future(
+          std::auto_ptr<pending_future>& future
+        , boost::shared_ptr<loop_notifier> const& notifier
+        , PyObject* awaiter)
+        : future(future)
+        , notifier(notifier)
+        , awaiter(python::incref(awaiter), decref_with_gil())
+      {}
+
+      std::auto_ptr<pending_future> future;
+      boost::shared_ptr<loop_notifier> notifier;
+      boost::shared_ptr<PyObject> awaiter;
+  };
+
+  void raise_os_error()
+  {
+      PyErr_SetFromErrno(PyExc_OSError);
+      throw_error_already_set();
+  }
+
+  // Wakes an event loop, through an eventfd or a pipe it is reading,
+  // to give the asyncio futures of an event loop the results of the
+  // C++ futures found ready by the polling thread.
+  class loop_notifier : boost::noncopyable
+  {
+   public:
+      loop_notifier()
+        : m_mutex(allocate_pythread_lock())
+      {
+# ifdef __linux__
+          m_read_fd = m_write_fd = ::eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+          if (m_read_fd < 0)
+              raise_os_error();
+# else
+          int fds[2];
+          if (::pipe(fds) != 0)
+              raise_os_error();
+          m_read_fd = fds[0];
+          m_write_fd = fds[1];
+          for (int i = 0; i < 2; ++i)
+          {
+              ::fcntl(fds[i], F_SETFL, ::fcntl(fds[i], F_GETFL) | O_NONBLOCK);
+              ::fcntl(fds[i], F_SETFD, FD_CLOEXEC);
+          }
+# endif
+      }
+
+      ~loop_notifier()
+      {
+          for (std::size_t i = 0; i < m_ready.size(); ++i)
+              delete m_ready[i];
+          ::close(m_read_fd);
+          if (m_write_fd != m_read_fd)
+              ::close(m_write_fd);
+          PyThread_free_lock(m_mutex);
+      }
+
+      int fileno() const
+      {
+          return m_read_fd;
+      }
+
+      // Takes ownership of a ready future. Called by the polling thread,
+      // without the GIL; the event loop is woken once for all the
+      // futures becoming ready before it reads them.
+      void ready(awaited_future* f)
+      {
+          bool wake;
+          {
+              scoped_pythread_lock lock(m_mutex);
+              wake = m_ready.empty();
+              m_ready.push_back(f);
+          }
+          if (wake)
+              this->wake();
+      }
+
+      // Called by the event loop when fileno() is readable.
+      void dispatch()
+      {
+          this->clear();
+
+          std::vector<awaited_future*> ready;
+          {
+              scoped_pythread_lock lock(m_mutex);
+              ready.swap(m_ready);
+          }
+
+          for (std::size_t i = 0; i < ready.size(); ++i)
+          {
+              std::auto_ptr<awaited_future> f(ready[i]);
+              try
+              {
+                  settle(*f);
+              }
+              catch (...)
+              {
+                  handle_exception();
+                  PyErr_WriteUnraisable(f->awaiter.get());
+              }
+          }
+      }
+
+   private:
+      void wake()
+      {
+# ifdef __linux__
+          boost::uint64_t const one = 1;
+          while (::write(m_write_fd, &one, sizeof(one)) < 0 && errno == EINTR)
+              ;
+# else
+          char const byte = 0;
+          // A full pipe will wake the loop anyway.
+          while (::write(m_write_fd, &byte, 1) < 0 && errno == EINTR)
+              ;
+# endif
+      }
+
+      void clear()
+      {
+          char buffer[64];
+          for (;;)
+          {
+              ssize_t const n = ::read(m_read_fd, buffer, sizeof(buffer));
+              if (n <= 0 && !(n < 0 && errno == EINTR))
+                  break;
+          }
+      }
+
+      // Gives the asyncio future the C++ future's result or exception,
+      // unless it has been cancelled.
+      static void settle(awaited_future& f)
+      {
+          object awaiter(handle<>(python::borrowed(f.awaiter.get())));
+          if (awaiter.attr("done")())
+              return;
+
+          PyObject* result = 0;
+          try
+          {
+              result = f.future->get();
+          }
+          catch (...)
+          {
+              handle_exception();
+          }
+
+          if (result != 0)
+          {
+              awaiter.attr("set_result")(object(handle<>(result)));
+              return;
+          }
+
+          PyObject *type, *value, *traceback;
+          PyErr_Fetch(&type, &value, &traceback);
+          PyErr_NormalizeException(&type, &value, &traceback);
+          handle<> type_(type), value_(value), traceback_(allow_null(traceback));
+          if (traceback != 0)
+              PyException_SetTraceback(value, traceback);
+          awaiter.attr("set_exception")(object(value_));
+      }
+
+      PyThread_type_lock m_mutex;
+      std::vector<awaited_future*> m_ready;
+      int m_read_fd;
+      int m_write_fd;
+  };
+
+  char const notifier_capsule_name[] = "boost.python.loop_notifier";
+
+  void destroy_notifier_capsule(PyObject* capsule)
+  {
+      delete static_cast<boost::shared_ptr<loop_notifier>*>(
+          PyCapsule_GetPointer(capsule, notifier_capsule_name));
+  }
+
+  PyObject* dispatch_ready_futures(PyObject* capsule, PyObject*)
+  {
+      try
+      {
+          static_cast<boost::shared_ptr<loop_notifier>*>(
+              PyCapsule_GetPointer(capsule, notifier_capsule_name))->get()->dispatch();
+      }
+      catch (...)
+      {
+          handle_exception();
+          return 0;
+      }
+      return python::detail::none();
+  }
+
+  PyMethodDef dispatch_ready_futures_def = {
+      const_cast<char*>("dispatch_ready_futures"), dispatch_ready_futures, METH_NOARGS, 0
+  };
+
+  // Returns the notifier of an event loop, creating it and adding it
+  // to the loop's readers the first time.
+  boost::shared_ptr<loop_notifier> notifier_for(object const& loop)
+  {
+      // Notifiers are kept, in capsules, for as long as their loops.
+      // The registry is never released, so it may still be used while
+      // Python is being finalized.
+      static PyObject* registry = python::incref(
+          import("weakref").attr("WeakKeyDictionary")().ptr());
+
+      handle<> capsule(allow_null(PyObject_GetItem(registry, loop.ptr())));
+      if (!capsule)
+      {
+          if (!PyErr_ExceptionMatches(PyExc_KeyError))
+              throw_error_already_set();
+          PyErr_Clear();
+
+          std::auto_ptr<boost::shared_ptr<loop_notifier> > notifier(
+              new boost::shared_ptr<loop_notifier>(new loop_notifier));
+          capsule = handle<>(
+              PyCapsule_New(notifier.get(), notifier_capsule_name, destroy_notifier_capsule));
+          int const fd = notifier.release()->get()->fileno();
+
+          object dispatch(handle<>(PyCFunction_New(&dispatch_ready_futures_def, capsule.get())));
+          loop.attr("add_reader")(fd, dispatch);
+          if (PyObject_SetItem(registry, loop.ptr(), capsule.get()) != 0)
+              throw_error_already_set();
+      }
+      return *static_cast<boost::shared_ptr<loop_notifier>*>(
+          PyCapsule_GetPointer(capsule.get(), notifier_capsule_name));
+  }
+
+  // A thread which polls the C++ futures until they become ready. A
+  // single thread serves any number of futures, none of which is kept
+  // waiting behind others. While none becomes ready, the time between
+  // polls doubles up to BOOST_PYTHON_AWAITABLE_POLL_INTERVAL, or a
+  // microsecond per pending future if that is longer; a new future is
+  // polled at once.
+  class future_poller : boost::noncopyable
+  {
+   public:
+      future_poller()
+        : m_mutex(allocate_pythread_lock())
+        , m_started(false)
+      {}
+
+      void post(std::auto_ptr<awaited_future>& f)
+      {
+          scoped_pythread_lock lock(m_mutex);
+          if (!m_started)
+          {
+              if ((unsigned long)PyThread_start_new_thread(&run, this) == (unsigned long)-1)
+              {
+                  PyErr_SetString(PyExc_RuntimeError, "can't start a thread to wait for futures");
+                  throw_error_already_set();
+              }
+              m_started = true;
+          }
+          m_arrived.push_back(f.get());
+          f.release();
+          m_not_empty.notify_all();
+      }
+
+   private:
+      static void run(void* self)
+      {
+          static_cast<future_poller*>(self)->run();
+      }
+
+      void run()
+      {
+          std::vector<awaited_future*> pending;
+          PY_TIMEOUT_T interval = 0;
+          for (;;)
+          {
+              {
+                  scoped_pythread_lock lock(m_mutex);
+                  if (pending.empty())
+                  {
+                      while (m_arrived.empty())
+                          m_not_empty.wait(m_mutex);
+                  }
+                  else if (m_arrived.empty() && interval > 0)
+                  {
+                      m_not_empty.timed_wait(m_mutex, interval);
+                  }
+                  
+                  if (!m_arrived.empty())
+                  {
+                      pending.insert(pending.end(), m_arrived.begin(), m_arrived.end());
+                      m_arrived.clear();
+                      interval = 0;
+                  }
+              }
+
+              std::size_t const n = pending.size();
+              std::size_t kept = 0;
+              for (std::size_t i = 0; i < n; ++i)
+              {
+                  awaited_future* f = pending[i];
+                  if (f->future->is_ready())
+                      deliver(f);
+                  else
+                      pending[kept++] = f;
+              }
+              pending.resize(kept);
+              
+              // Polls are kept at least a microsecond per future apart,
+              // so that many futures don't keep the thread busy.
+              PY_TIMEOUT_T const longest = (std::max)(
+                  static_cast<PY_TIMEOUT_T>(BOOST_PYTHON_AWAITABLE_POLL_INTERVAL)
+                , static_cast<PY_TIMEOUT_T>(kept));
+              if (kept < n)
+                  interval = 0;
+              else
+                  interval = interval == 0 ? 1 : (std::min)(2 * interval, longest);
+          }
+      }
+
+      static void deliver(awaited_future* f)
+      {
+          // f no longer keeps its notifier alive once ready, so that
+          // a notifier outliving its loop can be destroyed.
+          boost::shared_ptr<loop_notifier> notifier;
+          notifier.swap(f->notifier);
+          notifier->ready(f);
+      }
+
+      PyThread_type_lock m_mutex;
+      pythread_condition m_not_empty;
+      std::vector<awaited_future*> m_arrived;
+      bool m_started;
+  };
+
+  future_poller& poller()
+  {
+      // Never destroyed: its thread runs until the process exits.
+      static future_poller* p = new future_poller;
+      return *p;
+  }
+}
+
+PyObject* make_awaitable(pending_future* future)
+{
+    std::auto_ptr<pending_future> owner(future);
+
+    // The event loop awaiting the result is the running one.
+# if PY_VERSION_HEX >= 0x03070000
+    object loop = import("asyncio").attr("get_running_loop")();
+# else
+    object loop = import("asyncio").attr("get_event_loop")();
+# endif
+    object awaiter = loop.attr("create_future")();
+
+    std::auto_ptr<awaited_future> f(
+        new awaited_future(owner, notifier_for(loop), awaiter.ptr()));
+    poller().post(f);
+
+    return python::incref(awaiter.ptr());
+}
+
+#else // BOOST_PYTHON_HAS_AWAITABLES
+
+PyObject* make_awaitable(pending_future* future)
+{
+    delete future;
+    PyErr_SetString(
+        PyExc_NotImplementedError
+      , "C++ futures can only be awaited with Python 3.5 or later on POSIX systems");
+    throw_error_already_set();
+    return 0;
+}
+
+#endif // BOOST_PYTHON_HAS_AWAITABLES
+
+}}} // namespace boost::python::detail
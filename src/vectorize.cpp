@@ -0,0 +1,248 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/vectorize.hpp>
+#include <boost/python/numeric.hpp>
+#include <boost/python/errors.hpp>
+#include <boost/python/handle.hpp>
+#include <boost/cstdint.hpp>
+#include <algorithm>
+#include <cstring>
+
+#if PY_VERSION_HEX >= 0x02070000
+
+namespace boost { namespace python { namespace detail {
+
+namespace
+{
+  bool little_endian()
+  {
+      int const one = 1;
+      return *reinterpret_cast<char const*>(&one) == 1;
+  }
+
+  // The size of an element with the given struct module code in
+  // native mode, or 0 if it can't be read by a vectorized function.
+  std::size_t native_size(char code)
+  {
+      switch (code)
+      {
+      case '?': return sizeof(bool);
+      case 'b': case 'B': return sizeof(char);
+      case 'h': case 'H': return sizeof(short);
+      case 'i': case 'I': return sizeof(int);
+      case 'l': case 'L': return sizeof(long);
+# ifdef HAVE_LONG_LONG
+      case 'q': case 'Q': return sizeof(BOOST_PYTHON_LONG_LONG);
+# endif
+      case 'n': case 'N': return sizeof(ssize_t);
+      case 'f': return sizeof(float);
+      case 'd': return sizeof(double);
+      case 'g': return sizeof(long double);
+      }
+      return 0;
+  }
+}
+
+bool vectorized_operands::any_array(PyObject* args)
+{
+    for (ssize_t i = 0; i < PyTuple_GET_SIZE(args); ++i)
+    {
+        PyObject* arg = PyTuple_GET_ITEM(args, i);
+        if (!PyObject_CheckBuffer(arg))
+            continue;
+
+        Py_buffer buffer;
+        if (PyObject_GetBuffer(arg, &buffer, PyBUF_RECORDS_RO) != 0)
+        {
+            PyErr_Clear();
+            continue;
+        }
+        int ndim = buffer.ndim;
+        PyBuffer_Release(&buffer);
+        if (ndim > 0)
+            return true;
+    }
+    return false;
+}
+
+vectorized_operands::vectorized_operands(PyObject* args)
+    : m_operands(PyTuple_GET_SIZE(args))
+{
+    try
+    {
+        broadcast(args);
+    }
+    catch (...)
+    {
+        release();
+        throw;
+    }
+}
+
+vectorized_operands::~vectorized_operands()
+{
+    release();
+}
+
+void vectorized_operands::broadcast(PyObject* args)
+{
+    for (std::size_t i = 0; i < m_operands.size(); ++i)
+    {
+        operand& x = m_operands[i];
+        PyObject* arg = PyTuple_GET_ITEM(args, i);
+        if (!PyObject_CheckBuffer(arg))
+            continue;
+
+        if (PyObject_GetBuffer(arg, &x.buffer, PyBUF_RECORDS_RO) != 0)
+            throw_error_already_set();
+        x.is_array = true;
+        x.data = static_cast<char const*>(x.buffer.buf);
+        if (m_shape.size() < static_cast<std::size_t>(x.buffer.ndim))
+            m_shape.insert(m_shape.begin(), x.buffer.ndim - m_shape.size(), 1);
+    }
+
+    // Each axis of the result is as long as the axes of the arrays
+    // aligned with it at the end of their shapes, which must be equally
+    // long or of length 1.
+    for (std::size_t i = 0; i < m_operands.size(); ++i)
+    {
+        operand const& x = m_operands[i];
+        if (!x.is_array)
+            continue;
+        std::size_t offset = m_shape.size() - x.buffer.ndim;
+        for (std::size_t axis = offset; axis < m_shape.size(); ++axis)
+        {
+            ssize_t extent = x.buffer.shape[axis - offset];
+            if (extent == m_shape[axis] || extent == 1)
+                continue;
+            if (m_shape[axis] != 1)
+            {
+                PyErr_SetString(
+                    PyExc_ValueError, "operands could not be broadcast together");
+                throw_error_already_set();
+            }
+            m_shape[axis] = extent;
+        }
+    }
+
+    for (std::size_t i = 0; i < m_operands.size(); ++i)
+    {
+        operand& x = m_operands[i];
+        x.strides.assign(m_shape.size(), 0);
+        if (!x.is_array)
+            continue;
+        std::size_t offset = m_shape.size() - x.buffer.ndim;
+        for (std::size_t axis = offset; axis < m_shape.size(); ++axis)
+        {
+            if (x.buffer.shape[axis - offset] != 1)
+                x.strides[axis] = x.buffer.strides[axis - offset];
+        }
+    }
+}
+
+void vectorized_operands::release()
+{
+    for (std::size_t i = 0; i < m_operands.size(); ++i)
+    {
+        if (m_operands[i].is_array)
+        {
+            PyBuffer_Release(&m_operands[i].buffer);
+            m_operands[i].is_array = false;
+        }
+    }
+}
+
+char const* vectorized_operands::format(std::size_t i) const
+{
+    char const* format = m_operands[i].buffer.format;
+    return format ? format : "B";
+}
+
+char vectorized_operands::code(std::size_t i) const
+{
+    char const* f = format(i);
+    switch (*f)
+    {
+    case '@': case '=':
+        ++f;
+        break;
+    case '<':
+        if (little_endian())
+            ++f;
+        break;
+    case '>': case '!':
+        if (!little_endian())
+            ++f;
+        break;
+    }
+
+    if (f[0] == 0 || f[1] != 0
+        || native_size(f[0]) != static_cast<std::size_t>(itemsize(i)))
+    {
+        PyErr_Format(
+            PyExc_TypeError
+          , "can't apply a vectorized function to elements of format '%s'", format(i));
+        throw_error_already_set();
+    }
+    return f[0];
+}
+
+bool vectorized_operands::aligned(std::size_t i, std::size_t alignment) const
+{
+    operand const& x = m_operands[i];
+    if (reinterpret_cast<boost::uintptr_t>(x.data) % alignment != 0)
+        return false;
+    for (std::size_t axis = 0; axis < x.strides.size(); ++axis)
+    {
+        if (x.strides[axis] % static_cast<ssize_t>(alignment) != 0)
+            return false;
+    }
+    return true;
+}
+
+ssize_t vectorized_operands::size() const
+{
+    ssize_t n = 1;
+    for (std::size_t axis = 0; axis < m_shape.size(); ++axis)
+        n *= m_shape[axis];
+    return n;
+}
+
+ssize_t vectorized_operands::rows() const
+{
+    ssize_t length = row_length();
+    return length ? size() / length : 0;
+}
+
+ssize_t vectorized_operands::row_length() const
+{
+    return m_shape.empty() ? 1 : m_shape.back();
+}
+
+char const* vectorized_operands::row(std::size_t i, ssize_t r) const
+{
+    operand const& x = m_operands[i];
+    char const* position = x.data;
+    for (int axis = static_cast<int>(m_shape.size()) - 2; axis >= 0; --axis)
+    {
+        position += (r % m_shape[axis]) * x.strides[axis];
+        r /= m_shape[axis];
+    }
+    return position;
+}
+
+object vectorized_operands::allocate_result(
+    char const* format, ssize_t itemsize, void** data) const
+{
+    handle<> storage(PyByteArray_FromStringAndSize(0, size() * itemsize));
+    *data = PyByteArray_AS_STRING(storage.get());
+    return numeric::aux::make_array(
+        *data, false, format, itemsize, m_shape, std::vector<ssize_t>(), object(storage));
+}
+
+}}} // namespace boost::python::detail
+
+#endif // PY_VERSION_HEX >= 0x02070000
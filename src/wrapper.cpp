@@ -3,11 +3,136 @@
 // file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 
 #include <boost/python/wrapper.hpp>
+#include <boost/noncopyable.hpp>
+#include <cstring>
 
 namespace boost { namespace python {
 
 namespace detail
 {
+#if PY_VERSION_HEX >= 0x02060000
+  namespace
+  {
+    // Remembers whether each Python class overrides a virtual function
+    // of the extension class it is derived from. The type's version
+    // tag changes whenever the type or one of its bases is modified,
+    // invalidating the entries for it.
+    class override_cache : boost::noncopyable
+    {
+     public:
+        override_cache()
+        {
+            for (std::size_t i = 0; i < size; ++i)
+            {
+                m_entries[i].type = 0;
+                m_entries[i].name = 0;
+            }
+        }
+        
+        // Return true iff the answer for type is known, and set
+        // overridden to the answer
+        bool find(
+            PyTypeObject* type, PyTypeObject* class_object, char const* name
+          , bool& overridden, PyObject*& interned_name) const
+        {
+            entry const& e = m_entries[index_of(type, name)];
+            if (e.type != type || e.class_object != class_object
+                || !(type->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG)
+                || e.version_tag != type->tp_version_tag
+                || std::strcmp(name, string_of(e.name)) != 0)
+            {
+                return false;
+            }
+            overridden = e.overridden;
+            interned_name = e.name;
+            return true;
+        }
+
+        // Compute and remember the answer for type. Return the interned
+        // name, or 0 if it couldn't be computed.
+        PyObject* insert(
+            PyTypeObject* type, PyTypeObject* class_object, char const* name
+          , bool& overridden)
+        {
+            PyObject* interned_name =
+#if PY_VERSION_HEX >= 0x03000000
+                PyUnicode_InternFromString(name);
+#else
+                PyString_InternFromString(name);
+#endif
+            if (interned_name == 0)
+            {
+                PyErr_Clear();
+                return 0;
+            }
+            
+            // Also gives type a valid version tag
+            PyObject* f = _PyType_Lookup(type, interned_name);
+            PyObject* base_f = class_object->tp_dict
+                ? PyDict_GetItem(class_object->tp_dict, interned_name) : 0;
+            overridden = f != base_f;
+
+            if (!(type->tp_flags & Py_TPFLAGS_VALID_VERSION_TAG))
+            {
+                Py_DECREF(interned_name);
+                return 0;
+            }
+            
+            entry& e = m_entries[index_of(type, name)];
+            Py_XDECREF(e.name);
+            e.type = type;
+            e.version_tag = type->tp_version_tag;
+            e.class_object = class_object;
+            e.name = interned_name;
+            e.overridden = overridden;
+            return interned_name;
+        }
+
+     private:
+        struct entry
+        {
+            PyTypeObject* type;
+            unsigned int version_tag;
+            PyTypeObject* class_object;
+            PyObject* name;         // interned; owned
+            bool overridden;
+        };
+
+        static char const* string_of(PyObject* name)
+        {
+#if PY_VERSION_HEX >= 0x03000000
+            return PyUnicode_AsUTF8(name);
+#else
+            return PyString_AS_STRING(name);
+#endif
+        }
+        
+        static std::size_t index_of(PyTypeObject* type, char const* name)
+        {
+            return ((reinterpret_cast<std::size_t>(type) >> 4)
+                    ^ (reinterpret_cast<std::size_t>(name) >> 2)) % size;
+        }
+        
+        enum { size = 256 };
+        entry m_entries[size];
+    };
+
+    override_cache& overrides()
+    {
+        static override_cache x;
+        return x;
+    }
+    
+    // True iff the instance has an attribute of its own with the given
+    // name, which would hide any method
+    bool has_own_attribute(PyObject* self, PyObject* name)
+    {
+        PyObject** dict = _PyObject_GetDictPtr(self);
+        return dict != 0 && *dict != 0 && PyDict_GetItem(*dict, name) != 0;
+    }
+  }
+#endif
+  
   override wrapper_base::get_override(
       char const* name
     , PyTypeObject* class_object
@@ -15,6 +140,23 @@ namespace detail
   {
       if (this->m_self)
       {
+#if PY_VERSION_HEX >= 0x02060000
+          PyTypeObject* type = Py_TYPE(this->m_self);
+          bool overridden = true;
+          PyObject* interned_name = 0;
+          
+          if (!overrides().find(type, class_object, name, overridden, interned_name))
+              interned_name = overrides().insert(type, class_object, name, overridden);
+
+          // The class doesn't override the function, so unless the
+          // instance itself does, skip the attribute lookup
+          if (interned_name != 0 && !overridden
+              && !has_own_attribute(this->m_self, interned_name))
+          {
+              return override(handle<>(detail::none()));
+          }
+#endif
+          
           if (handle<> m = handle<>(
                   python::allow_null(
                       ::PyObject_GetAttrString(
@@ -0,0 +1,91 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/module.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/buffer_protocol.hpp>
+#include <boost/python/ssize_t.hpp>
+#include <vector>
+#include <string>
+
+using namespace boost::python;
+
+// A row-major matrix of doubles
+struct matrix
+{
+    matrix(std::size_t rows, std::size_t cols)
+      : rows(rows), cols(cols), elements(rows * cols)
+    {
+        for (std::size_t i = 0; i < elements.size(); ++i)
+            elements[i] = double(i);
+    }
+
+    double* data() { return &elements[0]; }
+    std::vector<std::size_t> shape() const
+    {
+        std::vector<std::size_t> result;
+        result.push_back(rows);
+        result.push_back(cols);
+        return result;
+    }
+    double get(std::size_t i, std::size_t j) const { return elements[i * cols + j]; }
+
+    std::size_t rows, cols;
+    std::vector<double> elements;
+};
+
+// The transpose of a matrix, exported in place through its strides
+struct transposed
+{
+    transposed(std::size_t rows, std::size_t cols) : m(rows, cols) {}
+
+    double* data() { return m.data(); }
+    std::vector<std::size_t> shape() const
+    {
+        std::vector<std::size_t> result;
+        result.push_back(m.cols);
+        result.push_back(m.rows);
+        return result;
+    }
+    std::vector<ssize_t> strides() const
+    {
+        std::vector<ssize_t> result;
+        result.push_back(sizeof(double));
+        result.push_back(m.cols * sizeof(double));
+        return result;
+    }
+
+    matrix m;
+};
+
+// A read-only string of bytes
+struct message
+{
+    message(std::string const& s) : text(s) {}
+    unsigned char const* data() const
+    {
+        return reinterpret_cast<unsigned char const*>(text.data());
+    }
+    std::size_t size() const { return text.size(); }
+
+    std::string text;
+};
+
+BOOST_PYTHON_MODULE(buffer_protocol_ext)
+{
+    class_<matrix>("matrix", init<std::size_t, std::size_t>())
+        .def(buffer_protocol(&matrix::data, &matrix::shape))
+        .def("get", &matrix::get)
+        ;
+
+    class_<transposed>("transposed", init<std::size_t, std::size_t>())
+        .def(buffer_protocol(&transposed::data, &transposed::shape, &transposed::strides))
+        ;
+
+    class_<message>("message", init<std::string>())
+        .def(buffer_protocol(&message::data, &message::size))
+        ;
+}
+
+#include "module_tail.cpp"
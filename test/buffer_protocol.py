@@ -0,0 +1,75 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from buffer_protocol_ext import *
+
+Instances export the storage of their C++ objects:
+
+>>> m = matrix(2, 3)
+>>> v = memoryview(m)
+>>> v.format, v.itemsize, v.ndim, v.shape, v.strides, v.readonly
+('d', 8, 2, (2, 3), (24, 8), False)
+>>> v.tolist()
+[[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+
+Writing through the view changes the C++ object:
+
+>>> v[1, 2] = 42.0
+>>> m.get(1, 2)
+42.0
+>>> v.release()
+
+The view keeps the instance alive:
+
+>>> v = memoryview(matrix(1, 2))
+>>> import gc; _ = gc.collect()
+>>> v.tolist()
+[[0.0, 1.0]]
+>>> v.release()
+
+Strided buffers are exported in place, and copied into contiguous
+order by consumers which need it:
+
+>>> t = memoryview(transposed(2, 3))
+>>> t.shape, t.strides, t.c_contiguous, t.f_contiguous
+((3, 2), (8, 24), False, True)
+>>> t.tolist()
+[[0.0, 3.0], [1.0, 4.0], [2.0, 5.0]]
+>>> import array
+>>> array.array('d', t.tobytes()).tolist()
+[0.0, 3.0, 1.0, 4.0, 2.0, 5.0]
+>>> t.release()
+
+Buffers of const elements are read-only:
+
+>>> msg = message('hello')
+>>> bytes(msg), memoryview(msg).readonly
+(b'hello', True)
+>>> try: memoryview(msg)[0] = 0
+... except TypeError: pass
+... else: raise AssertionError('expected a TypeError')
+
+Python subclasses export the buffers of their base classes:
+
+>>> class row(matrix):
+...     def __init__(self, n):
+...         matrix.__init__(self, 1, n)
+>>> memoryview(row(3)).tolist()
+[[0.0, 1.0, 2.0]]
+'''
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+    
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
@@ -0,0 +1,73 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/buffer_view.hpp>
+#include <complex>
+#include <numeric>
+
+using namespace boost::python;
+
+double sum(buffer_view<double const> v)
+{
+    return std::accumulate(v.begin(), v.end(), 0.0);
+}
+
+void scale(buffer_view<double> v, double k)
+{
+    for (std::size_t i = 0; i < v.size(); ++i)
+        v[i] *= k;
+}
+
+long sum_ints(buffer_view<int const> v)
+{
+    boost::iterator_range<int const*> r = v.range();
+    return std::accumulate(r.begin(), r.end(), 0L);
+}
+
+double sum_real(buffer_view<std::complex<double> const> const& v)
+{
+    return std::accumulate(v.begin(), v.end(), std::complex<double>()).real();
+}
+
+std::size_t count_chars(buffer_view<char const> v, char c)
+{
+    return std::count(v.begin(), v.end(), c);
+}
+
+// True iff both views refer to the same elements; nothing is copied
+bool same_elements(buffer_view<double const> a, buffer_view<double const> b)
+{
+    return a.data() == b.data() && a.size() == b.size();
+}
+
+// The buffer is held while the function runs
+object call_during(buffer_view<unsigned char const> v, object f)
+{
+    return f();
+}
+
+// A view kept beyond the call which created it holds the buffer
+buffer_view<unsigned char const> held;
+
+void hold(buffer_view<unsigned char const> v) { held = v; }
+void release() { held = buffer_view<unsigned char const>(); }
+std::size_t held_size() { return held.size(); }
+
+BOOST_PYTHON_MODULE(buffer_view_ext)
+{
+    def("sum", sum);
+    def("scale", scale);
+    def("sum_ints", sum_ints);
+    def("sum_real", sum_real);
+    def("count_chars", count_chars);
+    def("same_elements", same_elements);
+    def("call_during", call_during);
+    def("hold", hold);
+    def("release", release);
+    def("held_size", held_size);
+}
+
+#include "module_tail.cpp"
@@ -0,0 +1,82 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from buffer_view_ext import *
+>>> from array import array
+
+Objects exporting a contiguous buffer of a matching type are viewed in
+place:
+
+>>> a = array('d', [1.0, 2.0, 3.5])
+>>> sum(a), sum(memoryview(a)), sum(array('d'))
+(6.5, 6.5, 0.0)
+>>> same_elements(a, memoryview(a))
+True
+>>> sum_ints(array('i', range(10)))
+45
+>>> count_chars(b'banana', 'a'), count_chars(bytearray(b'banana'), 'n')
+(3, 2)
+
+A writable view changes the elements of the object:
+
+>>> scale(a, 2)
+>>> a.tolist()
+[2.0, 4.0, 7.0]
+
+Read-only buffers, buffers of another element type or size,
+non-contiguous buffers and objects without a buffer are rejected:
+
+>>> for args in ((array('f', [1.0]),), ([1.0, 2.0],), (memoryview(a)[::2],), (None,)):
+...     try: sum(*args)
+...     except TypeError: pass
+...     else: raise AssertionError('expected a TypeError')
+>>> try: scale(memoryview(a.tobytes()).cast('d'), 2)
+... except TypeError: pass
+... else: raise AssertionError('expected a TypeError')
+>>> try: sum_real(a)
+... except TypeError: pass
+... else: raise AssertionError('expected a TypeError')
+
+The buffer is held for the duration of the call, so the object can't
+be resized by the wrapped function:
+
+>>> b = bytearray(b'abc')
+>>> call_during(b, lambda: b.extend(b'def'))
+Traceback (most recent call last):
+...
+BufferError: Existing exports of data: object cannot be re-sized
+>>> b.extend(b'def')
+>>> len(b)
+6
+
+A view kept after the call still holds the buffer, so the object can't
+be resized until the view is released:
+
+>>> b = bytearray(b'abc')
+>>> hold(b)
+>>> held_size()
+3
+>>> try: b.extend(b'def')
+... except BufferError: pass
+... else: raise AssertionError('expected a BufferError')
+>>> release()
+>>> b.extend(b'def')
+>>> len(b)
+6
+'''
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+    
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
@@ -0,0 +1,57 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/manage_new_object.hpp>
+#include <boost/python/return_value_policy.hpp>
+#include <boost/python/object/inheritance_query.hpp>
+
+using namespace boost::python;
+
+struct Base
+{
+    Base() : x(1) {}
+    virtual ~Base() {}
+    int x;
+};
+
+struct Other
+{
+    virtual ~Other() {}
+    int y;
+};
+
+struct Derived : Other, Base
+{
+    Derived() { y = 2; }
+};
+
+struct Unrelated {};
+
+int base_x(Base const& b) { return b.x; }
+int derived_y(Derived const& d) { return d.y; }
+int unrelated(Unrelated const&) { return 0; }
+
+// Returns a Derived which Python only knows as a Base
+Base* make_hidden_derived() { return new Derived; }
+
+BOOST_PYTHON_MODULE(cast_cache_ext)
+{
+    class_<Base>("Base");
+    class_<Other>("Other");
+    class_<Derived, bases<Other, Base> >("Derived");
+    class_<Unrelated>("Unrelated");
+    
+    def("base_x", base_x);
+    def("derived_y", derived_y);
+    def("unrelated", unrelated);
+    def("make_hidden_derived", make_hidden_derived
+        , return_value_policy<manage_new_object>());
+    def("statistics", objects::cast_cache_statistics);
+}
+
+#include "module_tail.cpp"
@@ -0,0 +1,61 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from cast_cache_ext import *
+>>> s = statistics()
+>>> s['capacity'] >= 8
+True
+>>> h = make_hidden_derived()
+>>> derived_y(h)
+2
+>>> before = statistics()
+>>> for i in range(10):
+...     assert derived_y(h) == 2
+>>> after = statistics()
+>>> after['hits'] >= before['hits'] + 10
+True
+>>> after['misses'] == before['misses']
+True
+>>> after['size'] <= after['capacity']
+True
+
+Upcasts from the most-derived type are cached too
+
+>>> d = Derived()
+>>> base_x(d), base_x(h)
+(1, 1)
+>>> before = statistics()
+>>> base_x(d), base_x(h), derived_y(h)
+(1, 1, 2)
+>>> statistics()['misses'] == before['misses']
+True
+
+Unreachable targets are remembered
+
+>>> try: unrelated(d)
+... except TypeError: pass
+... else: raise AssertionError('expected a TypeError')
+>>> before = statistics()
+>>> try: unrelated(d)
+... except TypeError: pass
+>>> after = statistics()
+>>> after['hits'] > before['hits']
+True
+>>> after['misses'] == before['misses']
+True
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
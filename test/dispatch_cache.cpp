@@ -0,0 +1,121 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/scope.hpp>
+#include <boost/python/extract.hpp>
+#include <boost/python/args.hpp>
+#include <boost/python/make_constructor.hpp>
+#include <boost/python/converter/registry.hpp>
+#include <boost/python/converter/rvalue_from_python_data.hpp>
+#include <boost/shared_ptr.hpp>
+#include <string>
+
+using namespace boost::python;
+
+struct X {};
+
+// An argument type whose from_python converter looks at the value of
+// its argument as well as its type.
+struct even_number
+{
+    long value;
+};
+
+struct even_number_from_python
+{
+    even_number_from_python()
+    {
+        converter::registry::push_back(
+            &convertible, &construct, type_id<even_number>());
+    }
+
+    static void* convertible(PyObject* p)
+    {
+        extract<long> x(p);
+        return x.check() && x() % 2 == 0 ? p : 0;
+    }
+
+    static void construct(PyObject* p, converter::rvalue_from_python_stage1_data* data)
+    {
+        void* storage = (
+            (converter::rvalue_from_python_storage<even_number>*)data)->storage.bytes;
+        even_number* e = new (storage) even_number;
+        e->value = extract<long>(p);
+        data->convertible = storage;
+    }
+};
+
+std::string take_int(int) { return "int"; }
+std::string take_int_new(int) { return "new int"; }
+std::string take_double(double) { return "double"; }
+std::string take_str(std::string) { return "str"; }
+std::string take_X(X const&) { return "X"; }
+std::string take_even(even_number) { return "even"; }
+std::string take_int_X(int, X const&) { return "int, X"; }
+std::string take_X_int(X const&, int) { return "X, int"; }
+std::string take_int_double(int, double) { return "double"; }
+std::string take_int_int(int, int) { return "int"; }
+
+// Instances of Base may hold a D1
+struct Base
+{
+    virtual ~Base() {}
+};
+
+struct D1 : Base {};
+
+boost::shared_ptr<Base> make_base(bool derived)
+{
+    return boost::shared_ptr<Base>(derived ? new D1 : new Base);
+}
+
+std::string take_base(Base&) { return "Base"; }
+std::string take_d1(D1&) { return "D1"; }
+
+void add_h_overload(object module)
+{
+    scope within(module);
+    def("h", take_int_new);
+}
+
+BOOST_PYTHON_MODULE(dispatch_cache_ext)
+{
+    even_number_from_python();
+    
+    class_<X>("X");
+
+    def("f", take_double);
+    def("f", take_int);
+    def("f", take_str);
+    def("f", take_X);
+    def("f", take_int_X);
+    def("f", take_X_int);
+
+    def("g", take_int);
+    def("g", take_even);
+
+    def("g2", take_int);
+    def("g2", take_even);
+
+    def("k", take_int_double, (arg("x"), arg("y")));
+    def("k", take_int_int, (arg("x"), arg("y")));
+
+    class_<Base, boost::shared_ptr<Base> >("Base", no_init)
+        .def("__init__", make_constructor(make_base))
+        ;
+    class_<D1, bases<Base> >("D1");
+
+    def("m", take_base);
+    def("m", take_d1);
+
+    def("h", take_int);
+    def("h", take_str);
+    def("add_h_overload", add_h_overload);
+}
+
+#include "module_tail.cpp"
@@ -0,0 +1,68 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from dispatch_cache_ext import *
+
+Repeated calls with the same argument types keep selecting the same
+overloads:
+
+>>> x = X()
+>>> for i in range(3):
+...     [f(1), f(1.5), f('a'), f(x), f(1, x), f(x, 1)]
+['int', 'double', 'str', 'X', 'int, X', 'X, int']
+['int', 'double', 'str', 'X', 'int, X', 'X, int']
+['int', 'double', 'str', 'X', 'int, X', 'X, int']
+
+>>> try: f(x, x)
+... except TypeError: pass
+... else: print('expected a TypeError')
+
+Converters which look at values still select the right overload:
+
+>>> [g(2), g(3), g(4), g(5), g(6)]
+['even', 'int', 'even', 'int', 'even']
+
+including when the first call is refused for its value:
+
+>>> [g2(3), g2(4), g2(5), g2(6), g2(2)]
+['int', 'even', 'int', 'even', 'even']
+
+The types of keyword arguments are taken into account as well as their
+names:
+
+>>> k(1, y=2.5), k(1, y=2), k(x=1, y=2.5), k(y=2, x=1)
+('double', 'int', 'double', 'int')
+
+and instances of the same class may hold objects of different classes:
+
+>>> m(Base(False)), m(Base(True)), m(Base(False)), m(D1())
+('Base', 'D1', 'Base', 'D1')
+
+Adding an overload affects subsequent calls only through the new
+function object:
+
+>>> old_h = h
+>>> h(1), h('a')
+('int', 'str')
+>>> import dispatch_cache_ext
+>>> add_h_overload(dispatch_cache_ext)
+>>> dispatch_cache_ext.h(1), dispatch_cache_ext.h('a')
+('new int', 'str')
+>>> old_h(1), old_h('a')
+('int', 'str')
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
@@ -0,0 +1,36 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/manage_new_object.hpp>
+#include <boost/python/return_value_policy.hpp>
+
+using namespace boost::python;
+
+struct A { A() : a(1) {} virtual ~A() {} int a; };
+struct B { B() : b(2) {} int b; };
+struct C : B, A { C(int c = 3) : c(c) {} int c; };
+
+int get_a(A const& x) { return x.a; }
+int get_b(B const& x) { return x.b; }
+int get_c(C const& x) { return x.c; }
+
+C* make_new_c(int c) { return new C(c); }
+
+BOOST_PYTHON_MODULE(holder_index_ext)
+{
+    class_<A>("A");
+    class_<B>("B");
+    class_<C, bases<B, A> >("C", init<optional<int> >());
+
+    def("get_a", get_a);
+    def("get_b", get_b);
+    def("get_c", get_c);
+    def("make_new_c", make_new_c, return_value_policy<manage_new_object>());
+}
+
+#include "module_tail.cpp"
@@ -0,0 +1,41 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from holder_index_ext import *
+
+Objects of the same class are found again wherever they are held
+
+>>> cs = [C(i) for i in range(5)]
+>>> [(get_a(c), get_b(c), get_c(c)) for c in cs]
+[(1, 2, 0), (1, 2, 1), (1, 2, 2), (1, 2, 3), (1, 2, 4)]
+>>> [get_c(c) for c in cs]
+[0, 1, 2, 3, 4]
+
+>>> ps = [make_new_c(i) for i in range(5, 10)]
+>>> [(get_a(c), get_b(c), get_c(c)) for c in ps]
+[(1, 2, 5), (1, 2, 6), (1, 2, 7), (1, 2, 8), (1, 2, 9)]
+>>> [get_c(c) for c in cs + ps]
+[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+Python subclasses are distinct classes
+
+>>> class D(C): pass
+>>> d = D(10)
+>>> get_a(d), get_b(d), get_c(d), get_c(cs[1])
+(1, 2, 10, 1)
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
@@ -0,0 +1,71 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/class.hpp>
+#include <boost/python/implicit.hpp>
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/extract.hpp>
+
+using namespace boost::python;
+
+// X, Y and Z are implicitly convertible to one another in a cycle,
+// so checking the convertibility of anything else to one of them
+// visits all three conversions.
+struct Z;
+
+struct X
+{
+    explicit X(int n) : value(n) {}
+    X(Z const& z);
+    int value;
+};
+
+struct Y
+{
+    Y(X const& x) : value(x.value + 1) {}
+    int value;
+};
+
+struct Z
+{
+    Z(Y const& y) : value(y.value + 1) {}
+    int value;
+};
+
+X::X(Z const& z) : value(z.value + 1) {}
+
+int z_value(Z const& z) { return z.value; }
+
+// Checks n times whether obj may be converted to a Z, returning the
+// number of successful checks.
+long count_convertible(object obj, long n)
+{
+    long count = 0;
+    for (long i = 0; i < n; ++i)
+    {
+        if (extract<Z>(obj).check())
+            ++count;
+    }
+    return count;
+}
+
+BOOST_PYTHON_MODULE(implicit_threads_ext)
+{
+    class_<X>("X", init<int>())
+        .def_readonly("value", &X::value)
+        ;
+    class_<Y>("Y", no_init);
+    class_<Z>("Z", no_init);
+    
+    implicitly_convertible<int,X>();
+    implicitly_convertible<X,Y>();
+    implicitly_convertible<Y,Z>();
+    implicitly_convertible<Z,X>();
+
+    def("z_value", z_value);
+    def("count_convertible", count_convertible);
+}
+
+#include "module_tail.cpp"
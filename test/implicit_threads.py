@@ -0,0 +1,81 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from implicit_threads_ext import *
+
+An int converts to a Z through X and Y:
+
+>>> z_value(1)
+3
+>>> z_value(X(5))
+7
+
+The cycle of implicit conversions doesn't recurse forever on objects
+which convert to none of the classes:
+
+>>> try: z_value('foo')
+... except TypeError: pass
+... else: raise AssertionError('expected a TypeError')
+>>> count_convertible(1, 10), count_convertible('foo', 10)
+(10, 0)
+
+Each thread keeps its own record of the conversions it is checking:
+
+>>> results = check_in_threads(4, 1000)
+>>> results == [(1000, 0)] * 4
+True
+
+The benchmark reports the number of checks per second for each number
+of threads:
+
+>>> [n for n, rate in benchmark((1, 2), 100, report=False)]
+[1, 2]
+'''
+import threading
+import time
+
+def check_in_threads(threads, count):
+    from implicit_threads_ext import count_convertible
+    results = [None] * threads
+    def work(i):
+        results[i] = (count_convertible(i + 1, count), count_convertible('foo', count))
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return results
+
+def benchmark(threads=(1, 2, 4, 8), count=100000, report=True):
+    '''Measure the throughput of implicit conversion checks made by
+    several threads at once. Each thread checks count objects which
+    convert and count which don't.'''
+    rates = []
+    for n in threads:
+        start = time.time()
+        check_in_threads(n, count)
+        elapsed = max(time.time() - start, 1e-9)
+        rate = 2 * n * count / elapsed
+        if report:
+            print('%2d threads: %12.0f checks/s' % (n, rate))
+        rates.append((n, rate))
+    return rates
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+    
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    if '--benchmark' in sys.argv[1:]:
+        benchmark()
+        sys.exit(0)
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
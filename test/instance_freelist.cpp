@@ -0,0 +1,63 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/manage_new_object.hpp>
+#include <boost/python/register_ptr_to_python.hpp>
+#include <boost/python/return_value_policy.hpp>
+#include <boost/shared_ptr.hpp>
+
+using namespace boost::python;
+
+struct X
+{
+    X(int x) : x(x) { ++count; }
+    X(X const& rhs) : x(rhs.x) { ++count; }
+    ~X() { --count; }
+    
+    int value() const { return x; }
+    
+    int x;
+    static int count;
+};
+
+int X::count;
+
+int live_count() { return X::count; }
+
+X make_x(int x) { return X(x); }
+
+X* new_x(int x) { return new X(x); }
+
+// Held by a pointer_holder larger than the value_holder<Z> the class
+// reserves room for
+struct Z : X
+{
+    Z(int x) : X(x) {}
+};
+
+boost::shared_ptr<Z> make_shared_z(int x) { return boost::shared_ptr<Z>(new Z(x)); }
+
+BOOST_PYTHON_MODULE(instance_freelist_ext)
+{
+    class_<X>("X", init<int>())
+        .enable_freelist(2)
+        .def("value", &X::value)
+        ;
+
+    class_<Z, bases<X> >("Z", init<int>())
+        .enable_freelist(2)
+        ;
+    register_ptr_to_python<boost::shared_ptr<Z> >();
+
+    def("live_count", live_count);
+    def("make_x", make_x);
+    def("new_x", new_x, return_value_policy<manage_new_object>());
+    def("make_shared_z", make_shared_z);
+}
+
+#include "module_tail.cpp"
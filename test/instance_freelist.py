@@ -0,0 +1,89 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from instance_freelist_ext import *
+>>> xs = [X(i) for i in range(5)]
+>>> live_count()
+5
+>>> del xs
+>>> live_count()
+0
+
+Reused instances are like new ones
+
+>>> x = X(0)
+>>> x_id = id(x)
+>>> del x
+
+Objects allocated meanwhile don't get its memory
+
+>>> junk = [bytes(n) for n in range(2, 300)]
+>>> x = X(1)
+>>> id(x) == x_id
+True
+>>> del x, junk
+
+>>> xs = [X(i) for i in range(5)] + [make_x(i) for i in range(5, 8)] + [new_x(8)]
+>>> [x.value() for x in xs]
+[0, 1, 2, 3, 4, 5, 6, 7, 8]
+>>> live_count()
+9
+>>> xs[0].attr = 1
+>>> del xs
+>>> x = X(8)
+>>> x.value(), hasattr(x, 'attr')
+(8, False)
+>>> del x
+>>> live_count()
+0
+
+Python subclasses are unaffected
+
+>>> class Y(X):
+...     def __init__(self, x):
+...         X.__init__(self, x)
+...         self.y = x + 1
+>>> ys = [Y(i) for i in range(3)]
+>>> [(y.value(), y.y) for y in ys]
+[(0, 1), (1, 2), (2, 3)]
+>>> del ys
+>>> live_count()
+0
+
+Instances needing more room than the class reserves stop the reuse of
+its instances
+
+>>> zs = [Z(0), Z(1), make_shared_z(2), Z(3)]
+>>> [z.value() for z in zs]
+[0, 1, 2, 3]
+>>> del zs
+>>> zs = [Z(4), make_shared_z(5), Z(6)]
+>>> [z.value() for z in zs]
+[4, 5, 6]
+>>> z = Z(7)
+>>> z_id = id(z)
+>>> del z
+>>> junk = [bytes(n) for n in range(2, 300)]
+>>> z = Z(8)
+>>> id(z) == z_id
+False
+>>> del z, junk
+>>> del zs
+>>> live_count()
+0
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
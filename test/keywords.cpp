@@ -104,6 +104,7 @@ BOOST_PYTHON_MODULE(keywords)
    )
       .def("set", &Bar::set, bar_set())
       .def("set2", &Bar::set, bar_set("set2's docstring"))
+      .def("set3", &Bar::set, bar_set(args("a", "b", "n")))
       .def("seta", &Bar::seta, arg("a"))
        
       .def("a", &Bar::geta)
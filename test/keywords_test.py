@@ -84,6 +84,29 @@
 'set2( (Bar)arg1 [, (int)arg2 [, (float)arg3 [, (str)arg4]]]) -> None :'
 >>> f.set2.__doc__.splitlines()[2]
 "    set2's docstring"
+
+# keyword arguments to overloads generated with keyword names
+>>> f.set3(a=3)
+>>> f.a(), f.b(), f.n()
+(3, 0.0, '')
+>>> f.set3(4, b=4.0)
+>>> f.a(), f.b(), f.n()
+(4, 4.0, '')
+>>> f.set3(n="5", b=5.0, a=5)
+>>> f.a(), f.b(), f.n()
+(5, 5.0, '5')
+>>> f.set3(**{''.join(['a']): 6, ''.join(['b']): 6.0})
+>>> f.a(), f.b(), f.n()
+(6, 6.0, '')
+>>> try: f.set3(1, a=1)
+... except TypeError: pass
+... else: print('expected a TypeError: duplicate argument')
+>>> try: f.set3(z=1)
+... except TypeError: pass
+... else: print('expected a TypeError: unknown keyword')
+>>> try: f.set3(b=1.0)
+... except TypeError: pass
+... else: print('expected a TypeError: missing argument')
 '''
 
 
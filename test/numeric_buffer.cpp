@@ -0,0 +1,115 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/numeric.hpp>
+#include <boost/python/module.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/extract.hpp>
+#include <boost/python/tuple.hpp>
+#include <boost/python/list.hpp>
+#include <vector>
+#include <numeric>
+#include <algorithm>
+
+using namespace boost::python;
+
+struct grid
+{
+    grid(std::size_t rows, std::size_t cols)
+      : rows(rows), cols(cols), elements(rows * cols)
+    {
+        for (std::size_t i = 0; i < elements.size(); ++i)
+            elements[i] = double(i);
+    }
+
+    std::size_t rows, cols;
+    std::vector<double> elements;
+};
+
+// An array of the elements of a grid, which keeps the grid alive
+object grid_elements(object self)
+{
+    grid& g = extract<grid&>(self);
+    std::vector<std::size_t> shape;
+    shape.push_back(g.rows);
+    shape.push_back(g.cols);
+    return numeric::make_array(&g.elements[0], shape, self);
+}
+
+// A column of a grid, viewed in place through strides
+object grid_column(object self, std::size_t j)
+{
+    grid& g = extract<grid&>(self);
+    return numeric::make_array(
+        &g.elements[j], g.rows, g.cols * sizeof(double), self);
+}
+
+int const table[2][3] = { { 1, 2, 3 }, { 4, 5, 6 } };
+
+object constant_table()
+{
+    std::vector<int> shape;
+    shape.push_back(2);
+    shape.push_back(3);
+    return numeric::make_array(&table[0][0], shape);
+}
+
+tuple describe(object x)
+{
+    numeric::array_buffer b(x);
+    list shape, strides;
+    for (int axis = 0; axis < b.ndim(); ++axis)
+    {
+        shape.append(b.shape(axis));
+        strides.append(b.strides(axis));
+    }
+    return make_tuple(
+        b.format(), b.itemsize(), tuple(shape), tuple(strides)
+      , b.size(), b.is_c_contiguous(), b.readonly());
+}
+
+double sum(object x)
+{
+    numeric::array_buffer b(x);
+    return std::accumulate(b.begin<double const>(), b.end<double const>(), 0.0);
+}
+
+list int_elements(object x)
+{
+    numeric::array_buffer b(x);
+    list result;
+    for (numeric::array_iterator<int const> p = b.begin<int const>(); p != b.end<int const>(); ++p)
+        result.append(*p);
+    return result;
+}
+
+void fill(object x, double value)
+{
+    numeric::array_buffer b(x, true);
+    std::fill(b.begin<double>(), b.end<double>(), value);
+}
+
+double first(object x)
+{
+    numeric::array_buffer b(x);
+    return *b.data<double const>();
+}
+
+BOOST_PYTHON_MODULE(numeric_buffer_ext)
+{
+    class_<grid>("grid", init<std::size_t, std::size_t>())
+        .def("elements", grid_elements)
+        .def("column", grid_column)
+        ;
+
+    def("constant_table", constant_table);
+    def("describe", describe);
+    def("sum", sum);
+    def("int_elements", int_elements);
+    def("fill", fill);
+    def("first", first);
+}
+
+#include "module_tail.cpp"
@@ -0,0 +1,84 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from numeric_buffer_ext import *
+>>> from array import array
+
+The layout of any object exporting a buffer is read without calling
+Python:
+
+>>> describe(array('d', [1.0, 2.0, 3.0]))
+('d', 8, (3,), (8,), 3, True, False)
+>>> describe(memoryview(bytearray(24)).cast('i', (2, 3)))
+('i', 4, (2, 3), (12, 4), 6, True, False)
+>>> describe(memoryview(b'abcd')[::2])
+('B', 1, (2,), (2,), 2, False, True)
+
+Elements are read through typed pointers and iterators, which follow
+strides:
+
+>>> a = array('d', [1.0, 2.0, 3.0, 4.0])
+>>> sum(a), sum(memoryview(a)[::2]), sum(memoryview(a)[::-1]), first(a)
+(10.0, 4.0, 10.0, 1.0)
+>>> int_elements(memoryview(array('i', range(6))).cast('B').cast('i', (2, 3)))
+[0, 1, 2, 3, 4, 5]
+>>> fill(memoryview(a)[1::2], 0.0)
+>>> a.tolist()
+[1.0, 0.0, 3.0, 0.0]
+
+Elements of another type and objects without buffers are rejected,
+as are writes to read-only buffers:
+
+>>> for x in (array('i', [1]), [1.0]):
+...     try: sum(x)
+...     except TypeError: pass
+...     else: raise AssertionError('expected a TypeError')
+>>> try: fill(b'12345678', 0.0)
+... except BufferError: pass
+... else: raise AssertionError('expected a BufferError')
+
+C++ memory is wrapped in an array without copying it. Without NumPy
+the array is a memoryview:
+
+>>> g = grid(2, 3)
+>>> e = g.elements()
+>>> e.shape, e.format, e.readonly
+((2, 3), 'd', False)
+>>> e.tolist()
+[[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+
+The array refers to the grid's elements, and keeps the grid alive:
+
+>>> c = g.column(1)
+>>> c.shape, c.strides, c.tolist()
+((2,), (24,), [1.0, 4.0])
+>>> fill(c, 9.0)
+>>> e.tolist()
+[[0.0, 9.0, 2.0], [3.0, 9.0, 5.0]]
+>>> del g, e
+>>> import gc; _ = gc.collect()
+>>> c.tolist()
+[9.0, 9.0]
+
+Arrays of const elements are read-only:
+
+>>> t = constant_table()
+>>> t.readonly, t.tolist(), int_elements(t)
+(True, [[1, 2, 3], [4, 5, 6]], [1, 2, 3, 4, 5, 6])
+'''
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+    
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
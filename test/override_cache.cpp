@@ -0,0 +1,54 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/wrapper.hpp>
+#include <boost/python/call.hpp>
+
+using namespace boost::python;
+
+struct hooks
+{
+    virtual ~hooks() {}
+    virtual int f() { return 1; }
+    virtual int g() { return 2; }
+};
+
+struct hooks_wrapper : hooks, wrapper<hooks>
+{
+    int f()
+    {
+        if (override f = this->get_override("f"))
+            return call<int>(f.ptr());
+        return hooks::f();
+    }
+    int default_f() { return this->hooks::f(); }
+    
+    int g()
+    {
+        if (override g = this->get_override("g"))
+            return call<int>(g.ptr());
+        return hooks::g();
+    }
+    int default_g() { return this->hooks::g(); }
+};
+
+int call_f(hooks& h) { return h.f(); }
+int call_g(hooks& h) { return h.g(); }
+
+BOOST_PYTHON_MODULE(override_cache_ext)
+{
+    class_<hooks_wrapper, boost::noncopyable>("hooks")
+        .def("f", &hooks::f, &hooks_wrapper::default_f)
+        .def("g", &hooks::g, &hooks_wrapper::default_g)
+        ;
+
+    def("call_f", call_f);
+    def("call_g", call_g);
+}
+
+#include "module_tail.cpp"
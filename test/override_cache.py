@@ -0,0 +1,59 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from override_cache_ext import *
+>>> class H(hooks):
+...     def f(self):
+...         return 10
+>>> h = H()
+>>> call_f(h), call_g(h), call_f(h), call_g(h)
+(10, 2, 10, 2)
+>>> call_f(hooks()), call_g(hooks())
+(1, 2)
+
+Changes to the class are seen at once
+
+>>> H.g = lambda self: 20
+>>> call_f(h), call_g(h)
+(10, 20)
+>>> del H.f
+>>> call_f(h), call_g(h)
+(1, 20)
+
+...as are changes to its bases
+
+>>> class I(H): pass
+>>> i = I()
+>>> call_f(i)
+1
+>>> H.f = lambda self: 30
+>>> call_f(i), call_f(h)
+(30, 30)
+
+...and attributes of the instance
+
+>>> del H.g
+>>> call_g(i)
+2
+>>> i.g = lambda: 40
+>>> call_g(i), call_g(I())
+(40, 2)
+>>> del i.g
+>>> call_g(i)
+2
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
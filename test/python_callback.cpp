@@ -0,0 +1,94 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/module.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/enum.hpp>
+#include <boost/python/python_callback.hpp>
+#include <boost/noncopyable.hpp>
+#include <pythread.h>
+#include <string>
+
+using namespace boost::python;
+
+typedef python_callback<void(int, std::string const&)> callback;
+
+// Calls f(i, name) for i in [0, n) through the queue, returning the
+// number of calls queued.
+int post(callback_queue& queue, object f, int n, std::string const& name)
+{
+    callback cb(f, queue);
+    int posted = 0;
+    for (int i = 0; i < n; ++i)
+    {
+        if (cb(i, name))
+            ++posted;
+    }
+    return posted;
+}
+
+namespace
+{
+  struct worker
+  {
+      worker(callback const& cb, int n, std::string const& name)
+        : cb(cb), n(n), name(name)
+      {}
+
+      callback cb;
+      int n;
+      std::string name;
+  };
+
+  void work(void* arg)
+  {
+      worker* w = static_cast<worker*>(arg);
+      for (int i = 0; i < w->n; ++i)
+          w->cb(i, w->name);
+      delete w;
+  }
+}
+
+// Starts threads unknown to Python, each of which calls f(i, name)
+// for i in [0, n) through the queue, naming the threads "0", "1", ...
+void post_from_threads(callback_queue& queue, object f, int threads, int n)
+{
+# if PY_VERSION_HEX < 0x03070000
+    PyEval_InitThreads();
+# endif
+    callback cb(f, queue);
+    for (int t = 0; t < threads; ++t)
+        PyThread_start_new_thread(&work, new worker(cb, n, std::string(1, char('0' + t))));
+}
+
+std::size_t drain_all(callback_queue& queue)
+{
+    return queue.drain();
+}
+
+BOOST_PYTHON_MODULE(python_callback_ext)
+{
+    enum_<callback_queue::overflow_policy>("overflow_policy")
+        .value("block", callback_queue::block)
+        .value("discard", callback_queue::discard)
+        ;
+
+    class_<callback_queue, boost::noncopyable>(
+        "CallbackQueue", init<std::size_t, callback_queue::overflow_policy, std::size_t>())
+        .def("drain", &callback_queue::drain)
+        .def("drain", drain_all)
+        .def("start", &callback_queue::start)
+        .def("stop", &callback_queue::stop)
+        .add_property("running", &callback_queue::running)
+        .add_property("size", &callback_queue::size)
+        .add_property("capacity", &callback_queue::capacity)
+        .add_property("discarded", &callback_queue::discarded)
+        ;
+
+    def("post", post);
+    def("post_from_threads", post_from_threads);
+}
+
+#include "module_tail.cpp"
@@ -0,0 +1,93 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from python_callback_ext import *
+
+Calls wait in the queue until it is drained:
+
+>>> calls = []
+>>> q = CallbackQueue(8, overflow_policy.discard, 4)
+>>> post(q, lambda i, name: calls.append((name, i)), 3, 'a')
+3
+>>> calls, q.size
+([], 3)
+>>> q.drain(2), calls
+(2, [('a', 0), ('a', 1)])
+>>> q.drain(), calls
+(1, [('a', 0), ('a', 1), ('a', 2)])
+
+A queue with the discard policy drops the calls for which it has no
+room:
+
+>>> post(q, lambda i, name: calls.append((name, i)), 10, 'b')
+8
+>>> q.size, q.discarded
+(8, 2)
+>>> q.drain()
+8
+
+An exception raised by a callback stops drain(), leaving the calls
+after it queued:
+
+>>> def fail_on_1(i, name):
+...     if i == 1: raise ValueError(name)
+>>> post(q, fail_on_1, 3, 'c')
+3
+>>> try: q.drain()
+... except ValueError as e: print(e)
+... else: print('expected a ValueError')
+c
+>>> q.size
+1
+>>> q.drain()
+1
+
+Threads unknown to Python may post calls; producers wait while the
+queue is full:
+
+>>> q = CallbackQueue(4, overflow_policy.block, 2)
+>>> sorted(drain_threads(q, 3, 100)) == [(str(t), i) for t in range(3) for i in range(100)]
+True
+
+or a dispatcher thread may make the calls:
+
+>>> sorted(dispatch_threads(q, 3, 100)) == [(str(t), i) for t in range(3) for i in range(100)]
+True
+>>> q.running
+False
+'''
+import time
+
+def drain_threads(q, threads, n):
+    from python_callback_ext import post_from_threads
+    calls = []
+    post_from_threads(q, lambda i, name: calls.append((name, i)), threads, n)
+    while len(calls) < threads * n:
+        q.drain()
+    return calls
+
+def dispatch_threads(q, threads, n):
+    from python_callback_ext import post_from_threads
+    calls = []
+    q.start()
+    post_from_threads(q, lambda i, name: calls.append((name, i)), threads, n)
+    while len(calls) < threads * n:
+        time.sleep(0.01)
+    q.stop()
+    return calls
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
@@ -0,0 +1,46 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/converter/registry.hpp>
+#include <boost/python/converter/registrations.hpp>
+
+using namespace boost::python;
+
+struct X {};
+struct Y {};
+
+bool is_registered_X()
+{
+    return converter::registry::query(type_id<X>()) != 0;
+}
+
+bool is_registered_Y()
+{
+    return converter::registry::query(type_id<Y>()) != 0;
+}
+
+// The registration found by lookup doesn't move as the registry grows
+bool lookup_is_stable()
+{
+    converter::registration const* x = &converter::registry::lookup(type_id<X>());
+    converter::registration const* y = &converter::registry::lookup(type_id<Y>());
+    return &converter::registry::lookup(type_id<X>()) == x
+        && converter::registry::query(type_id<Y>()) == y
+        && y->target_type == type_id<Y>();
+}
+
+BOOST_PYTHON_MODULE(registry_statistics_ext)
+{
+    class_<X>("X");
+    def("is_registered_X", is_registered_X);
+    def("is_registered_Y", is_registered_Y);
+    def("lookup_is_stable", lookup_is_stable);
+    def("statistics", converter::registry::statistics);
+}
+
+#include "module_tail.cpp"
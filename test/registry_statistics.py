@@ -0,0 +1,37 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from registry_statistics_ext import *
+>>> is_registered_X(), is_registered_Y()
+(True, False)
+>>> before = statistics()
+>>> lookup_is_stable()
+True
+>>> is_registered_Y()
+True
+>>> after = statistics()
+>>> after['entries'] == before['entries'] + 1
+True
+>>> after['entries'] <= after['buckets']
+True
+>>> after['longest_chain'] >= 1
+True
+>>> if 'lookups' in after:
+...     assert after['lookups'] > before['lookups']
+...     assert after['misses'] == before['misses'] + 1
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
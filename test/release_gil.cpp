@@ -0,0 +1,93 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/module.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/release_gil.hpp>
+#include <boost/python/return_internal_reference.hpp>
+#include <boost/python/return_value_policy.hpp>
+#include <boost/python/manage_new_object.hpp>
+#include <stdexcept>
+#include <string>
+#include <ctime>
+
+using namespace boost::python;
+
+namespace
+{
+  volatile bool signalled = false;
+}
+
+// Waits up to timeout seconds for signal() to be called after it
+// starts, returning whether it was. Unless the GIL is released while
+// it waits, no other Python thread can call signal().
+bool wait_for_signal(int timeout)
+{
+    signalled = false;
+    std::time_t const deadline = std::time(0) + timeout;
+    while (!signalled && std::time(0) < deadline)
+        ;
+    return signalled;
+}
+
+void signal()
+{
+    signalled = true;
+}
+
+std::string repeat(std::string const& s, int n)
+{
+    std::string result;
+    for (int i = 0; i < n; ++i)
+        result += s;
+    return result;
+}
+
+void fail(std::string const& message)
+{
+    throw std::runtime_error(message);
+}
+
+struct Accumulator
+{
+    Accumulator() : total(0) {}
+
+    Accumulator* add(int n)
+    {
+        total += n;
+        return this;
+    }
+
+    Accumulator* copy() const
+    {
+        return new Accumulator(*this);
+    }
+
+    void reset()
+    {
+        total = 0;
+    }
+
+    int total;
+};
+
+BOOST_PYTHON_MODULE(release_gil_ext)
+{
+    def("wait_for_signal", wait_for_signal, release_gil<>());
+    def("signal", signal);
+    def("repeat", repeat, release_gil<>());
+    def("fail", fail, release_gil<>());
+
+    class_<Accumulator>("Accumulator")
+        .def_readonly("total", &Accumulator::total)
+        .def("add", &Accumulator::add
+             , return_internal_reference<1, release_gil<> >())
+        .def("copy", &Accumulator::copy
+             , return_value_policy<manage_new_object, release_gil<> >())
+        .def("reset", &Accumulator::reset, release_gil<>())
+        ;
+}
+
+#include "module_tail.cpp"
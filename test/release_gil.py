@@ -0,0 +1,64 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from release_gil_ext import *
+
+Functions called without the GIL take and return values as usual:
+
+>>> repeat('ab', 3)
+'ababab'
+
+Exceptions are translated once the GIL has been reacquired:
+
+>>> try: fail('no luck')
+... except RuntimeError as e: print(e)
+... else: print('expected a RuntimeError')
+no luck
+
+release_gil<> composes with other call policies:
+
+>>> a = Accumulator()
+>>> a.add(2).add(3).total
+5
+>>> a.total
+5
+>>> b = a.copy()
+>>> b is a, b.total
+(False, 5)
+>>> a.reset()
+>>> a.total, b.total
+(0, 5)
+
+Other threads run while the function waits, so one of them can
+signal it:
+
+>>> wait_for_signal_in_thread(10)
+True
+'''
+import threading
+
+def wait_for_signal_in_thread(timeout):
+    from release_gil_ext import wait_for_signal, signal
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(wait_for_signal(timeout)))
+    waiter.start()
+    while waiter.is_alive():
+        signal()
+        waiter.join(0.01)
+    return result[0]
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
@@ -0,0 +1,141 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/return_value_policy.hpp>
+#include <boost/python/return_awaitable.hpp>
+#include <boost/shared_ptr.hpp>
+#include <pythread.h>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+using namespace boost::python;
+
+// A minimal future: get() blocks until another thread completes it.
+// is_ready() tells whether it has been completed without blocking.
+template <class T>
+class ticket
+{
+    struct state
+    {
+        state() : done(PyThread_allocate_lock()), failed(false)
+        {
+            PyThread_acquire_lock(done, WAIT_LOCK);
+        }
+
+        ~state()
+        {
+            PyThread_free_lock(done);
+        }
+
+        PyThread_type_lock done;
+        T value;
+        bool failed;
+        std::string error;
+    };
+
+ public:
+    ticket() : m_state(new state) {}
+
+    void set_value(T const& value)
+    {
+        m_state->value = value;
+        PyThread_release_lock(m_state->done);
+    }
+
+    void set_error(std::string const& error)
+    {
+        m_state->failed = true;
+        m_state->error = error;
+        PyThread_release_lock(m_state->done);
+    }
+
+    bool is_ready() const
+    {
+        if (!PyThread_acquire_lock(m_state->done, NOWAIT_LOCK))
+            return false;
+        PyThread_release_lock(m_state->done);
+        return true;
+    }
+
+    void wait() const
+    {
+        PyThread_acquire_lock(m_state->done, WAIT_LOCK);
+        PyThread_release_lock(m_state->done);
+    }
+
+    T get() const
+    {
+        wait();
+        if (m_state->failed)
+            throw std::runtime_error(m_state->error);
+        return m_state->value;
+    }
+
+ private:
+    boost::shared_ptr<state> m_state;
+};
+
+namespace
+{
+  struct doubling
+  {
+      ticket<int> t;
+      int x;
+  };
+
+  void double_later(void* arg)
+  {
+      doubling* d = static_cast<doubling*>(arg);
+      d->t.set_value(2 * d->x);
+      delete d;
+  }
+
+  std::vector<std::pair<ticket<std::string>, std::string> > gated;
+}
+
+// Returns a ticket another thread completes with 2 * x.
+ticket<int> twice(int x)
+{
+    doubling* d = new doubling;
+    d->x = x;
+    ticket<int> result = d->t;
+    PyThread_start_new_thread(&double_later, d);
+    return result;
+}
+
+// Returns a ticket completed with s by the next call to open_gate().
+ticket<std::string> behind_gate(std::string const& s)
+{
+    ticket<std::string> result;
+    gated.push_back(std::make_pair(result, s));
+    return result;
+}
+
+void open_gate()
+{
+    for (std::size_t i = 0; i < gated.size(); ++i)
+        gated[i].first.set_value(gated[i].second);
+    gated.clear();
+}
+
+ticket<std::string> failing(std::string const& message)
+{
+    ticket<std::string> result;
+    result.set_error(message);
+    return result;
+}
+
+BOOST_PYTHON_MODULE(return_awaitable_ext)
+{
+    def("twice", twice, return_value_policy<return_awaitable>());
+    def("behind_gate", behind_gate, return_value_policy<return_awaitable>());
+    def("open_gate", open_gate);
+    def("failing", failing, return_value_policy<return_awaitable>());
+}
+
+#include "module_tail.cpp"
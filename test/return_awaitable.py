@@ -0,0 +1,91 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from return_awaitable_ext import *
+>>> import asyncio
+>>> loop = asyncio.new_event_loop()
+>>> asyncio.set_event_loop(loop)
+
+Functions returning C++ futures return asyncio futures of the running
+event loop instead:
+
+>>> async def first():
+...     f = twice(21)
+...     return isinstance(f, asyncio.Future), await f
+>>> loop.run_until_complete(first())
+(True, 42)
+
+Any number of futures is polled by a single thread:
+
+>>> async def many(n):
+...     return await asyncio.gather(*[twice(i) for i in range(n)])
+>>> loop.run_until_complete(many(1000)) == [2 * i for i in range(1000)]
+True
+
+The event loop keeps running while the C++ futures are not ready:
+
+>>> async def gated(s):
+...     f = behind_gate(s)
+...     asyncio.get_event_loop().call_soon(open_gate)
+...     return await f
+>>> loop.run_until_complete(gated('open'))
+'open'
+
+A ready future isn't kept waiting behind futures which are not:
+
+>>> async def overtaking():
+...     slow = [behind_gate(str(i)) for i in range(8)]
+...     fast = await asyncio.wait_for(twice(21), 2.0)
+...     open_gate()
+...     return fast, await asyncio.gather(*slow)
+>>> loop.run_until_complete(overtaking())
+(42, ['0', '1', '2', '3', '4', '5', '6', '7'])
+
+Exceptions thrown by get() are set on the asyncio future:
+
+>>> async def fail():
+...     try: await failing('no luck')
+...     except RuntimeError as e: print(e)
+...     else: print('expected a RuntimeError')
+>>> loop.run_until_complete(fail())
+no luck
+
+Cancelled futures are left alone when the C++ future becomes ready:
+
+>>> async def cancelled():
+...     f = behind_gate('closed')
+...     f.cancel()
+...     open_gate()
+...     await asyncio.sleep(0.1)
+...     return f.cancelled()
+>>> loop.run_until_complete(cancelled())
+True
+
+>>> loop.close()
+>>> asyncio.set_event_loop(None)
+
+With Python 3.7 or later, the functions must be called while an event
+loop is running:
+
+>>> import sys
+>>> try: twice(1)
+... except RuntimeError: pass
+... else:
+...     if sys.version_info >= (3, 7): print('expected a RuntimeError')
+'''
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
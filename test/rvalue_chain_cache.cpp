@@ -0,0 +1,77 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/extract.hpp>
+#include <boost/python/converter/registry.hpp>
+#include <boost/python/converter/rvalue_from_python_data.hpp>
+
+using namespace boost::python;
+
+struct token
+{
+    long value;
+};
+
+template <class Policy>
+struct token_from_python
+{
+    token_from_python(bool type_determined)
+    {
+        converter::registry::insert(
+            &convertible, &construct, type_id<token>(), 0, type_determined);
+    }
+
+    static void* convertible(PyObject* p)
+    {
+        return Policy::convertible(p) ? p : 0;
+    }
+
+    static void construct(PyObject* p, converter::rvalue_from_python_stage1_data* data)
+    {
+        void* storage = (
+            (converter::rvalue_from_python_storage<token>*)data)->storage.bytes;
+        token* t = new (storage) token;
+        t->value = Policy::value(p);
+        data->convertible = storage;
+    }
+};
+
+// Accepts any object with a length, which depends on its type
+struct from_sized
+{
+    static bool convertible(PyObject* p)
+    {
+        PyTypeObject* type = Py_TYPE(p);
+        return (type->tp_as_sequence && type->tp_as_sequence->sq_length)
+            || (type->tp_as_mapping && type->tp_as_mapping->mp_length);
+    }
+    static long value(PyObject* p) { return static_cast<long>(PyObject_Length(p)); }
+};
+
+// Accepts small ints only, which depends on their value
+struct from_small_int
+{
+    static bool convertible(PyObject* p)
+    {
+        extract<long> x(p);
+        return x.check() && x() < 10;
+    }
+    static long value(PyObject* p) { return extract<long>(p); }
+};
+
+long token_value(token t) { return t.value; }
+
+BOOST_PYTHON_MODULE(rvalue_chain_cache_ext)
+{
+    // Tried in the opposite order
+    token_from_python<from_small_int>(false);
+    token_from_python<from_sized>(true);
+
+    def("token_value", token_value);
+}
+
+#include "module_tail.cpp"
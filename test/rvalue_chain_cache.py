@@ -0,0 +1,48 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from rvalue_chain_cache_ext import *
+>>> token_value('abc'), token_value('abc'), token_value('')
+(3, 3, 0)
+
+Converters which look at values are still asked
+
+>>> token_value(3), token_value(4)
+(3, 4)
+>>> try: token_value(30)
+... except TypeError: pass
+... else: raise AssertionError('expected a TypeError')
+>>> token_value(5)
+5
+
+Modifying a type can change which converters accept it
+
+>>> class F(object): pass
+>>> f = F()
+>>> for i in range(3):
+...     try: token_value(f)
+...     except TypeError: pass
+...     else: raise AssertionError('expected a TypeError')
+>>> F.__len__ = lambda self: 20
+>>> token_value(f), token_value(f), token_value([1, 2])
+(20, 20, 2)
+>>> del F.__len__
+>>> try: token_value(f)
+... except TypeError: pass
+... else: raise AssertionError('expected a TypeError')
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
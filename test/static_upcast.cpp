@@ -0,0 +1,55 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/manage_new_object.hpp>
+#include <boost/python/return_value_policy.hpp>
+#include <boost/python/object/inheritance_query.hpp>
+
+using namespace boost::python;
+
+struct A { A() : a('a') {} virtual ~A() {} char a; };
+struct B { B() : b('b') {} char b; };
+struct C : B, A { C() : c('c') {} char c; };
+struct D : C { D() : d('d') {} char d; };
+
+// Cross casts and virtual bases still need the graph
+struct V { V() : v('v') {} virtual ~V() {} char v; };
+struct E : virtual V { E() : e('e') {} char e; };
+struct F : A, E {};
+
+char get_a(A const& x) { return x.a; }
+char get_b(B const& x) { return x.b; }
+char get_c(C const& x) { return x.c; }
+char get_d(D const& x) { return x.d; }
+char get_v(V const& x) { return x.v; }
+char get_e(E const& x) { return x.e; }
+
+A* make_f() { return new F; }
+
+BOOST_PYTHON_MODULE(static_upcast_ext)
+{
+    class_<A>("A");
+    class_<B>("B");
+    class_<C, bases<B, A> >("C");
+    class_<D, bases<C> >("D");
+    class_<V>("V");
+    class_<E, bases<V> >("E");
+    class_<F, bases<A, E> >("F");
+
+    def("get_a", get_a);
+    def("get_b", get_b);
+    def("get_c", get_c);
+    def("get_d", get_d);
+    def("get_v", get_v);
+    def("get_e", get_e);
+    def("make_f", make_f, return_value_policy<manage_new_object>());
+    def("statistics", objects::cast_cache_statistics);
+    def("finalize_class_graph", objects::finalize_class_graph);
+}
+
+#include "module_tail.cpp"
@@ -0,0 +1,52 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from static_upcast_ext import *
+
+Chains of non-virtual bases are recorded as constant offsets
+
+>>> statistics()['static_paths'] >= 6
+True
+>>> d = D()
+>>> get_a(d), get_b(d), get_c(d), get_d(d)
+('a', 'b', 'c', 'd')
+>>> c = C()
+>>> get_a(c), get_b(c), get_c(c)
+('a', 'b', 'c')
+
+Virtual bases and cross casts go through the graph
+
+>>> f = F()
+>>> get_a(f), get_e(f), get_v(f)
+('a', 'e', 'v')
+>>> f = make_f()
+>>> get_a(f), get_e(f), get_v(f)
+('a', 'e', 'v')
+
+The search can be prepared for all classes at once
+
+>>> info = finalize_class_graph()
+>>> info['classes'] >= 7
+True
+>>> info['distance_bytes'] >= 2 * info['classes'] ** 2
+True
+>>> statistics()['graph_frozen']
+True
+>>> get_v(F())
+'v'
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
@@ -0,0 +1,44 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/utility/string_ref.hpp>
+#include <boost/cstdint.hpp>
+#include <string>
+#include <cstring>
+
+using namespace boost::python;
+
+std::size_t string_length(std::string const& s) { return s.size(); }
+std::string string_copy(std::string const& s) { return s; }
+
+std::size_t ref_length(boost::string_ref s) { return s.size(); }
+std::string ref_copy(boost::string_ref s) { return std::string(s.data(), s.size()); }
+
+// Both arguments refer to the same characters unless one was copied
+bool same_characters(boost::string_ref s, char const* c)
+{
+    return s.data() == c;
+}
+
+boost::uintptr_t ref_address(boost::string_ref s)
+{
+    return reinterpret_cast<boost::uintptr_t>(s.data());
+}
+
+std::size_t cstring_length(char const* s) { return std::strlen(s); }
+
+BOOST_PYTHON_MODULE(string_ref_ext)
+{
+    def("string_length", string_length);
+    def("string_copy", string_copy);
+    def("ref_length", ref_length);
+    def("ref_copy", ref_copy);
+    def("same_characters", same_characters);
+    def("ref_address", ref_address);
+    def("cstring_length", cstring_length);
+}
+
+#include "module_tail.cpp"
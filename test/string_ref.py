@@ -0,0 +1,59 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from string_ref_ext import *
+
+Strings convert to std::string as before:
+
+>>> string_length('hello'), string_copy('hello')
+(5, 'hello')
+>>> string_copy('caf\\xe9') == 'caf\\xe9'
+True
+>>> string_copy('a\\0b') == 'a\\0b'
+True
+
+boost::string_ref refers to the characters of the string:
+
+>>> ref_length('hello'), ref_copy('hello')
+(5, 'hello')
+>>> ref_length(''), ref_copy('')
+(0, '')
+>>> ref_copy('caf\\xe9') == 'caf\\xe9'
+True
+>>> ref_copy('a\\0b') == 'a\\0b'
+True
+
+Nothing is copied, so a string_ref and a char const* taken from the
+same string point at the same characters:
+
+>>> s = 'key' * 10
+>>> same_characters(s, s)
+True
+>>> ref_address(s) == ref_address(s)
+True
+>>> cstring_length(s)
+30
+
+Other objects aren't strings:
+
+>>> for x in (1, None, ['a']):
+...     try: ref_length(x)
+...     except TypeError: pass
+...     else: raise AssertionError('expected a TypeError')
+'''
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+    
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
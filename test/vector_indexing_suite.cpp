@@ -26,6 +26,24 @@ std::string x_value(X const& x)
     return "gotya " + x.s;
 }
 
+struct Point // a POD container element
+{
+    int x, y;
+};
+
+bool operator==(Point const& a, Point const& b)
+{
+    return a.x == b.x && a.y == b.y;
+}
+
+Point make_point(int x, int y)
+{
+    Point p = { x, y };
+    return p;
+}
+
+int point_x(Point const& p) { return p.x; }
+
 BOOST_PYTHON_MODULE(vector_indexing_suite_ext)
 {    
     class_<X>("X")
@@ -42,6 +60,7 @@ BOOST_PYTHON_MODULE(vector_indexing_suite_ext)
     
     class_<std::vector<X> >("XVec")
         .def(vector_indexing_suite<std::vector<X> >())
+        .def(vector_search_methods<std::vector<X> >())
     ;
         
     // Compile check only...
@@ -53,10 +72,31 @@ BOOST_PYTHON_MODULE(vector_indexing_suite_ext)
     class_<std::vector<bool> >("BoolVec")
         .def(vector_indexing_suite<std::vector<bool> >())
     ;
+
+    // Compile check only: elements without operator<
+    class_<std::vector<std::vector<X> > >("XVecVec")
+        .def(vector_indexing_suite<std::vector<std::vector<X> > >())
+    ;
     
     // vector of strings
     class_<std::vector<std::string> >("StringVec")
         .def(vector_indexing_suite<std::vector<std::string> >())
     ;
+
+    // vectors exporting their elements as buffers
+    class_<std::vector<double> >("DoubleVec")
+        .def(vector_indexing_suite<std::vector<double> >(true))
+        .def(vector_search_methods<std::vector<double> >())
+    ;
+
+    class_<Point>("Point", no_init)
+        .add_property("x", point_x)
+    ;
+    def("make_point", make_point);
+
+    class_<std::vector<Point> >("PointVec")
+        .def(vector_indexing_suite<std::vector<Point>, true>(true))
+        .def(vector_search_methods<std::vector<Point>, true>())
+    ;
 }
 
@@ -342,6 +342,223 @@ e
 >>> print sv[0]
 a
 
+#####################################################################
+# Buffers of the element type are copied at once
+#####################################################################
+>>> import array
+>>> fv = FloatVec()
+>>> fv.extend(array.array('f', [1, 2, 3]))
+>>> list(fv)
+[1.0, 2.0, 3.0]
+>>> fv[1:2] = array.array('f', [5, 6])
+>>> list(fv)
+[1.0, 5.0, 6.0, 3.0]
+>>> fv.extend(array.array('d', [7])) # other element types are converted
+>>> fv.extend((8, 9.5))
+>>> list(fv)
+[1.0, 5.0, 6.0, 3.0, 7.0, 8.0, 9.5]
+>>> fv[:] = array.array('f')
+>>> len(fv)
+0
+
+#####################################################################
+# Vectors may export their elements as buffers
+#####################################################################
+>>> dv = DoubleVec()
+>>> dv.extend([1, 2, 3])
+>>> m = memoryview(dv)
+>>> m.format, m.itemsize, m.shape, m.readonly
+('d', 8, (3,), False)
+>>> m[1] = 5
+>>> list(dv)
+[1.0, 5.0, 3.0]
+>>> dv[2] = 7
+>>> m.tolist()
+[1.0, 5.0, 7.0]
+
+# which pins them until the views are released
+>>> for resize in (lambda: dv.append(4), lambda: dv.extend([4]),
+...                lambda: dv.__delitem__(0), lambda: dv.__delitem__(slice(0, 2)),
+...                lambda: dv.__setitem__(slice(0, 1), [8, 9])):
+...     try: resize()
+...     except BufferError: pass
+...     else: print('expected a BufferError')
+>>> dv[0:1] = [8]
+>>> del dv[1:1]
+>>> m2 = memoryview(dv)
+>>> m.release()
+>>> dv.append(4)
+Traceback (most recent call last):
+...
+BufferError: Existing exports of data: object cannot be re-sized
+>>> m2.release()
+>>> dv.append(4)
+>>> list(dv)
+[8.0, 5.0, 7.0, 4.0]
+
+# vectors may be extended by themselves
+>>> dv.extend(dv)
+>>> dv[1:2] = dv
+>>> list(dv)
+[8.0, 8.0, 5.0, 7.0, 4.0, 8.0, 5.0, 7.0, 4.0, 7.0, 4.0, 8.0, 5.0, 7.0, 4.0]
+>>> len(memoryview(DoubleVec()))
+0
+
+# other POD elements are exported as bytes
+>>> pv = PointVec()
+>>> pv.append(make_point(1, 2))
+>>> pv.append(make_point(3, 4))
+>>> m = memoryview(pv)
+>>> m.itemsize == len(m.tobytes()) // 2 == int(m.format[:-1]), m.format[-1]
+(True, 's')
+>>> m.release()
+>>> pv.extend(pv)
+>>> [p.x for p in pv]
+[1, 3, 1, 3]
+
+# unless they are not stored in place
+>>> memoryview(FloatVec())
+Traceback (most recent call last):
+...
+TypeError: memoryview: a bytes-like object is required, not 'FloatVec'
+
+#####################################################################
+# Stepped slices and index arrays
+#####################################################################
+>>> dv[:] = range(10)
+>>> r = dv[::3]
+>>> type(r).__name__, list(r)
+('DoubleVec', [0.0, 3.0, 6.0, 9.0])
+>>> list(dv[::-4]), list(dv[7:2:-2])
+([9.0, 5.0, 1.0], [7.0, 5.0, 3.0])
+>>> list(dv[[1, -1, 1]]), list(dv[(2,)]), list(dv[[]])
+([1.0, 9.0, 1.0], [2.0], [])
+>>> list(dv[array.array('l', [4, 0])])
+[4.0, 0.0]
+>>> mask = [i % 4 == 0 for i in range(10)]
+>>> list(dv[mask]), list(dv[memoryview(bytes(mask)).cast('?')])
+([0.0, 4.0, 8.0], [0.0, 4.0, 8.0])
+>>> dv[[10]]
+Traceback (most recent call last):
+...
+IndexError: Index out of range
+>>> dv[[True, False]]
+Traceback (most recent call last):
+...
+IndexError: Boolean index does not match the length of the container
+>>> dv[['a']]
+Traceback (most recent call last):
+...
+TypeError: Invalid index type
+
+>>> dv[::2] = [10, 12, 14, 16, 18]
+>>> dv[[1, 3]] = -1
+>>> dv[mask] = array.array('d', [20, 24, 28])
+>>> list(dv)
+[20.0, -1.0, 12.0, -1.0, 24.0, 5.0, 16.0, 7.0, 28.0, 9.0]
+>>> dv[1::2] = [1, 2]
+Traceback (most recent call last):
+...
+ValueError: attempt to assign sequence of size 2 to an index array or extended slice of size 5
+
+>>> del dv[::3]
+>>> list(dv)
+[-1.0, 12.0, 24.0, 5.0, 7.0, 28.0]
+>>> del dv[[0, -1, 0]]
+>>> del dv[[False, True, False, True]]
+>>> list(dv)
+[12.0, 5.0]
+
+# elements removed are detached from their proxies, others follow
+# their elements
+>>> v[:] = ['a','b','c','d','e','f']
+>>> z0, z2, z5 = v[0], v[2], v[5]
+>>> del v[[1, 2, 3]]
+>>> print_xvec(v)
+[ a e f ]
+>>> print_xvec(v[[2, 0]])
+[ f a ]
+>>> z0.reset(); z2.reset(); z5.foo()
+>>> print_xvec(v)
+[ reset e foo ]
+>>> v[::2] = X('z')
+>>> print_xvec(v)
+[ z e z ]
+
+#####################################################################
+# Sorting and searching
+#####################################################################
+>>> dv[:] = [3, 1, 2, 5, 1]
+>>> dv.sort()
+>>> list(dv)
+[1.0, 1.0, 2.0, 3.0, 5.0]
+>>> dv.bisect_left(1), dv.bisect_right(1), dv.bisect_left(4), dv.bisect_right(9)
+(0, 2, 4, 5)
+>>> dv.bisect_left(2.5), dv.bisect_left(True)
+(3, 0)
+>>> dv.index(2), dv.count(1), dv.count(4), dv.count('a')
+(2, 2, 0, 0)
+>>> dv.index(4)
+Traceback (most recent call last):
+...
+ValueError: vector.index(x): x not in vector
+>>> dv.sort(reverse=True)
+>>> list(dv)
+[5.0, 3.0, 2.0, 1.0, 1.0]
+
+# a key is called once per element
+>>> calls = []
+>>> def key(x):
+...     calls.append(x)
+...     return -(x - 2) ** 2
+>>> dv.sort(key=key)
+>>> list(dv), len(calls)
+([5.0, 3.0, 1.0, 1.0, 2.0], 5)
+>>> dv.sort(key=abs, reverse=True)
+>>> list(dv)
+[5.0, 3.0, 2.0, 1.0, 1.0]
+
+# elements without operator< are compared in Python, and sorting
+# detaches their proxies
+>>> v[:] = ['c', 'a', 'b']
+>>> z0 = v[0]
+>>> v.sort(key=x_value)
+>>> print_xvec(v)
+[ a b c ]
+>>> z0.reset()
+>>> print_xvec(v), z0
+[ a b c ]
+(None, reset)
+>>> v.index('b'), v.count('c'), v.count(1)
+(1, 1, 0)
+>>> v.sort()
+Traceback (most recent call last):
+...
+TypeError: '<' not supported between instances of 'X' and 'X'
+>>> pv.sort(key=lambda p: -p.x)
+>>> [p.x for p in pv]
+[3, 3, 1, 1]
+>>> pv.bisect_left(make_point(0, 0))
+Traceback (most recent call last):
+...
+TypeError: '<' not supported between instances of 'Point' and 'Point'
+
+#####################################################################
+# Many proxies follow their elements through deletions and
+# slice assignments
+#####################################################################
+>>> v[:] = [str(i) for i in range(1000)]
+>>> proxies = [v[i] for i in range(0, 1000, 3)]
+>>> del v[100:200]
+>>> v[10:20] = ['x', 'y']
+>>> del v[500]
+>>> del proxies[::2]
+>>> v[600:600] = ['z'] * 50
+>>> [x_value(p) for p in proxies] == ['gotya %d' % i for i in range(3, 1000, 6)]
+True
+>>> v[700] is v[700]
+True
+
 #####################################################################
 # END.... 
 #####################################################################
@@ -0,0 +1,51 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/args.hpp>
+#include <boost/python/tuple.hpp>
+#include <boost/python/return_arg.hpp>
+#include <string>
+
+using namespace boost::python;
+
+tuple describe(int a, double b, std::string const& c)
+{
+    return boost::python::make_tuple(a, b, c);
+}
+
+std::string pick_int(int) { return "int"; }
+std::string pick_int_str(int, std::string const&) { return "int, str"; }
+std::string pick_str(std::string const&) { return "str"; }
+
+struct counter
+{
+    counter() : total(0) {}
+    
+    void add(int x, int times)
+    {
+        total += x * times;
+    }
+    
+    int total;
+};
+
+BOOST_PYTHON_MODULE(vectorcall_ext)
+{
+    def("describe", describe, (arg("a"), arg("b") = 2.5, arg("c") = "c"));
+
+    def("pick", pick_int, (arg("x")));
+    def("pick", pick_int_str, (arg("x"), arg("s")));
+    def("pick", pick_str, (arg("s")));
+
+    class_<counter>("counter")
+        .def("add", &counter::add, (arg("x"), arg("times") = 1), return_self<>())
+        .def_readonly("total", &counter::total)
+        ;
+}
+
+#include "module_tail.cpp"
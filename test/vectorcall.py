@@ -0,0 +1,64 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+"""
+>>> from vectorcall_ext import *
+
+Keyword arguments and default values are bound alike whether a function
+is called with an argument tuple and dict or with an array of arguments
+and a tuple of keyword names:
+
+>>> describe(1)
+(1, 2.5, 'c')
+>>> describe(1, 3.5)
+(1, 3.5, 'c')
+>>> describe(1, c='z')
+(1, 2.5, 'z')
+>>> describe(c='z', a=2, b=0.5)
+(2, 0.5, 'z')
+>>> describe(*(1,), **{'c': 'z'})
+(1, 2.5, 'z')
+>>> describe.__call__(1, c='z')
+(1, 2.5, 'z')
+
+>>> for i in range(2):
+...     [pick(1), pick(x=1), pick(1, 'a'), pick(1, s='a'), pick('a'), pick(s='a')]
+['int', 'int', 'int, str', 'int, str', 'str', 'str']
+['int', 'int', 'int, str', 'int, str', 'str', 'str']
+
+>>> try: describe(1, a=2)
+... except TypeError: pass
+... else: print('expected a TypeError')
+>>> try: describe(1, d=2)
+... except TypeError: pass
+... else: print('expected a TypeError')
+>>> try: describe(b=2)
+... except TypeError: pass
+... else: print('expected a TypeError')
+
+Bound methods pass self in front of the other arguments; call policies
+still see every argument:
+
+>>> c = counter()
+>>> c.add(2) is c
+True
+>>> c.add(3, times=2).add(x=1).total
+9
+>>> add = c.add
+>>> add(times=3, x=1).total
+12
+"""
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)
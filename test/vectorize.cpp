@@ -0,0 +1,43 @@
+// Copyright agent 2026.
+// Distributed under the Boost Software License, Version 1.0. (See
+// accompanying file LICENSE_1_0.txt or copy at
+// http://www.boost.org/LICENSE_1_0.txt)
+#include <boost/python/vectorize.hpp>
+#include <boost/python/module.hpp>
+#include <boost/python/def.hpp>
+#include <stdexcept>
+#include <cmath>
+
+using namespace boost::python;
+
+double hypotenuse(double x, double y)
+{
+    return std::sqrt(x * x + y * y);
+}
+
+int clamp(int x, int low, int high)
+{
+    return x < low ? low : x > high ? high : x;
+}
+
+bool is_odd(long x)
+{
+    return x % 2 != 0;
+}
+
+double checked_log(double x)
+{
+    if (x <= 0)
+        throw std::domain_error("logarithm of a non-positive number");
+    return std::log(x);
+}
+
+BOOST_PYTHON_MODULE(vectorize_ext)
+{
+    def_vectorized("hypotenuse", &hypotenuse);
+    def_vectorized("clamp", &clamp, "clamps x to [low, high]");
+    def_vectorized("is_odd", &is_odd);
+    def_vectorized("checked_log", &checked_log);
+}
+
+#include "module_tail.cpp"
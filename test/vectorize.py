@@ -0,0 +1,93 @@
+# Copyright agent 2026.
+# Distributed under the Boost Software License, Version 1.0. (See accompanying
+# file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+'''
+>>> from vectorize_ext import *
+>>> from array import array
+
+Called with scalars, a vectorized function behaves as the function
+wrapped by def():
+
+>>> hypotenuse(3, 4)
+5.0
+>>> clamp(7, 0, 5), is_odd(3)
+(5, True)
+>>> try: hypotenuse('3', 4)
+... except TypeError as e: print(e)
+... else: print('expected a TypeError')
+Python argument types in
+    vectorize_ext.hypotenuse(str, int)
+did not match C++ signature:
+    hypotenuse(double, double)
+>>> print(clamp.__doc__.strip())
+clamp( (int)arg1, (int)arg2, (int)arg3) -> int :
+    clamps x to [low, high]
+<BLANKLINE>
+    C++ signature :
+        int clamp(int,int,int)
+
+Called with arrays, it is applied to each element, returning a new
+array:
+
+>>> r = hypotenuse(array('d', [3, 5, 8]), array('d', [4, 12, 15]))
+>>> type(r) is memoryview, r.format, r.shape, r.readonly
+(True, 'd', (3,), False)
+>>> r.tolist()
+[5.0, 13.0, 17.0]
+
+Scalars and arrays are broadcast against each other as NumPy does:
+
+>>> hypotenuse(array('d', [0, 3]), 4).tolist()
+[4.0, 5.0]
+>>> m = memoryview(array('i', range(6))).cast('B').cast('i', (2, 3))
+>>> clamp(m, 1, array('i', [2, 3, 4])).tolist()
+[[1, 1, 2], [2, 3, 4]]
+>>> column = memoryview(array('d', [3, 6])).cast('B').cast('d', (2, 1))
+>>> hypotenuse(column, array('d', [4, 8])).tolist()
+[[5.0, 8.54400374531753], [7.211102550927978, 10.0]]
+>>> try: hypotenuse(array('d', [1, 2]), array('d', [1, 2, 3]))
+... except ValueError as e: print(e)
+... else: print('expected a ValueError')
+operands could not be broadcast together
+
+Elements of other arithmetic types are converted, following strides:
+
+>>> is_odd(array('h', range(5))).tolist()
+[False, True, False, True, False]
+>>> hypotenuse(array('f', [3, 0, 5]), memoryview(array('l', [0, 12, 0, 1, 0, 4]))[::-2]).tolist()
+[5.0, 1.0, 13.0]
+>>> hypotenuse(array('d'), 1).tolist()
+[]
+>>> try: hypotenuse(array('u', 'ab'), 1)
+... except TypeError as e: print(e)
+... else: print('expected a TypeError')
+can't apply a vectorized function to elements of format 'w'
+
+C++ exceptions are translated, also for large arrays, whose elements
+are computed without the GIL:
+
+>>> big = array('d', range(1, 10001))
+>>> r = checked_log(big)
+>>> len(r), r[0], abs(r[9999] - 9.2103) < 1e-4
+(10000, 0.0, True)
+>>> big[5000] = 0
+>>> try: checked_log(big)
+... except RuntimeError as e: print(e)
+... else: print('expected a RuntimeError')
+logarithm of a non-positive number
+'''
+
+def run(args = None):
+    import sys
+    import doctest
+
+    if args is not None:
+        sys.argv = args
+    return doctest.testmod(sys.modules.get(__name__))
+    
+if __name__ == '__main__':
+    print "running..."
+    import sys
+    status = run()[0]
+    if (status == 0): print "Done."
+    sys.exit(status)